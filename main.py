@@ -1,3 +1,13 @@
+from dotenv import load_dotenv
+
+# .env는 import 시점에 설정을 읽는 모듈(profiler, page_registry, geo_assets 등)보다 먼저 적재
+load_dotenv()
+
+from src.utils import profiler
+
+# APP_PROFILE=1 이면 이후 import 시간부터 기록
+profiler.install()
+
 import streamlit as st
 from src.utils.styles import load_css
 from src.components.navigation_bar import render_navigation_bar
@@ -22,25 +32,15 @@ import sys
 root_path = Path(__file__).parent
 sys.path.insert(0, str(root_path))
 
-if st.session_state.current_page == '통계 및 현황':
-  statistics_path = root_path / 'pages' / 'statistics.py'
-  if statistics_path.exists():
-    with open(statistics_path, 'r', encoding='utf-8') as f:
-      code = f.read()
-      exec(code)
-  else:
-    st.info('통계 및 현황 페이지를 준비 중입니다.')
-
-elif st.session_state.current_page == '차량 비교':
-  compare_path = root_path / 'pages' / 'compare.py'
-  if compare_path.exists():
-    with open(compare_path, 'r', encoding='utf-8') as f:
-      code = f.read()
-      exec(code)
-  else:
-    st.info('차량 비교 페이지를 준비 중입니다.')
-    
-elif st.session_state.current_page == 'FAQ':
-  with open(root_path / 'pages' / 'faq.py', 'r', encoding='utf-8') as f:
-    code = f.read()
-    exec(code)
\ No newline at end of file
+from src.utils.page_registry import get_page_registry
+
+# 페이지 소스는 한 번만 컴파일해 재사용 (APP_DEV_MODE=1이면 파일 변경 시 다시 컴파일)
+pages = get_page_registry(root_path / 'pages')
+pages.register('통계 및 현황', 'statistics.py', '통계 및 현황 페이지를 준비 중입니다.')
+pages.register('차량 비교', 'compare.py', '차량 비교 페이지를 준비 중입니다.')
+pages.register('FAQ', 'faq.py')
+
+pages.render(st.session_state.current_page)
+
+# APP_PROFILE=1 이면 import/렌더링 시간 표시
+profiler.render_report()
@@ -41,20 +41,17 @@ def normalize_answer(text: str) -> str:
 # ----------------------------------------
 @st.cache_data(ttl=60)
 def fetch_categories_from_db():
-    db = DBManager()
-    if not db.connect():
-        return []
-
+    query = """
+        SELECT category_code, category_name
+        FROM faq_category_tbl
+        ORDER BY category_code DESC
+    """
     try:
-        cursor = db.get_cursor()
-        cursor.execute("""
-            SELECT category_code, category_name
-            FROM faq_category_tbl
-            ORDER BY category_code DESC 
-        """)
-        return cursor.fetchall()
-    finally:
-        db.close()
+        with DBManager().session() as s:
+            return s.fetch_all(query)
+    except Exception as e:
+        print(f"[FAQ] 카테고리 조회 실패 ❌: {e}")
+        return []
 
 
 @st.cache_data(ttl=60)
@@ -62,31 +59,26 @@ def fetch_faqs_from_db_by_category_name(category_name: str):
     """
     returns: [{"question":..., "answer":..., "url":...}, ...]
     """
-    db = DBManager()
-    if not db.connect():
-        return []
-
+    query = """
+        SELECT f.question, f.answer, f.source_url AS url
+        FROM faq_tbl f
+        JOIN faq_category_tbl c ON f.category_code = c.category_code
+        WHERE c.category_name = %s
+        ORDER BY f.faq_id DESC
+    """
     try:
-        cursor = db.get_cursor()
-        query = """
-            SELECT f.question, f.answer, f.source_url
-            FROM faq_tbl f
-            JOIN faq_category_tbl c ON f.category_code = c.category_code
-            WHERE c.category_name = %s
-            ORDER BY f.faq_id DESC
-        """
-        cursor.execute(query, (category_name,))
-        rows = cursor.fetchall()
-        return [{"question": q, "answer": a, "url": u} for (q, a, u) in rows]
-    finally:
-        db.close()
+        with DBManager().session() as s:
+            return s.fetch_all(query, (category_name,))
+    except Exception as e:
+        print(f"[FAQ] FAQ 조회 실패 ❌: {e}")
+        return []
 
 
 # ----------------------------------------
 # 카테고리/FAQ 로딩
 # ----------------------------------------
 categories_rows = fetch_categories_from_db()
-CATEGORIES = [row[1] for row in categories_rows] if categories_rows else []
+CATEGORIES = [row["category_name"] for row in categories_rows] if categories_rows else []
 
 st.markdown("""
 <h1 class="page-title text-center">
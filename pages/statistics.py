@@ -10,8 +10,8 @@ from src.components.charts import render_registration_trend_chart, render_mainte
 
 # TODO: DB 연동 시 services 폴더에서 데이터 가져오도록 수정
 from src.utils.data import (
-    REGISTRATION_TREND_DATA,
     MAINTENANCE_COST_DATA,
+    get_registration_trend_data,
     get_paldo_charging_data,
     get_paldo_ratio_data,
 )
@@ -64,10 +64,12 @@ filter_type = st.session_state.map_filter
 if filter_type == "charging":
     card_title = "전국 전기차 충전소 현황"
     legend_text = "충전소 수"
+    map_mode = "bubble"
     df = get_paldo_charging_data()
 else:
     card_title = "전국 전기 화물차 비중"
     legend_text = "화물차 비중"
+    map_mode = "choropleth"  # 비중(%)은 권역 면 색으로 표시
     df = get_paldo_ratio_data()
 
 # 지도 컨테이너
@@ -84,7 +86,7 @@ with st.container(key="map_container"):
     """, unsafe_allow_html=True)
     
     # 지도 렌더링
-    render_map_section(df, filter_type)
+    render_map_section(df, filter_type, mode=map_mode)
 
 
 registration_col, maintenance_col = st.columns(2)
@@ -101,7 +103,7 @@ with registration_col:
         </div>
         """, unsafe_allow_html=True)
 
-        fig_trend = render_registration_trend_chart(REGISTRATION_TREND_DATA)
+        fig_trend = render_registration_trend_chart(get_registration_trend_data())
         st.plotly_chart(fig_trend, use_container_width=True, config={'displayModeBar': False})
 
 # ========================================
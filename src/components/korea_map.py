@@ -1,178 +1,46 @@
 import streamlit as st
 import plotly.graph_objects as go
 import pandas as pd
-import requests
+import hashlib
 import json
 from pathlib import Path
 
-# ========== GeoJSON 캐시 경로 ==========
-GEOJSON_CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "geojson"
-GEOJSON_CACHE_FILE = GEOJSON_CACHE_DIR / "korea_provinces_simplified.json"
-GEOJSON_PROVINCES_BOUNDARY_CACHE_FILE = GEOJSON_CACHE_DIR / "korea_provinces_boundaries_simplified.json"
+from src.utils.geo_assets import empty_geojson, geometry_checksum, load_geometry, read_manifest
 
-# 디테일 조절
-OUTLINE_MAX_POINTS = 260
-PROVINCE_MAX_POINTS = 90
+# ========== 캐시 경로 ==========
+MAP_TEMPLATE_DIR = Path(__file__).parent.parent.parent / "data" / "cache" / "map"
 
+# 정적 레이어 구성이 바뀌면 올려서 디스크 템플릿 다시 생성
+MAP_TEMPLATE_VERSION = 1
+# 버블 템플릿 trace 순서: 시도 면, 경계선, 버블, 버블 라벨
+BUBBLE_TRACE = 2
+TEXT_TRACE = 3
+# 코로플레스 템플릿 trace 순서: 권역 면, 권역 라벨
+CHOROPLETH_TRACE = 0
+LABEL_TRACE = 1
 
-# ========== GeoJSON 단순화 함수 ==========
-def _simplify_coordinates(coords, max_points=15):
-    if len(coords) <= max_points:
-        return coords
-    
-    step = max(1, len(coords) // max_points)
-    simplified = coords[::step]
-    
-    if simplified[0] != simplified[-1]:
-        simplified.append(simplified[0])
-    
-    return simplified
+# 코로플레스 라벨 위치 보정 (lon, lat) - 경기 중심점이 서울과 겹쳐 남쪽으로 이동
+CHOROPLETH_LABEL_OFFSETS = {"경기": (0.05, -0.35)}
 
 
-def _simplify_geojson(geojson):
-    simplified = {
-        "type": geojson["type"],
-        "features": []
-    }
-    
-    for feature in geojson["features"]:
-        geometry = feature["geometry"]
-        geom_type = geometry.get("type")
-        coords = geometry.get("coordinates")
-        
-        if geom_type == "Polygon":
-            simplified_coords = [_simplify_coordinates(ring, max_points=15) for ring in coords]
-        elif geom_type == "MultiPolygon":
-            simplified_coords = [
-                [_simplify_coordinates(ring, max_points=15) for ring in polygon]
-                for polygon in coords
-            ]
-        else:
-            simplified_coords = coords
-        
-        simplified["features"].append({
-            "type": "Feature",
-            "properties": feature["properties"],
-            "geometry": {"type": geom_type, "coordinates": simplified_coords}
-        })
-    
-    return simplified
+# ========== GeoJSON 로드 ==========
+# 빌드된 자산(data/geojson)만 읽음 - 자산은 python -m src.scripts.build_geo_assets 로 생성
+@st.cache_resource
+def load_geo_asset(name):
+    """자산 로드 (프로세스당 1회, MAP_GEOMETRY_FORMAT 형식, 없거나 체크섬이 다르면 빈 FeatureCollection)"""
+    return load_geometry(name) or empty_geojson()
 
 
-# ========== GeoJSON 로드 ==========
-@st.cache_data(ttl=86400)
 def load_korea_geojson():
-    if GEOJSON_CACHE_FILE.exists():
-        with open(GEOJSON_CACHE_FILE, "r", encoding="utf-8") as f:
-            cached = json.load(f)
-            if "features" in cached and len(cached["features"]) == 1:
-                return cached
-    
-    # 캐시된 파일 없을 시 다운로드
-    url = "https://raw.githubusercontent.com/southkorea/southkorea-maps/master/kostat/2018/json/skorea-provinces-2018-geo.json"
-    response = requests.get(url, timeout=10)
-    geojson = response.json()
-    
-    # 시도 통합
-    all_exterior_coords = []
-    
-    for feature in geojson["features"]:
-        geometry = feature["geometry"]
-        geom_type = geometry.get("type")
-        coords = geometry.get("coordinates")
-        
-        if geom_type == "Polygon":
-            if coords and len(coords) > 0:
-                all_exterior_coords.append(coords[0])
-        elif geom_type == "MultiPolygon":
-            for polygon in coords:
-                if polygon and len(polygon) > 0:
-                    all_exterior_coords.append(polygon[0])
-    
-    if all_exterior_coords:
-        main_outline = max(all_exterior_coords, key=len)
-        simplified_outline = _simplify_coordinates(main_outline, max_points=OUTLINE_MAX_POINTS)
-        
-        merged_geojson = {
-            "type": "FeatureCollection",
-            "features": [{
-                "type": "Feature",
-                "properties": {"name": "South Korea"},
-                "geometry": {
-                    "type": "Polygon",
-                    "coordinates": [simplified_outline]
-                }
-            }]
-        }
-    else:
-        merged_geojson = _simplify_geojson(geojson)
-    
-    GEOJSON_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    with open(GEOJSON_CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump(merged_geojson, f, ensure_ascii=False)
-    
-    return merged_geojson
+    return load_geo_asset("outline")
 
 
-@st.cache_data(ttl=86400)
 def load_korea_provinces_geojson():
-    if GEOJSON_PROVINCES_BOUNDARY_CACHE_FILE.exists():
-        with open(GEOJSON_PROVINCES_BOUNDARY_CACHE_FILE, "r", encoding="utf-8") as f:
-            cached = json.load(f)
-            meta = cached.get("_meta", {})
-            if (
-                "features" in cached
-                and len(cached["features"]) >= 8
-                and meta.get("province_max_points") == PROVINCE_MAX_POINTS
-            ):
-                return cached
-
-    url = "https://raw.githubusercontent.com/southkorea/southkorea-maps/master/kostat/2018/json/skorea-provinces-2018-geo.json"
-    response = requests.get(url, timeout=10)
-    geojson = response.json()
-
-    # 좌표 단순화
-    simplified = {
-        "type": geojson.get("type", "FeatureCollection"),
-        "_meta": {"province_max_points": PROVINCE_MAX_POINTS},
-        "features": [],
-    }
-
-    for idx, feature in enumerate(geojson.get("features", [])):
-        geometry = feature.get("geometry", {})
-        geom_type = geometry.get("type")
-        coords = geometry.get("coordinates")
-
-        if not coords:
-            continue
-
-        if geom_type == "Polygon":
-            simplified_coords = [_simplify_coordinates(ring, max_points=PROVINCE_MAX_POINTS) for ring in coords]
-        elif geom_type == "MultiPolygon":
-            simplified_coords = [
-                [_simplify_coordinates(ring, max_points=PROVINCE_MAX_POINTS) for ring in polygon]
-                for polygon in coords
-            ]
-        else:
-            simplified_coords = coords
-
-        props = dict(feature.get("properties", {}) or {})
-        # Choropleth용 feature id
-        props["_fid"] = idx
+    return load_geo_asset("provinces")
 
-        simplified["features"].append(
-            {
-                "type": "Feature",
-                "properties": props,
-                "geometry": {"type": geom_type, "coordinates": simplified_coords},
-            }
-        )
 
-    GEOJSON_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    with open(GEOJSON_PROVINCES_BOUNDARY_CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump(simplified, f, ensure_ascii=False)
-
-    return simplified
+def load_korea_paldo_geojson():
+    return load_geo_asset("paldo")
 
 
 def _build_boundary_lines_from_geojson(geojson):
@@ -210,30 +78,41 @@ def _build_boundary_lines_from_geojson(geojson):
     return lons, lats
 
 
-# ========== 지도 렌더링 ==========
-@st.cache_data
-def create_bubble_map(df_json, filter_type = "charging", lightweight = False, _version = 5):
+# ========== 지도 figure 템플릿 ==========
+def _map_template_key(asset):
+    """템플릿 버전 + geometry 자산 체크섬 (자산이 바뀌면 템플릿도 다시 생성)"""
+    digest = hashlib.sha1(f"v{MAP_TEMPLATE_VERSION}".encode())
+    digest.update(geometry_checksum(asset, read_manifest()).encode())
+    return digest.hexdigest()[:12]
+
+
+def _apply_map_layout(fig):
+    """지도 공통 레이아웃 (mercator, 한반도 범위 고정)"""
+    fig.update_layout(
+        paper_bgcolor="rgba(0, 0, 0, 0)",
+        plot_bgcolor="rgba(0, 0, 0, 0)",
+        geo=dict(
+            projection=dict(type="mercator"),
+            center=dict(lat=36.0, lon=127.5),
+            lataxis=dict(range=[33.0, 39.8]),
+            lonaxis=dict(range=[124.3, 131.9]),
+            bgcolor="rgba(10, 10, 10, 0)",  # CSS 배경 사용
+            showframe=False,
+            showcoastlines=False,
+            showcountries=False,
+            showland=False,
+        ),
+        margin=dict(l=0, r=0, t=0, b=0),
+        showlegend=False,
+        height=550,
+    )
+
+
+def build_map_template(provinces_geojson):
     """
-    팔도 단위 버블 지도 생성 (캐싱 지원)
-    - 단순한 경계선만 있는 배경 + 버블 표시
+    정적 레이어(시도 면, 경계선, 레이아웃)만 그린 figure
+    - 버블/텍스트 trace는 스타일만 지정한 빈 trace (create_bubble_map에서 데이터만 채움)
     """
-    # JSON에서 DataFrame 복원
-    df = pd.read_json(df_json)
-    
-    # 팔도(시도) GeoJSON 로드
-    provinces_geojson = load_korea_provinces_geojson()
-    
-    # 버블 크기 계산
-    if filter_type == "charging":
-        sizeref = 2.0 * max(df["count"]) / (80 ** 2)
-        text_values = [f"{region}<br>{v:,}" for region, v in zip(df["region"], df["count"])]
-        hover_template = "<b>%{customdata[0]}</b><br>충전소: %{customdata[1]:,}기<extra></extra>"
-    else:
-        sizeref = 2.0 * max(df["count"]) / (70 ** 2)
-        text_values = [f"{region}<br>{v:.1f}%" for region, v in zip(df["region"], df["count"])]
-        hover_template = "<b>%{customdata[0]}</b><br>전기 화물차 비중: %{customdata[1]:.1f}%<extra></extra>"
-    
-    # Figure 생성
     fig = go.Figure()
     
     province_ids = [f.get("properties", {}).get("_fid") for f in provinces_geojson.get("features", [])]
@@ -266,33 +145,22 @@ def create_bubble_map(df_json, filter_type = "charging", lightweight = False, _v
         name="",
     ))
     
-    border_width = 2 if not lightweight else 1
+    # 버블 (BUBBLE_TRACE)
     fig.add_trace(go.Scattergeo(
-        lat=df["lat"],
-        lon=df["lon"],
         mode="markers",
         marker=dict(
-            size=df["count"],
             sizemode="area",
-            sizeref=sizeref,
             sizemin=35,
             color="rgba(59, 130, 246, 0.98)",
-            line=dict(
-                color="rgba(191, 219, 254, 0.90)",
-                width=border_width,
-            ),
+            line=dict(color="rgba(191, 219, 254, 0.90)"),
             opacity=1,
         ),
-        customdata=list(zip(df["region"], df["count"])),
-        hovertemplate=hover_template,
         name="",
     ))
     
+    # 버블 라벨 (TEXT_TRACE)
     fig.add_trace(go.Scattergeo(
-        lat=df["lat"],
-        lon=df["lon"],
         mode="text",
-        text=text_values,
         textfont=dict(
             size=12,
             color="white",
@@ -303,37 +171,198 @@ def create_bubble_map(df_json, filter_type = "charging", lightweight = False, _v
         name="",
     ))
     
-    # 레이아웃
-    fig.update_layout(
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        geo=dict(
-            projection=dict(type="mercator"),
-            center=dict(lat=36.0, lon=127.5),
-            lataxis=dict(range=[33.0, 39.8]),
-            lonaxis=dict(range=[124.3, 131.9]),
-            bgcolor="rgba(10, 10, 10, 0)",  # CSS 배경 사용
-            showframe=False,
-            showcoastlines=False,
-            showcountries=False,
-            showland=False,
+    _apply_map_layout(fig)
+    
+    return fig
+
+
+def build_choropleth_template(paldo_geojson):
+    """
+    권역(팔도) 코로플레스 figure
+    - 권역 면(CHOROPLETH_TRACE)과 라벨(LABEL_TRACE)은 스타일만 지정, 값은 create_choropleth_map에서 채움
+    """
+    fig = go.Figure()
+    
+    fig.add_trace(go.Choropleth(
+        geojson=paldo_geojson,
+        featureidkey="properties._fid",
+        colorscale=[
+            [0, "rgba(59, 130, 246, 0.15)"],
+            [1, "rgba(59, 130, 246, 0.95)"],
+        ],
+        marker_line_width=1,
+        marker_line_color="rgba(255, 255, 255, 0.25)",
+        showscale=False,
+    ))
+    
+    fig.add_trace(go.Scattergeo(
+        mode="text",
+        textfont=dict(
+            size=12,
+            color="white",
+            family="Pretendard, -apple-system, sans-serif",
         ),
-        margin=dict(l=0, r=0, t=0, b=0),
-        showlegend=False,
-        height=550,
+        textposition="middle center",
+        hoverinfo="skip",
+        name="",
+    ))
+    
+    _apply_map_layout(fig)
+    
+    return fig
+
+
+# 템플릿 종류 -> (geometry 자산, 빌더)
+MAP_TEMPLATES = {
+    "bubble": ("provinces", build_map_template),
+    "choropleth": ("paldo", build_choropleth_template),
+}
+
+
+@st.cache_resource
+def load_map_template(kind="bubble"):
+    """
+    디스크에 저장된 figure 템플릿(dict) 로드, 없거나 geometry 자산이 바뀌었으면 새로 생성
+    - 반환값은 프로세스 전체가 공유하므로 수정하지 않고 go.Figure(...)로 복사해서 사용
+    """
+    asset, builder = MAP_TEMPLATES[kind]
+    geojson = load_geo_asset(asset)
+    template_file = MAP_TEMPLATE_DIR / f"map_template_{kind}_{_map_template_key(asset)}.json"
+
+    if template_file.exists():
+        try:
+            with open(template_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[MAP] 템플릿 로드 실패, 다시 생성 ❌: {e}")
+
+    template = json.loads(builder(geojson).to_json())
+    if not geojson["features"]:
+        return template  # 자산이 없을 때 만든 빈 템플릿은 저장하지 않음
+
+    try:
+        MAP_TEMPLATE_DIR.mkdir(parents=True, exist_ok=True)
+        for old in MAP_TEMPLATE_DIR.glob(f"map_template_{kind}_*.json"):
+            old.unlink()
+        tmp = template_file.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(template, f, ensure_ascii=False, separators=(",", ":"))
+        tmp.replace(template_file)
+    except OSError as e:
+        print(f"[MAP] 템플릿 저장 실패 ❌: {e}")
+
+    return template
+
+
+def frame_cache_key(df):
+    """DataFrame 내용 해시 (JSON 직렬화 없이 cache key 생성)"""
+    digest = hashlib.sha1(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    digest.update("|".join(map(str, df.columns)).encode())
+    return digest.hexdigest()
+
+
+# ========== 지도 렌더링 ==========
+def _value_labels(regions, values, filter_type):
+    """필터별 라벨 텍스트 목록과 hover 템플릿"""
+    if filter_type == "charging":
+        text_values = [f"{region}<br>{v:,}" for region, v in zip(regions, values)]
+        hover_template = "<b>%{customdata[0]}</b><br>충전소: %{customdata[1]:,}기<extra></extra>"
+    else:
+        text_values = [f"{region}<br>{v:.1f}%" for region, v in zip(regions, values)]
+        hover_template = "<b>%{customdata[0]}</b><br>전기 화물차 비중: %{customdata[1]:.1f}%<extra></extra>"
+    return text_values, hover_template
+
+
+@st.cache_data
+def create_bubble_map(data_key, _df, filter_type = "charging", lightweight = False):
+    """
+    팔도 단위 버블 지도 생성 (캐싱 지원)
+    - 정적 레이어는 템플릿을 복사하고 버블/텍스트 trace 데이터만 채움
+    - data_key: frame_cache_key(_df) (_df 자체는 캐시 키 계산에서 제외)
+    """
+    df = _df
+    
+    # 버블 크기 계산
+    sizeref = 2.0 * max(df["count"]) / ((80 if filter_type == "charging" else 70) ** 2)
+    text_values, hover_template = _value_labels(df["region"], df["count"], filter_type)
+    
+    fig = go.Figure(load_map_template("bubble"))
+    
+    border_width = 2 if not lightweight else 1
+    fig.data[BUBBLE_TRACE].update(
+        lat=df["lat"],
+        lon=df["lon"],
+        marker=dict(
+            size=df["count"],
+            sizeref=sizeref,
+            line=dict(width=border_width),
+        ),
+        customdata=list(zip(df["region"], df["count"])),
+        hovertemplate=hover_template,
+    )
+    
+    fig.data[TEXT_TRACE].update(
+        lat=df["lat"],
+        lon=df["lon"],
+        text=text_values,
     )
     
     return fig
 
 
-def render_map_section(df, filter_type = "charging", lightweight = True):
+@st.cache_data
+def create_choropleth_map(data_key, _df, filter_type = "ratio"):
     """
-    지도 섹션 렌더링
+    권역(팔도) 코로플레스 지도 생성 (캐싱 지원)
+    - 8개 권역 면을 값으로 칠하고, 라벨은 권역 면적 가중 중심점에 표시
+    - 권역 도형에 없는 region 행은 제외
     """
-    # df -> json
-    df_json = df.to_json()
+    df = _df
+    props = {
+        f["properties"]["name"]: f["properties"]
+        for f in load_korea_paldo_geojson().get("features", [])
+    }
+    rows = [(region, v) for region, v in zip(df["region"], df["count"]) if region in props]
+    regions = [region for region, _ in rows]
+    values = [v for _, v in rows]
+    text_values, hover_template = _value_labels(regions, values, filter_type)
+    
+    fig = go.Figure(load_map_template("choropleth"))
+    
+    fig.data[CHOROPLETH_TRACE].update(
+        locations=[props[region]["_fid"] for region in regions],
+        z=values,
+        zmin=0,
+        zmax=max(values) if values else 1,
+        customdata=rows,
+        hovertemplate=hover_template,
+    )
     
-    fig = create_bubble_map(df_json, filter_type, lightweight, _version=3)
+    label_lons, label_lats = [], []
+    for region in regions:
+        lon, lat = props[region].get("centroid") or (None, None)
+        d_lon, d_lat = CHOROPLETH_LABEL_OFFSETS.get(region, (0, 0))
+        label_lons.append(lon + d_lon if lon is not None else None)
+        label_lats.append(lat + d_lat if lat is not None else None)
+    
+    fig.data[LABEL_TRACE].update(
+        lat=label_lats,
+        lon=label_lons,
+        text=text_values,
+    )
+    
+    return fig
+
+
+def render_map_section(df, filter_type = "charging", lightweight = True, mode = "bubble"):
+    """
+    지도 섹션 렌더링
+    - mode: bubble(시도 배경 + 버블) | choropleth(권역 면 색칠)
+    """
+    if mode == "choropleth":
+        fig = create_choropleth_map(frame_cache_key(df), df, filter_type)
+    else:
+        fig = create_bubble_map(frame_cache_key(df), df, filter_type, lightweight)
     
     st.plotly_chart(
         fig,
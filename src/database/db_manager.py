@@ -1,49 +1,344 @@
 import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from dotenv import load_dotenv
 
 import mysql.connector
 from mysql.connector import Error
+from mysql.connector.errors import PoolError
 from src.database.schema import DBSchema
 
 load_dotenv()
 
+
+def _load_config():
+    """환경변수에서 DB 접속 정보 로드"""
+    return {
+        'host': os.getenv('DB_HOST'),
+        'user': os.getenv('DB_USER'),
+        'password': os.getenv('DB_PASSWORD'),
+        'database': os.getenv('DB_NAME'),
+    }
+
+
+class ConnectionPool:
+    """
+    프로세스 전역 MySQL 커넥션 풀
+
+    - pool_size: 최대 커넥션 수 (대여 중 + 유휴 합계)
+    - idle_timeout: 이 시간(초) 이상 유휴 상태인 커넥션은 폐기
+    - ping_interval: 이 시간(초) 이상 유휴였던 커넥션만 대여 시 ping으로 상태 확인
+    - borrow_timeout: 풀이 가득 찼을 때 대여를 기다리는 최대 시간(초)
+    """
+
+    def __init__(self, config, pool_size=5, idle_timeout=300, ping_interval=5, borrow_timeout=10):
+        self.config = config
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.ping_interval = ping_interval
+        self.borrow_timeout = borrow_timeout
+
+        self._idle = []  # [(connection, last_used)] - 마지막에 반납된 커넥션부터 재사용
+        self._stmt_caches = {}  # id(connection) -> 준비된 구문 캐시
+        self._lock = threading.Lock()
+        self._bootstrap_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._bootstrapped = False
+
+    def _bootstrap(self):
+        """DB 생성(DDL)은 프로세스당 1회만 실행"""
+        if self._bootstrapped:
+            return
+
+        with self._bootstrap_lock:
+            if self._bootstrapped:
+                return
+
+            # database 없이 먼저 연결
+            connect_config = {k: v for k, v in self.config.items() if k != 'database'}
+            connection = mysql.connector.connect(**connect_config)
+            try:
+                cursor = connection.cursor()
+                cursor.execute(f'CREATE DATABASE IF NOT EXISTS {self.config["database"]}')
+                cursor.close()
+            finally:
+                connection.close()
+
+            self._bootstrapped = True
+
+    def _new_connection(self):
+        self._bootstrap()
+        return mysql.connector.connect(**self.config)
+
+    def _discard(self, connection):
+        with self._lock:
+            self._stmt_caches.pop(id(connection), None)
+        try:
+            connection.close()
+        except Error:
+            pass
+
+    def statement_cache(self, connection):
+        """커넥션별 준비된 구문(prepared statement) 캐시 반환"""
+        with self._lock:
+            return self._stmt_caches.setdefault(id(connection), OrderedDict())
+
+    def _is_healthy(self, connection, idle_for):
+        """대여 전 상태 확인 (최근에 쓰인 커넥션은 ping 생략)"""
+        if idle_for < self.ping_interval:
+            return True
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Error:
+            return False
+
+    def _evict_idle(self):
+        """idle_timeout을 넘긴 유휴 커넥션 정리"""
+        now = time.monotonic()
+        with self._lock:
+            expired = [conn for conn, last_used in self._idle if now - last_used > self.idle_timeout]
+            self._idle = [(conn, last_used) for conn, last_used in self._idle if now - last_used <= self.idle_timeout]
+
+        for conn in expired:
+            self._discard(conn)
+
+    def acquire(self):
+        """
+        커넥션 대여
+
+        Returns:
+            MySQLConnection: 사용 가능한 커넥션
+
+        Raises:
+            PoolError: borrow_timeout 안에 커넥션을 얻지 못한 경우
+        """
+        if not self._slots.acquire(timeout=self.borrow_timeout):
+            raise PoolError(f'커넥션 풀 대기 시간 초과 (pool_size={self.pool_size})')
+
+        try:
+            while True:
+                with self._lock:
+                    if not self._idle:
+                        break
+                    connection, last_used = self._idle.pop()
+
+                idle_for = time.monotonic() - last_used
+                if idle_for > self.idle_timeout or not self._is_healthy(connection, idle_for):
+                    self._discard(connection)
+                    continue
+                return connection
+
+            return self._new_connection()
+
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, connection):
+        """커넥션 반납 (열린 트랜잭션은 롤백 후 유휴 목록으로)"""
+        try:
+            connection.consume_results()
+            if connection.in_transaction:
+                connection.rollback()
+            with self._lock:
+                self._idle.append((connection, time.monotonic()))
+        except Error:
+            self._discard(connection)
+        finally:
+            self._slots.release()
+
+        self._evict_idle()
+
+    def close_all(self):
+        """유휴 커넥션 전체 종료"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            self._discard(conn)
+
+
+class DBSession:
+    """
+    풀에서 대여한 커넥션 하나로 여러 쿼리를 실행하는 세션
+
+    - cursor_type: 'dict'(기본) | 'named_tuple' | 'tuple'
+    - prepared=True이면 쿼리 문자열별 준비된 구문을 커넥션 단위로 캐시해 재사용
+    """
+
+    CURSOR_OPTIONS = {
+        'dict': {'dictionary': True},
+        'named_tuple': {'named_tuple': True},
+        'tuple': {},
+    }
+    STATEMENT_CACHE_SIZE = 32
+
+    def __init__(self, connection, stmt_cache, cursor_type='dict', prepared=True):
+        if cursor_type not in self.CURSOR_OPTIONS:
+            raise ValueError(f'지원하지 않는 cursor_type: {cursor_type}')
+
+        self.connection = connection
+        self.cursor_type = cursor_type
+        self.prepared = prepared
+        self._stmt_cache = stmt_cache
+        self._cursor = None
+
+    def _get_cursor(self, query):
+        """쿼리에 사용할 커서 반환 (준비된 구문은 캐시에서 재사용)"""
+        if not self.prepared:
+            if self._cursor is None:
+                self._cursor = self.connection.cursor(**self.CURSOR_OPTIONS[self.cursor_type])
+            return self._cursor, query
+
+        key = (self.cursor_type, query)
+        cached = self._stmt_cache.get(key)
+        if cached is not None:
+            self._stmt_cache.move_to_end(key)
+            return cached
+
+        cursor = self.connection.cursor(prepared=True, **self.CURSOR_OPTIONS[self.cursor_type])
+        # 같은 문자열 객체로 실행해야 커서가 재준비(prepare)를 건너뜀
+        self._stmt_cache[key] = (cursor, query)
+
+        if len(self._stmt_cache) > self.STATEMENT_CACHE_SIZE:
+            _, (old_cursor, _) = self._stmt_cache.popitem(last=False)
+            try:
+                old_cursor.close()
+            except Error:
+                pass
+
+        return cursor, query
+
+    def fetch_all(self, query, params=None):
+        """
+        조회 쿼리 실행 후 전체 행 반환
+
+        Returns:
+            list: cursor_type에 따른 행(dict / namedtuple / tuple) 리스트
+        """
+        cursor, query = self._get_cursor(query)
+        cursor.execute(query, params or ())
+        return cursor.fetchall()
+
+    def fetch_one(self, query, params=None):
+        """조회 쿼리 실행 후 첫 행 반환 (없으면 None)"""
+        rows = self.fetch_all(query, params)
+        return rows[0] if rows else None
+
+    def execute(self, query, params=None):
+        """
+        쿼리 실행 (INSERT, UPDATE, DELETE)
+
+        Returns:
+            int: 영향받은 행 수
+        """
+        cursor, query = self._get_cursor(query)
+        cursor.execute(query, params or ())
+        return cursor.rowcount
+
+    def executemany(self, query, seq_params):
+        """여러 파라미터로 쿼리 일괄 실행 (일반 커서 사용)"""
+        cursor = self.connection.cursor()
+        try:
+            cursor.executemany(query, seq_params)
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+    def commit(self):
+        self.connection.commit()
+
+    def rollback(self):
+        try:
+            self.connection.rollback()
+        except Error:
+            pass
+
+    def close(self):
+        if self._cursor is not None:
+            try:
+                self._cursor.close()
+            except Error:
+                pass
+            self._cursor = None
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """프로세스 전역 커넥션 풀 반환 (최초 호출 시 생성)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    _load_config(),
+                    pool_size=int(os.getenv('DB_POOL_SIZE', 5)),
+                    idle_timeout=float(os.getenv('DB_POOL_IDLE_TIMEOUT', 300)),
+                    borrow_timeout=float(os.getenv('DB_POOL_TIMEOUT', 10)),
+                )
+    return _pool
+
+
 class DBManager:
     def __init__(self):
-        self.config = {
-            'host': os.getenv('DB_HOST'),
-            'user': os.getenv('DB_USER'),
-            'password': os.getenv('DB_PASSWORD'),
-            'database': os.getenv('DB_NAME'),
-        }
+        self.config = _load_config()
         self.connection = None
         self.cursor = None
 
     def connect(self):
-        """DB 연결"""
+        """DB 연결 (커넥션 풀에서 대여)"""
+        connection = None
         try:
-            # database 없이 먼저 연결
-            connect_config = {k: v for k, v in self.config.items() if k != 'database'}
-            self.connection = mysql.connector.connect(**connect_config)
-            self.cursor = self.connection.cursor()
-
-            # 없으면 DB 생성
-            db_name = self.config['database']
-            self.cursor.execute(f'CREATE DATABASE IF NOT EXISTS {db_name}')
-            self.cursor.execute(f'USE {db_name}')
+            connection = get_pool().acquire()
+            self.cursor = connection.cursor()
+            self.connection = connection
 
             print(f'[DB] DB 연결 성공 ✅')
             return True
-            
+
         except Error as e:
             print(f'[DB] DB 연결 실패 ❌: {e}')
+            # 대여 후 커서 생성에서 실패하면 커넥션과 풀 자리를 반납
+            if connection is not None:
+                get_pool().release(connection)
             return False
 
+    @contextmanager
+    def session(self, cursor_type='dict', prepared=True):
+        """
+        커넥션 대여/반납을 관리하는 세션 컨텍스트
+
+        Example:
+            with DBManager().session() as s:
+                rows = s.fetch_all('SELECT region, charger_cnt FROM region_tbl')
+
+        Args:
+            cursor_type: 'dict' | 'named_tuple' | 'tuple'
+            prepared: 준비된 구문 사용 여부
+        """
+        pool = get_pool()
+        connection = pool.acquire()
+        session = DBSession(connection, pool.statement_cache(connection), cursor_type, prepared)
+        try:
+            yield session
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+            pool.release(connection)
+
     def create_tables(self):
         """테이블 생성"""
         try:
             tables = DBSchema.get_all_tables()
             table_names = DBSchema.get_table_names()
-            
+
             for table in tables:
                 self.cursor.execute(table)
 
@@ -55,7 +350,7 @@ class DBManager:
             print(f'[DB] 테이블 생성 실패 ❌: {e}')
             self.connection.rollback()
             return False
-        
+
     def drop_all_tables(self):
         """모든 테이블 삭제"""
         try:
@@ -71,7 +366,7 @@ class DBManager:
             # 외래키 제약 조건 복구
             self.cursor.execute('SET FOREIGN_KEY_CHECKS = 1')
             self.connection.commit()
-            
+
             print(f'[DB] 전체 테이블 삭제 완료 ✅')
             return True
 
@@ -79,6 +374,21 @@ class DBManager:
             print(f'[DB] 테이블 삭제 실패 ❌: {e}')
             return False
 
+    def refresh_summary_tables(self):
+        """등록 통계 요약 테이블 재계산 (cnt_tbl 적재 후 호출)"""
+        try:
+            for query in DBSchema.get_summary_refresh_queries():
+                self.cursor.execute(query)
+
+            self.connection.commit()
+            print(f'[DB] 요약 테이블 갱신 완료 ✅')
+            return True
+
+        except Error as e:
+            print(f'[DB] 요약 테이블 갱신 실패 ❌: {e}')
+            self.connection.rollback()
+            return False
+
     def execute(self, query, values=None):
         """
         쿼리 실행 (INSERT, UPDATE, DELETE)
@@ -86,7 +396,7 @@ class DBManager:
         Args:
             query: SQL 쿼리문
             values: 쿼리 파라미터
-        
+
         Returns:
             bool: 성공 여부
         """
@@ -111,7 +421,7 @@ class DBManager:
         except Error as e:
             print(f'[DB] 트랜젝션 커밋 실패 ❌: {e}')
             return False
-    
+
     def rollback(self):
         """트랜젝션 롤백"""
         try:
@@ -121,20 +431,25 @@ class DBManager:
         except Error as e:
             print(f'[DB] 트랜젝션 롤백 실패 ❌: {e}')
             return False
-        
+
     def close(self):
-        """DB 연결 종료"""
+        """DB 연결 반납 (커넥션은 풀에서 재사용)"""
         if self.cursor:
-            self.cursor.close()
-        if self.connection and self.connection.is_connected():
-            self.connection.close()
+            try:
+                self.cursor.close()
+            except Error:
+                pass
+        if self.connection:
+            get_pool().release(self.connection)
+        self.cursor = None
+        self.connection = None
         print(f'[DB] DB 연결 종료 ✅')
         return True
 
     def get_connection(self):
         """DB 연결 반환"""
         return self.connection
-    
+
     def get_cursor(self):
         """DB 커서 반환"""
         return self.cursor
@@ -27,13 +27,58 @@ class DBSchema:
         region VARCHAR(10) NOT NULL,                         -- 지역 이름(FK)
         date INT NOT NULL,                                   -- 년월
         cnt INT NOT NULL,                                    -- 등록 대수
-        
+
+        UNIQUE KEY uk_cnt_date_region_fuel (date, region, fuel_type),  -- 재적재 시 upsert 기준
+        KEY idx_cnt_date_fuel_cover (date, fuel_type, region, cnt),    -- 월별/연도별 집계 (커버링)
+        KEY idx_cnt_region_date (region, date),                        -- 지역별 기간 조회
+
         FOREIGN KEY (fuel_type) REFERENCES fuel_tbl(fuel_type)
             ON UPDATE CASCADE,
         FOREIGN KEY (region) REFERENCES region_tbl(region)
             ON UPDATE CASCADE
     );
     """
+
+    # cnt_tbl 인덱스 (기존 DB 마이그레이션용, 이름 -> ADD 구문)
+    CNT_TABLE_INDEXES = {
+        'uk_cnt_date_region_fuel': 'ADD UNIQUE KEY uk_cnt_date_region_fuel (date, region, fuel_type)',
+        'idx_cnt_date_fuel_cover': 'ADD KEY idx_cnt_date_fuel_cover (date, fuel_type, region, cnt)',
+        'idx_cnt_region_date': 'ADD KEY idx_cnt_region_date (region, date)',
+    }
+
+    # 중복 행 백업 테이블 (마이그레이션에서 지운 행 보관, 확인/수동 복원용)
+    CNT_DUPLICATE_BACKUP_TABLE = """
+    CREATE TABLE IF NOT EXISTS cnt_dup_backup_tbl (
+        reg_id INT PRIMARY KEY,                              -- 원래 등록 코드
+        fuel_type VARCHAR(20) NOT NULL,
+        region VARCHAR(10) NOT NULL,
+        date INT NOT NULL,
+        cnt INT NOT NULL,
+        backed_up_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    );
+    """
+
+    # 지울 중복 행을 백업 테이블에 복사 (CNT_DEDUPLICATE_QUERY와 같은 조건)
+    CNT_DUPLICATE_BACKUP_QUERY = """
+    INSERT IGNORE INTO cnt_dup_backup_tbl (reg_id, fuel_type, region, date, cnt)
+    SELECT DISTINCT older.reg_id, older.fuel_type, older.region, older.date, older.cnt
+    FROM cnt_tbl older
+    JOIN cnt_tbl newer
+        ON older.date = newer.date
+        AND older.region = newer.region
+        AND older.fuel_type = newer.fuel_type
+        AND older.reg_id < newer.reg_id
+    """
+
+    # uk_cnt_date_region_fuel 추가 전 중복 행 제거 (같은 키 중 가장 최근 적재분 유지)
+    CNT_DEDUPLICATE_QUERY = """
+    DELETE older FROM cnt_tbl older
+    JOIN cnt_tbl newer
+        ON older.date = newer.date
+        AND older.region = newer.region
+        AND older.fuel_type = newer.fuel_type
+        AND older.reg_id < newer.reg_id
+    """
     
     # 4. 차량 정보 테이블
     CAR_INFO_TABLE = """
@@ -82,6 +127,71 @@ class DBSchema:
     );
     """
 
+    # 7. 연도별 전기/내연 누적 등록 대수 요약 (연도별 최신 월 기준, cnt_tbl에서 재계산)
+    CNT_YEARLY_SUMMARY_TABLE = """
+    CREATE TABLE IF NOT EXISTS cnt_yearly_summary_tbl (
+        year INT PRIMARY KEY,                                -- 연도(PK)
+        date INT NOT NULL,                                   -- 기준 년월(해당 연도 최신 월)
+        electric INT NOT NULL,                               -- 전기 누적 대수
+        combustion INT NOT NULL                              -- 내연 누적 대수
+    );
+    """
+
+    # 8. 최신 월 지역별 전기 등록 대수 요약
+    CNT_REGION_SHARE_TABLE = """
+    CREATE TABLE IF NOT EXISTS cnt_region_share_tbl (
+        region VARCHAR(10) PRIMARY KEY,                      -- 지역 이름(PK)
+        date INT NOT NULL,                                   -- 기준 년월(전체 최신 월)
+        electric INT NOT NULL,                               -- 전기 대수
+        total INT NOT NULL                                   -- 전체 대수
+    );
+    """
+
+    # 9. 월별 전국 등록 대수 요약
+    CNT_MONTHLY_TOTAL_TABLE = """
+    CREATE TABLE IF NOT EXISTS cnt_monthly_total_tbl (
+        date INT PRIMARY KEY,                                -- 년월(PK)
+        electric INT NOT NULL,                               -- 전기 대수
+        combustion INT NOT NULL,                             -- 내연 대수
+        total INT NOT NULL                                   -- 전체 대수
+    );
+    """
+
+    # 요약 테이블 갱신 쿼리 (DELETE 후 cnt_tbl 집계 결과로 재생성)
+    SUMMARY_REFRESH_QUERIES = [
+        "DELETE FROM cnt_yearly_summary_tbl",
+        """
+        INSERT INTO cnt_yearly_summary_tbl (year, date, electric, combustion)
+        SELECT c.date DIV 100, MAX(c.date),
+               SUM(CASE WHEN c.fuel_type = '전기' THEN c.cnt ELSE 0 END),
+               SUM(CASE WHEN c.fuel_type = '전기' THEN 0 ELSE c.cnt END)
+        FROM cnt_tbl c
+        JOIN (SELECT MAX(date) AS date FROM cnt_tbl GROUP BY date DIV 100) latest
+            ON c.date = latest.date
+        GROUP BY c.date DIV 100
+        """,
+        "DELETE FROM cnt_region_share_tbl",
+        """
+        INSERT INTO cnt_region_share_tbl (region, date, electric, total)
+        SELECT region, MAX(date),
+               SUM(CASE WHEN fuel_type = '전기' THEN cnt ELSE 0 END),
+               SUM(cnt)
+        FROM cnt_tbl
+        WHERE date = (SELECT MAX(date) FROM cnt_tbl)
+        GROUP BY region
+        """,
+        "DELETE FROM cnt_monthly_total_tbl",
+        """
+        INSERT INTO cnt_monthly_total_tbl (date, electric, combustion, total)
+        SELECT date,
+               SUM(CASE WHEN fuel_type = '전기' THEN cnt ELSE 0 END),
+               SUM(CASE WHEN fuel_type = '전기' THEN 0 ELSE cnt END),
+               SUM(cnt)
+        FROM cnt_tbl
+        GROUP BY date
+        """,
+    ]
+
     @classmethod
     def get_all_tables(cls):
         """테이블 생성 쿼리 반환"""
@@ -92,8 +202,21 @@ class DBSchema:
             cls.CNT_TABLE,
             cls.FAQ_CATEGORY_TABLE,
             cls.FAQ_TABLE,
+            cls.CNT_YEARLY_SUMMARY_TABLE,
+            cls.CNT_REGION_SHARE_TABLE,
+            cls.CNT_MONTHLY_TOTAL_TABLE,
         ]
 
     @classmethod
     def get_table_names(cls):
-        return ['fuel_tbl', 'region_tbl', 'car_info_tbl', 'cnt_tbl', 'faq_category_tbl', 'faq_tbl']
\ No newline at end of file
+        return [
+            'fuel_tbl', 'region_tbl', 'car_info_tbl', 'cnt_tbl', 'faq_category_tbl', 'faq_tbl',
+            'cnt_yearly_summary_tbl', 'cnt_region_share_tbl', 'cnt_monthly_total_tbl',
+            # 마이그레이션에서만 생성 (get_all_tables 에는 없음), drop_all_tables 에서 함께 삭제
+            'cnt_dup_backup_tbl',
+        ]
+
+    @classmethod
+    def get_summary_refresh_queries(cls):
+        """요약 테이블 갱신 쿼리 반환"""
+        return cls.SUMMARY_REFRESH_QUERIES
\ No newline at end of file
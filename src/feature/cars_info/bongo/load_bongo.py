@@ -3,6 +3,7 @@
 변환된 데이터를 DB에 저장
 """
 from src.database.db_manager import DBManager
+from src.services.cache import bump_data_version
 from src.feature.cars_info.bongo.transform_bongo import transform_bongo_data
 
 
@@ -49,6 +50,7 @@ def load_bongo_info():
                     print(f"[BONGO] 데이터 삽입 실패: {data.get('name', 'Unknown')}")
             
             db.commit()
+            bump_data_version()  # 앱의 서비스 캐시 무효화
             print(f"[BONGO] {success_count}/{len(transformed)}건 저장 완료 ✅")
             
         except Exception as e:
@@ -0,0 +1,134 @@
+"""
+다나와 차량 크롤러 병렬 모드 (crawl_porter / crawl_bongo --workers N)
+(모델, 라인업, 탭) 단위 작업을 워커 풀로 나눠 처리하고, 순차 모드와 같은 구조의 결과를 만듭니다.
+
+1단계: 모델별 라인업 목록(lineups) + 대표 이미지(image)
+2단계: 라인업별 제원 탭(spec)
+3단계: 제원 탭에서 트림 정보를 찾지 못한 라인업만 가격 탭(price)
+
+다나와 요청 간격은 작업 단위가 아니라 요청(HTTP, driver.get)마다 danawa_http.throttle()이 지킵니다 (모든 워커 공유).
+"""
+import time
+from typing import NamedTuple
+
+from src.feature.common.worker_pool import DriverWorkerPool
+
+
+class CrawlJob(NamedTuple):
+    model_key: str
+    model_id: str
+    lineup_id: str
+    tab: str  # lineups | image | spec | price
+
+
+def _select_lineups(model_info, found, lineup_ids):
+    """크롤링할 라인업 목록 (지정된 ID가 있으면 그 순서대로, 이름은 라인업 목록에서)"""
+    selected = lineup_ids or model_info.get("lineup_ids")
+    if not selected:
+        return found
+
+    names = {lu["id"]: lu["name"] for lu in found}
+    return [
+        {"id": str(lineup_id), "name": names.get(str(lineup_id), f"라인업 {lineup_id}")}
+        for lineup_id in selected
+    ]
+
+
+def crawl_models_parallel(crawler, models, workers=4, lineup_ids=None):
+    """
+    여러 모델을 병렬로 크롤링
+
+    Args:
+        crawler: 크롤러 모듈 (crawl_porter / crawl_bongo)
+        models: PORTER_MODELS / BONGO_MODELS
+        workers: 동시에 띄울 headless 드라이버 수
+        lineup_ids: 명령줄에서 지정한 라인업 ID (없으면 모델 설정, 그것도 없으면 전체)
+
+    Returns:
+        (results, failures): {모델 key: 순차 모드 crawl_model과 같은 구조의 결과},
+                             {재시도 후에도 실패한 CrawlJob: 예외} (비어 있지 않으면 결과가 불완전)
+    """
+    logger = crawler.logger
+    started = time.perf_counter()
+
+    def handle(driver, job):
+        if job.tab == "lineups":
+            return crawler.get_all_lineups(driver, job.model_id)
+        if job.tab == "image":
+            keyword = crawler.image_search_keyword(models[job.model_key]["name"])
+            return crawler.extract_model_image_url(driver, job.model_id, keyword)
+        if job.tab == "spec":
+            return crawler.extract_spec_detail(driver, job.model_id, job.lineup_id)
+        if job.tab == "price":
+            return crawler.extract_trim_info_from_price_tab(driver, job.model_id, job.lineup_id)
+        raise ValueError(f"알 수 없는 탭: {job.tab}")
+
+    with DriverWorkerPool(workers=workers, logger=logger) as pool:
+        # 1단계: 라인업 목록 + 이미지
+        model_jobs = []
+        for key, info in models.items():
+            model_jobs.append(CrawlJob(key, info["id"], "", "lineups"))
+            model_jobs.append(CrawlJob(key, info["id"], "", "image"))
+        model_results, model_errors = pool.run(model_jobs, handle)
+
+        lineups_by_model = {
+            key: _select_lineups(info, model_results.get(CrawlJob(key, info["id"], "", "lineups")) or [], lineup_ids)
+            for key, info in models.items()
+        }
+
+        # 2단계: 제원 탭
+        spec_jobs = [
+            CrawlJob(key, models[key]["id"], str(lu["id"]), "spec")
+            for key, lineups in lineups_by_model.items()
+            for lu in lineups
+            if lu.get("id")
+        ]
+        logger.info(f"제원 탭 작업 {len(spec_jobs)}개, 워커 {workers}개")
+        spec_results, spec_errors = pool.run(spec_jobs, handle)
+
+        # 3단계: 트림 정보가 없는 라인업만 가격 탭
+        price_jobs = []
+        for job in spec_jobs:
+            trims = (spec_results.get(job) or {}).get("trims") or {}
+            if not trims.get("name") and not trims.get("price"):
+                price_jobs.append(job._replace(tab="price"))
+        if price_jobs:
+            logger.info(f"가격 탭 작업 {len(price_jobs)}개")
+        price_results, price_errors = pool.run(price_jobs, handle)
+
+    # 순차 모드와 같은 구조로 조립 (모델/라인업 순서 유지)
+    all_results = {}
+    for key, info in models.items():
+        result = {
+            "model": info["name"],
+            "model_id": info["id"],
+            "image_url": model_results.get(CrawlJob(key, info["id"], "", "image")) or "",
+            "lineup": [],
+        }
+
+        for lu in lineups_by_model[key]:
+            if not lu.get("id"):
+                continue
+            spec_job = CrawlJob(key, info["id"], str(lu["id"]), "spec")
+            spec_data = spec_results.get(spec_job) or {}
+            trims = spec_data.get("trims") or {}
+            if not trims.get("name") and not trims.get("price"):
+                trims = price_results.get(spec_job._replace(tab="price")) or {}
+
+            result["lineup"].append({
+                "id": str(lu["id"]),
+                "name": lu["name"],
+                "trims": {"name": trims.get("name", ""), "price": trims.get("price", "")},
+                "specs": spec_data.get("specs", {}),
+            })
+
+        logger.info(f"크롤링 완료: {info['name']} (라인업 {len(result['lineup'])}개)")
+        all_results[key] = result
+
+    failures = {**model_errors, **spec_errors, **price_errors}
+    for job, error in failures.items():
+        target = f"라인업 {job.lineup_id}" if job.lineup_id else models[job.model_key]["name"]
+        logger.error(f"작업 실패: {target} {job.tab} - {error}")
+
+    logger.info(f"병렬 크롤링 소요 시간: {time.perf_counter() - started:.1f}초")
+    return all_results, failures
@@ -0,0 +1,292 @@
+"""
+다나와 페이지 HTTP 우선 수집
+requests.Session(커넥션 풀)으로 HTML을 한 번 받아 BeautifulSoup으로 파싱하고,
+필요한 표가 응답 HTML에 없을 때(JS 렌더링 필요)만 크롤러가 Selenium으로 다시 시도합니다.
+
+parse_* 함수는 Selenium 경로(crawl_porter / crawl_bongo의 extract_*)와 같은 selector, 같은 결과 구조를 씁니다.
+파서 확인: python -m src.scripts.check_danawa_parsers (data/fixtures/danawa 저장 HTML 기준)
+현재 fixture는 Selenium selector를 기준으로 직접 작성한 HTML이라 실제 다나와 응답 HTML로 검증되지 않았습니다.
+실제 페이지를 --save 로 저장해 파서가 통과하는 것을 확인하기 전까지 HTTP 우선 수집은 기본으로 꺼 둡니다.
+(다나와가 JS 렌더링이면 페이지마다 HTTP 요청 1회가 추가로 낭비됨)
+
+환경 변수
+    DANAWA_HTTP_FIRST: 0(기본, 기존처럼 Selenium만 사용) | 1(HTTP 먼저, 실제 페이지로 파서 확인 후 사용)
+    DANAWA_DOM_EXTRACTION: 브라우저 폴백 시 추출 방식
+                           page_source(기본, page_source 1회 요청 후 같은 parse_* 로 파싱) |
+                           elements(기존 요소별 find_element 호출)
+"""
+import logging
+import os
+import re
+import threading
+from urllib.parse import quote, urljoin
+
+import requests
+from bs4 import BeautifulSoup
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.feature.common.page_cache import page_cache
+from src.feature.common.recorded_driver import HTML_PARSER
+from src.feature.common.worker_pool import DomainRateLimiter
+
+# 크롤러 단독 실행 시에도 .env 설정 반영 (DANAWA_HTTP_FIRST, DANAWA_DOM_EXTRACTION)
+load_dotenv()
+
+DANAWA_BASE_URL = "https://auto.danawa.com"
+DANAWA_DOMAIN = "auto.danawa.com"
+HTTP_FIRST = os.getenv("DANAWA_HTTP_FIRST", "0") == "1"
+DOM_EXTRACTION = os.getenv("DANAWA_DOM_EXTRACTION", "page_source")
+HTTP_TIMEOUT = 10
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/126.0 Safari/537.36"
+    ),
+    "Accept-Language": "ko-KR,ko;q=0.9",
+    "Referer": DANAWA_BASE_URL + "/",
+}
+
+PRICE_RE = re.compile(r"([\d,]+)")
+
+# 다나와 요청(HTTP, 브라우저 driver.get) 1회마다 최소 간격(초) - 순차/병렬 모든 워커 공유
+DEFAULT_MIN_INTERVAL = 1.0
+rate_limiter = DomainRateLimiter(DEFAULT_MIN_INTERVAL)
+
+_session_lock = threading.Lock()
+_session = None
+
+
+def model_url(model_id, lineup_id=None, tab="price"):
+    """모델/라인업 탭 URL (price | spec)"""
+    lineup = f"&Lineup={lineup_id}" if lineup_id else ""
+    return f"{DANAWA_BASE_URL}/auto/?Work=model&Model={model_id}{lineup}&Tab={tab}"
+
+
+def search_url(keyword):
+    return f"{DANAWA_BASE_URL}/search/?q={quote(keyword)}"
+
+
+def throttle():
+    """다나와 요청 직전 호출 (캐시 재생 중에는 네트워크를 쓰지 않으므로 대기 없음)"""
+    if not page_cache.replaying:
+        rate_limiter.wait(DANAWA_DOMAIN)
+
+
+def get_session(pool_size=16):
+    """프로세스 공용 Session (워커 스레드가 커넥션 풀 공유, 일시 오류 재시도)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(total=2, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry)
+            session = requests.Session()
+            session.headers.update(HEADERS)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+    return _session
+
+
+def fetch_html(url, timeout=HTTP_TIMEOUT, logger=None):
+    """
+    페이지 HTML 요청
+
+    Returns:
+        str | None: 실패(네트워크 오류, 2xx 아님, 재생 중 캐시 없음) 시 None
+    """
+    logger = logger or logging.getLogger(__name__)
+
+    # 페이지 캐시: replay는 캐시만, prefer는 캐시 우선, refresh는 조건부 요청
+    cached = page_cache.get(url)
+    if page_cache.replaying or (cached and page_cache.mode == "prefer"):
+        return cached.html if cached else None
+
+    headers = {}
+    if cached and cached.etag:
+        headers["If-None-Match"] = cached.etag
+    if cached and cached.last_modified:
+        headers["If-Modified-Since"] = cached.last_modified
+
+    throttle()
+    try:
+        response = get_session().get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and cached:
+            page_cache.touch(url)
+            return cached.html
+        response.raise_for_status()
+    except requests.RequestException as e:
+        logger.debug(f"HTTP 요청 실패: {url} - {e}")
+        return None
+
+    if not response.encoding or response.encoding.lower() == "iso-8859-1":
+        response.encoding = response.apparent_encoding
+    html = response.text
+    page_cache.put(
+        url, html,
+        etag=response.headers.get("ETag", ""),
+        last_modified=response.headers.get("Last-Modified", ""),
+    )
+    return html
+
+
+def _soup(html):
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+def _text(el):
+    """요소 텍스트 (공백/줄바꿈을 한 칸으로, Selenium .text 후 replace('\\n', ' ')와 같은 형태)"""
+    return " ".join(el.get_text(" ").split())
+
+
+def _price(text):
+    match = PRICE_RE.search(text)
+    return match.group(1).replace(",", "") if match else ""
+
+
+def parse_price_tab(html):
+    """가격 탭 specTable 첫 행 -> {"name", "price"}"""
+    result = {"name": "", "price": ""}
+    table = _soup(html).select_one("table.specTable")
+    if table is None:
+        return result
+
+    rows = table.select("tbody tr")
+    if not rows:
+        return result
+    first_row = rows[0]
+
+    trim_el = first_row.select_one("td.tdTitle")
+    if trim_el:
+        result["name"] = _text(trim_el)
+
+    price_el = first_row.select_one(".priceInfo .num.base") or first_row.select_one(".priceInfo")
+    if price_el:
+        result["price"] = _price(_text(price_el))
+
+    return result
+
+
+def _parse_spec_trims(soup):
+    """제원 탭 헤더 표의 첫 트림명/가격"""
+    trims = {"name": "", "price": ""}
+    header_tables = soup.select(
+        "table.compare__table.compare__header, table.compare_table thead, "
+        "table.compare_header thead, table thead"
+    )
+    for table in header_tables:
+        for row in table.select("tbody tr, thead tr"):
+            ths = row.find_all("th")
+            for th in ths[1:] if len(ths) > 1 else ths:
+                trim_el = th.select_one("span.trim")
+                if trim_el and not trims["name"]:
+                    trims["name"] = _text(trim_el)
+
+                price_el = th.select_one("span.price")
+                if price_el and not trims["price"]:
+                    trims["price"] = _price(_text(price_el))
+
+                if trims["name"] and trims["price"]:
+                    return trims
+    return trims
+
+
+def _maintenance_cost(soup):
+    """유지비 합계 (compare__price 표의 price_sum)"""
+    tables = soup.select(
+        "table.compare__table.compare__price, table.compare__table.compare__body22.compare__price"
+    )
+    for table in tables:
+        for row in table.find_all("tr"):
+            has_sum = row.select_one("span.price_sum") or any(
+                "합계" in text for td in row.find_all("td") for text in td.find_all(string=True, recursive=False)
+            )
+            if not has_sum:
+                continue
+            for span in row.select("span.price_sum"):
+                text = _text(span)
+                if text and text != "합계":
+                    cost = _price(text)
+                    if cost:
+                        return f"{cost}원"
+    return ""
+
+
+def parse_spec_tab(html):
+    """제원 탭 -> {"specs": {항목: 값}, "trims": {"name", "price"}}"""
+    soup = _soup(html)
+    data = {"specs": {}, "trims": _parse_spec_trims(soup)}
+
+    # compareLeft_N(항목명) <-> compareRight_N(첫 트림 값)
+    right_rows = {row.get("id"): row for row in soup.select("tr[id^='compareRight_']")}
+    for left_row in soup.select("tr[id^='compareLeft_']"):
+        index = left_row.get("id", "").replace("compareLeft_", "")
+        if not index.isdigit():
+            continue
+
+        tds = left_row.find_all("td")
+        key = _text(tds[0]) if tds else ""
+        right_row = right_rows.get(f"compareRight_{index}")
+        if not key or right_row is None:
+            continue
+
+        right_tds = right_row.find_all("td")
+        if not right_tds:
+            continue
+        value_el = right_tds[0]
+        inner = value_el.find("a") or value_el.find("span")
+        value = _text(inner or value_el)
+        if value:
+            data["specs"][key] = value
+
+    cost = _maintenance_cost(soup)
+    if cost:
+        data["specs"]["유지비"] = cost
+    return data
+
+
+def parse_lineups(html):
+    """가격 탭 라인업 라디오 -> [{"id", "name"}] (이름을 못 찾은 라인업은 제외)"""
+    soup = _soup(html)
+    lineups = []
+    for radio in soup.select("input[type='radio'][name='lineup_']"):
+        lineup_id = radio.get("data-lineup")
+        if not lineup_id:
+            continue
+
+        # ancestor::div[contains(@class, 'choice')] 중 가장 바깥 요소 (Selenium 경로와 같은 기준)
+        parents = [
+            div for div in radio.find_parents("div")
+            if "choice" in " ".join(div.get("class", []))
+        ]
+        lineup_name = ""
+        if parents:
+            parent = parents[-1]
+            selectbox = parent.select_one(".selectbox a.btn, .selectbox > a.btn")
+            if selectbox:
+                lineup_name = re.sub(r"\s*\([^)]*\)\s*$", "", _text(selectbox)).strip()
+            else:
+                label = parent.select_one(f"label[for='lineup_{lineup_id}']") or parent.select_one(
+                    ".choice__cell.choice__info .txt"
+                )
+                if label:
+                    lineup_name = _text(label)
+        else:
+            label = soup.select_one(f"label[for='lineup_{lineup_id}']")
+            if label:
+                lineup_name = _text(label)
+
+        if lineup_name:
+            lineups.append({"id": lineup_id, "name": lineup_name})
+    return lineups
+
+
+def parse_search_image(html, model_id, base_url=DANAWA_BASE_URL):
+    """검색 결과에서 model_id 대표 이미지 URL (없으면 빈 문자열)"""
+    img = _soup(html).select_one(f"ul#salesNewcarList a.image[href*='Model={model_id}'] img")
+    if img is None:
+        return ""
+    src = img.get("src") or img.get("data-src") or ""
+    return urljoin(base_url, src) if src else ""
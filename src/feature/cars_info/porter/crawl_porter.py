@@ -2,7 +2,6 @@ import json
 import logging
 import re
 import sys
-import time
 from pathlib import Path
 from urllib.parse import quote
 from selenium import webdriver
@@ -11,6 +10,20 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
 from config import PORTER_MODELS
+from src.feature.cars_info.danawa_http import (
+    DOM_EXTRACTION,
+    HTTP_FIRST,
+    fetch_html,
+    parse_lineups,
+    parse_price_tab,
+    parse_search_image,
+    parse_spec_tab,
+    throttle,
+)
+from src.feature.cars_info.crawl_parallel import crawl_models_parallel
+from src.feature.common.page_cache import ReplayDriver, page_cache
+from src.feature.common.waits import present, wait_stats, wait_until
+from src.feature.common.worker_pool import LazyDriver
 
 
 # 모델 정보
@@ -44,6 +57,15 @@ def setup_logger():
 # 전역 로거 인스턴스
 logger = setup_logger()
 
+# 페이지별 준비 조건 (selector가 나타나면 바로 추출, 없으면 PAGE_TIMEOUT 후 진행)
+READY_SELECTORS = {
+    "price": "table.specTable tbody tr",
+    "spec": "tr[id^='compareLeft_']",
+    "search": "ul#salesNewcarList li",
+    "lineups": "input[type='radio'][name='lineup_']",
+}
+PAGE_TIMEOUT = 10
+
 
 def create_driver():
     logger.info("크롬 드라이버 생성 중...")
@@ -55,7 +77,7 @@ def create_driver():
         options=options
     )
     driver.set_page_load_timeout(30)
-    # implicit wait 제거 - 명시적 sleep으로 처리
+    # implicit wait 제거 - 페이지별 준비 조건으로 대기
     driver.implicitly_wait(0)
     logger.info("크롬 드라이버 생성 완료")
     return driver
@@ -81,15 +103,30 @@ def parse_features(features_text):
 def extract_trim_info_from_price_tab(driver, model_id, lineup_id):
     """가격·제원·사양 탭에서 세부모델명과 가격 추출"""
     url = f"https://auto.danawa.com/auto/?Work=model&Model={model_id}&Lineup={lineup_id}&Tab=price"
+    if HTTP_FIRST:
+        html = fetch_html(url, logger=logger)
+        result = parse_price_tab(html) if html else {}
+        if result.get("name") or result.get("price"):
+            logger.debug(f"HTTP 응답에서 트림 정보 추출: {result}")
+            return result
+        logger.debug("HTTP 응답에 가격표가 없어 브라우저로 다시 시도")
+
     logger.debug(f"가격·제원·사양 페이지 접속 중: {url}")
     try:
+        throttle()
         driver.get(url)
     except Exception as e:
         logger.warning(f"페이지 로드 중 오류 발생 (계속 진행): {e}")
-    # JavaScript 렌더링 완료를 위한 명시적 대기
-    time.sleep(3)
+    # JavaScript 렌더링 완료(가격표 행)까지 대기
+    wait_until(driver, present(READY_SELECTORS["price"]), PAGE_TIMEOUT, label="danawa:price")
     logger.debug("페이지 로드 완료")
 
+    if DOM_EXTRACTION == "page_source":
+        # page_source 1회 요청 후 로컬 파싱 (요소별 WebDriver 호출 없음)
+        result = parse_price_tab(page_cache.snapshot(driver, url, save=True))
+        logger.debug(f"트림 정보 추출 (page_source): {result}")
+        return result
+
     result = {"name": "", "price": ""}
 
     # specTable 테이블 찾기
@@ -141,15 +178,30 @@ def extract_trim_info_from_price_tab(driver, model_id, lineup_id):
 def extract_spec_detail(driver, model_id, lineup_id):
     """제원·사양/옵션 탭에서 상세 제원 추출"""
     url = f"https://auto.danawa.com/auto/?Work=model&Model={model_id}&Lineup={lineup_id}&Tab=spec"
+    if HTTP_FIRST:
+        html = fetch_html(url, logger=logger)
+        data = parse_spec_tab(html) if html else {}
+        if data.get("specs"):
+            logger.debug(f"HTTP 응답에서 제원 항목 추출: {len(data['specs'])}개")
+            return data
+        logger.debug("HTTP 응답에 제원 표가 없어 브라우저로 다시 시도")
+
     logger.debug(f"제원 상세 페이지 접속 중: {url}")
     try:
+        throttle()
         driver.get(url)
     except Exception as e:
         logger.warning(f"제원 상세 페이지 로드 중 오류 발생 (계속 진행): {e}")
-    # JavaScript 렌더링 완료를 위한 명시적 대기
-    time.sleep(3)
+    # JavaScript 렌더링 완료(제원 항목 행)까지 대기
+    wait_until(driver, present(READY_SELECTORS["spec"]), PAGE_TIMEOUT, label="danawa:spec")
     logger.debug("제원 상세 페이지 로드 완료")
 
+    if DOM_EXTRACTION == "page_source":
+        # page_source 1회 요청 후 로컬 파싱 (항목마다 compareRight_N 을 찾는 RPC 제거)
+        data = parse_spec_tab(page_cache.snapshot(driver, url, save=True))
+        logger.debug(f"제원 항목 추출 완료 (page_source): {len(data['specs'])}개")
+        return data
+
     data = {"specs": {}, "trims": {"name": "", "price": ""}}
     
     # 테이블 헤더에서 트림명과 가격 추출 (<span class="trim">, <span class="price">)
@@ -283,15 +335,23 @@ def extract_model_image_url(driver, model_id, search_keyword="포터"):
     
     for keyword in search_keywords:
         url = f"https://auto.danawa.com/search/?q={quote(keyword)}"
+        if HTTP_FIRST:
+            html = fetch_html(url, logger=logger)
+            img_url = parse_search_image(html, model_id) if html else ""
+            if img_url:
+                logger.info(f"이미지 URL 추출 성공 (HTTP): {model_id} -> {img_url} (키워드: {keyword})")
+                return img_url
+
         logger.debug(f"검색 페이지 접속(이미지 추출): {url} (키워드: {keyword})")
         
         try:
+            throttle()
             driver.get(url)
         except Exception as e:
             logger.warning(f"검색 페이지 로드 중 오류 발생 (계속 진행): {e}")
             continue
         
-        time.sleep(2)
+        wait_until(driver, present(READY_SELECTORS["search"]), PAGE_TIMEOUT, label="danawa:search")
         
         css = f"ul#salesNewcarList a.image[href*='Model={model_id}'] img"
         imgs = driver.find_elements(By.CSS_SELECTOR, css)
@@ -308,17 +368,37 @@ def extract_model_image_url(driver, model_id, search_keyword="포터"):
     return ""
 
 
+def image_search_keyword(model_name):
+    """모델명 -> 이미지 검색 키워드"""
+    return "포터2 일렉트릭" if "일렉트릭" in model_name or "EV" in model_name else "포터2"
+
+
 def get_all_lineups(driver, model_id):
     """모든 라인업 ID와 이름 가져오기"""
     url = f"https://auto.danawa.com/auto/?Work=model&Model={model_id}&Tab=price"
+    if HTTP_FIRST:
+        html = fetch_html(url, logger=logger)
+        lineups = parse_lineups(html) if html else []
+        if lineups:
+            logger.info(f"총 {len(lineups)}개의 라인업 발견 (HTTP)")
+            return lineups
+        logger.debug("HTTP 응답에 라인업 목록이 없어 브라우저로 다시 시도")
+
     logger.debug(f"라인업 목록 확인을 위한 페이지 접속 중: {url}")
     try:
+        throttle()
         driver.get(url)
     except Exception as e:
         logger.warning(f"라인업 페이지 로드 중 오류 발생 (계속 진행): {e}")
-    time.sleep(3)
+    # 라인업 라디오 버튼이 그려질 때까지 대기
+    wait_until(driver, present(READY_SELECTORS["lineups"]), PAGE_TIMEOUT, label="danawa:lineups")
     logger.debug("라인업 페이지 로드 완료")
 
+    if DOM_EXTRACTION == "page_source":
+        lineups = parse_lineups(page_cache.snapshot(driver, url, save=True))
+        logger.info(f"총 {len(lineups)}개의 라인업 발견")
+        return lineups
+
     lineups = []
     radios = driver.find_elements(By.CSS_SELECTOR, "input[type='radio'][name='lineup_']")
     logger.debug(f"라인업 라디오 버튼 발견: {len(radios)}개")
@@ -385,8 +465,7 @@ def crawl_model(driver, model_id, model_name, lineup_ids=None):
     # 모델 이미지 URL 추출
     try:
         logger.info("모델 이미지 URL 추출 중...")
-        search_keyword = "포터2 일렉트릭" if "일렉트릭" in model_name or "EV" in model_name else "포터2"
-        image_url = extract_model_image_url(driver, model_id, search_keyword)
+        image_url = extract_model_image_url(driver, model_id, image_search_keyword(model_name))
         result["image_url"] = image_url
         if image_url:
             logger.info(f"이미지 URL 추출 완료: {image_url}")
@@ -470,9 +549,6 @@ def crawl_model(driver, model_id, model_name, lineup_ids=None):
                 logger.error(f"라인업 {lineup_name} 정보 추출 오류: {e}", exc_info=True)
             
             result["lineup"].append(lineup_data)
-            
-            # 각 라인업 처리 후 잠시 대기 (서버 부하 방지)
-            time.sleep(1)
         
         logger.info(f"총 {len(result['lineup'])}개의 라인업 처리 완료")
         
@@ -489,56 +565,95 @@ def main():
     명령줄 인자:
         --lineup-ids: 크롤링할 라인업 ID를 쉼표로 구분하여 지정
         예: python crawl_porter.py --lineup-ids 53592,53588
+        --workers: 병렬 모드 headless 드라이버 수 (2 이상이면 병렬 모드)
+        예: python crawl_porter.py --workers 4
+        --replay: 네트워크/브라우저 없이 페이지 캐시(data/cache/pages)만으로 결과 다시 생성
+        예: python crawl_porter.py --replay
     """
     # 명령줄 인자 파싱
     lineup_ids_arg = None
+    workers = 1
     if len(sys.argv) > 1:
         for i, arg in enumerate(sys.argv):
             if arg == "--lineup-ids" and i + 1 < len(sys.argv):
                 lineup_ids_arg = [lid.strip() for lid in sys.argv[i + 1].split(",") if lid.strip()]
                 logger.info(f"명령줄에서 지정된 라인업 ID: {lineup_ids_arg}")
-                break
+            elif arg == "--workers" and i + 1 < len(sys.argv):
+                workers = int(sys.argv[i + 1])
+                logger.info(f"병렬 모드 워커 수: {workers}")
+            elif arg == "--replay":
+                page_cache.mode = "replay"
+
+    if page_cache.replaying:
+        # 캐시 재생은 순차 모드로 (요청 간격 대기 없음)
+        logger.info("페이지 캐시 재생 모드 (네트워크/브라우저 사용 안 함)")
+        workers = 1
     
     logger.info("=" * 50)
     logger.info("포터 크롤링 시작")
     logger.info(f"대상 모델: {len(PORTER_MODELS)}개")
     logger.info("=" * 50)
     
-    driver = create_driver()
     all_results = {}
+    # 실패한 작업이 있으면 기존 결과 파일을 덮어쓰지 않음 (빈 라인업이 저장되지 않도록)
+    failed = False
 
-    try:
-        for idx, (key, model_info) in enumerate(PORTER_MODELS.items(), 1):
-            logger.info(f"\n[{idx}/{len(PORTER_MODELS)}] 모델 처리 중...")
+    if workers > 1:
+        # 병렬 모드: (모델, 라인업, 탭) 작업을 headless 드라이버 여러 개로 처리
+        try:
+            all_results, failures = crawl_models_parallel(
+                sys.modules[__name__],
+                PORTER_MODELS,
+                workers=workers,
+                lineup_ids=lineup_ids_arg,
+            )
+            failed = bool(failures)
+        except Exception as e:
+            logger.error(f"병렬 크롤링 중 치명적 오류 발생: {e}", exc_info=True)
+            failed = True
+    else:
+        # 브라우저는 HTTP 응답으로 부족한 페이지가 처음 나올 때 생성 (재생 모드는 캐시 드라이버)
+        driver = ReplayDriver() if page_cache.replaying else LazyDriver(create_driver)
+
+        try:
+            for idx, (key, model_info) in enumerate(PORTER_MODELS.items(), 1):
+                logger.info(f"\n[{idx}/{len(PORTER_MODELS)}] 모델 처리 중...")
             
-            # 라인업 ID 결정: 명령줄 인자 > MODELS 설정 > None(모든 라인업)
-            lineup_ids = lineup_ids_arg or model_info.get("lineup_ids")
+                # 라인업 ID 결정: 명령줄 인자 > MODELS 설정 > None(모든 라인업)
+                lineup_ids = lineup_ids_arg or model_info.get("lineup_ids")
             
-            model_results = crawl_model(
-                driver, 
-                model_info["id"], 
-                model_info["name"],
-                lineup_ids=lineup_ids
-            )
-            all_results[key] = model_results
-    except Exception as e:
-        logger.error(f"크롤링 중 치명적 오류 발생: {e}", exc_info=True)
-    finally:
-        logger.info("크롬 드라이버 종료 중...")
-        driver.quit()
-        logger.info("크롬 드라이버 종료 완료")
+                model_results = crawl_model(
+                    driver, 
+                    model_info["id"], 
+                    model_info["name"],
+                    lineup_ids=lineup_ids
+                )
+                all_results[key] = model_results
+        except Exception as e:
+            logger.error(f"크롤링 중 치명적 오류 발생: {e}", exc_info=True)
+            failed = True
+        finally:
+            logger.info("크롬 드라이버 종료 중...")
+            driver.quit()
+            logger.info("크롬 드라이버 종료 완료")
 
     # 결과 저장
-    logger.info("결과 저장 중...")
-    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    try:
-        with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-            json.dump(all_results, f, ensure_ascii=False, indent=2)
-        logger.info(f"결과 저장 완료: {OUTPUT_PATH}")
-        logger.info(f"저장된 모델 수: {len(all_results)}개")
-    except Exception as e:
-        logger.error(f"결과 저장 중 오류 발생: {e}", exc_info=True)
+    if failed:
+        logger.error(f"실패한 작업이 있어 결과를 저장하지 않습니다 (기존 파일 유지): {OUTPUT_PATH}")
+    else:
+        logger.info("결과 저장 중...")
+        OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+                json.dump(all_results, f, ensure_ascii=False, indent=2)
+            logger.info(f"결과 저장 완료: {OUTPUT_PATH}")
+            logger.info(f"저장된 모델 수: {len(all_results)}개")
+        except Exception as e:
+            logger.error(f"결과 저장 중 오류 발생: {e}", exc_info=True)
     
+    # 페이지별 대기 시간 집계
+    wait_stats.report(logger)
+
     logger.info("=" * 50)
     logger.info("포터 크롤링 종료")
     logger.info("=" * 50)
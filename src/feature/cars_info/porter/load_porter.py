@@ -3,6 +3,7 @@
 변환된 데이터를 DB에 저장
 """
 from src.database.db_manager import DBManager
+from src.services.cache import bump_data_version
 from src.feature.cars_info.porter.transform_porter import transform_porter_data
 
 
@@ -49,6 +50,7 @@ def load_porter_info():
                     print(f"[PORTER] 데이터 삽입 실패: {data.get('name', 'Unknown')}")
             
             db.commit()
+            bump_data_version()  # 앱의 서비스 캐시 무효화
             print(f"[PORTER] {success_count}/{len(transformed)}건 저장 완료 ✅")
             
         except Exception as e:
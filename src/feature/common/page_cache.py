@@ -0,0 +1,176 @@
+"""
+크롤러 원본 페이지 캐시 (data/cache/pages)
+(URL, variant) 키마다 받은 시각, ETag/Last-Modified, 본문 sha256을 index에 두고,
+본문은 sha256 이름의 gzip 파일 하나로 저장합니다 (같은 내용은 한 번만 저장).
+variant는 같은 URL의 다른 상태(페이지 번호, 클릭 후 화면 등)를 구분합니다.
+
+모드 (환경 변수 PAGE_CACHE_MODE, 크롤러 --replay 옵션)
+    refresh: 기본, 항상 새로 받고 저장 (HTTP는 ETag/Last-Modified로 조건부 요청, 304면 캐시 사용)
+    prefer : 캐시에 있으면 네트워크 없이 사용, 없으면 받아서 저장
+    replay : 캐시만 사용 (네트워크/브라우저 없음, 캐시에 없으면 빈 페이지)
+    off    : 캐시 사용 안 함
+"""
+import gzip
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from dotenv import load_dotenv
+
+from src.feature.common.recorded_driver import RecordedDriver
+
+# 크롤러는 db_manager를 import 하지 않으므로 여기서 .env 적재 (PAGE_CACHE_MODE)
+load_dotenv()
+
+PAGE_CACHE_DIR = Path(__file__).parent.parent.parent.parent / "data" / "cache" / "pages"
+PAGE_CACHE_MODES = ("refresh", "prefer", "replay", "off")
+PAGE_CACHE_MODE = os.getenv("PAGE_CACHE_MODE", "refresh")
+
+
+class CachedPage(NamedTuple):
+    url: str
+    variant: str
+    html: str
+    fetched_at: str
+    etag: str
+    last_modified: str
+    source: str  # http | browser
+
+
+def _atomic_write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+class PageCache:
+    def __init__(self, root=PAGE_CACHE_DIR, mode=PAGE_CACHE_MODE):
+        self.root = Path(root)
+        self.mode = mode if mode in PAGE_CACHE_MODES else "refresh"
+
+    @property
+    def enabled(self):
+        return self.mode != "off"
+
+    @property
+    def replaying(self):
+        return self.mode == "replay"
+
+    @staticmethod
+    def key(url, variant=""):
+        return hashlib.sha256(f"{url}\0{variant}".encode("utf-8")).hexdigest()
+
+    def _index_path(self, key):
+        return self.root / "index" / key[:2] / f"{key}.json"
+
+    def _object_path(self, digest):
+        return self.root / "objects" / digest[:2] / f"{digest}.html.gz"
+
+    def _read_entry(self, url, variant):
+        try:
+            with open(self._index_path(self.key(url, variant)), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, url, variant=""):
+        """
+        캐시된 페이지
+
+        Returns:
+            CachedPage | None: 없거나 본문 파일이 깨졌으면 None
+        """
+        if not self.enabled:
+            return None
+        entry = self._read_entry(url, variant)
+        if not entry:
+            return None
+
+        try:
+            raw = gzip.decompress(self._object_path(entry["sha256"]).read_bytes())
+        except (OSError, EOFError, KeyError) as e:
+            print(f"[PAGE_CACHE] 본문 읽기 실패 ❌: {url} ({variant}) - {e}")
+            return None
+        if hashlib.sha256(raw).hexdigest() != entry["sha256"]:
+            print(f"[PAGE_CACHE] 본문 체크섬 불일치 ❌: {url} ({variant})")
+            return None
+
+        return CachedPage(
+            url, variant, raw.decode("utf-8"), entry.get("fetched_at", ""),
+            entry.get("etag", ""), entry.get("last_modified", ""), entry.get("source", ""),
+        )
+
+    def put(self, url, html, variant="", etag="", last_modified="", source="http"):
+        """페이지 저장 (replay/off 모드에서는 저장하지 않음)"""
+        if not self.enabled or self.replaying or html is None:
+            return
+        raw = html.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+
+        try:
+            obj = self._object_path(digest)
+            if not obj.exists():
+                _atomic_write(obj, gzip.compress(raw, compresslevel=6))
+            entry = {
+                "url": url,
+                "variant": variant,
+                "sha256": digest,
+                "fetched_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "etag": etag or "",
+                "last_modified": last_modified or "",
+                "source": source,
+            }
+            _atomic_write(
+                self._index_path(self.key(url, variant)),
+                json.dumps(entry, ensure_ascii=False).encode("utf-8"),
+            )
+        except OSError as e:
+            print(f"[PAGE_CACHE] 저장 실패 ❌: {url} ({variant}) - {e}")
+
+    def touch(self, url, variant=""):
+        """조건부 요청 304 - 받은 시각만 갱신"""
+        entry = self._read_entry(url, variant)
+        if entry and not self.replaying:
+            entry["fetched_at"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+            try:
+                _atomic_write(
+                    self._index_path(self.key(url, variant)),
+                    json.dumps(entry, ensure_ascii=False).encode("utf-8"),
+                )
+            except OSError as e:
+                print(f"[PAGE_CACHE] 저장 실패 ❌: {url} ({variant}) - {e}")
+
+    def snapshot(self, driver, url, variant="", save=False):
+        """
+        브라우저 현재 화면 HTML(page_source 1회) 반환
+
+        save=True(크롤러가 실제 페이지를 받은 경우)일 때만 캐시에 저장합니다.
+        드라이버 종류로 판단하지 않으므로 벤치마크/점검 스크립트는 save 없이 호출하거나 mode="off"로 둡니다.
+        """
+        html = driver.page_source
+        if save:
+            self.put(url, html, variant, source="browser")
+        return html
+
+
+# 프로세스 공용 캐시 (크롤러 main에서 mode 변경)
+page_cache = PageCache()
+
+
+class ReplayDriver(RecordedDriver):
+    """get(url) 시 페이지 캐시의 HTML을 띄우는 드라이버 (replay 모드에서 브라우저 대신)"""
+
+    def __init__(self, cache=None):
+        self.cache = cache or page_cache
+        super().__init__()
+
+    def get(self, url, variant=""):
+        cached = self.cache.get(url, variant)
+        if cached is None:
+            print(f"[PAGE_CACHE] 캐시에 없는 페이지 ❌: {url} ({variant})")
+        self.load(cached.html if cached else "")
+        self.current_url = url
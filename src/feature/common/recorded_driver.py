@@ -0,0 +1,96 @@
+"""
+저장 HTML 드라이버
+BeautifulSoup 트리를 WebDriver/WebElement처럼 보여주는 정적 드라이버로, 크롤러가 쓰는 조회만 지원합니다.
+페이지 캐시 재생(page_cache.ReplayDriver)과 추출 방식 벤치마크에서 브라우저 대신 사용합니다.
+"""
+from bs4 import BeautifulSoup
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+# lxml이 있으면 사용 (없으면 내장 파서)
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# 크롤러가 쓰는 XPath -> BeautifulSoup 구현
+_XPATHS = {
+    "./ancestor::div[contains(@class, 'choice')]": lambda tag: [
+        div for div in reversed(tag.find_parents("div")) if "choice" in " ".join(div.get("class", []))
+    ],
+    ".//tr[.//span[contains(@class, 'price_sum')] or .//td[contains(text(), '합계')]]": lambda tag: [
+        tr for tr in tag.find_all("tr")
+        if tr.select_one("span.price_sum")
+        or any("합계" in s for td in tr.find_all("td") for s in td.find_all(string=True, recursive=False))
+    ],
+    "following-sibling::*[1]": lambda tag: [tag.find_next_sibling()] if tag.find_next_sibling() else [],
+    "..": lambda tag: [tag.parent] if tag.parent else [],
+}
+
+
+def _find_all(tag, by, value):
+    if by == By.CSS_SELECTOR:
+        return tag.select(value)
+    if by == By.ID:
+        return tag.select(f'[id="{value}"]')
+    if by == By.TAG_NAME:
+        return tag.find_all(value)
+    if by == By.XPATH and value in _XPATHS:
+        return _XPATHS[value](tag)
+    raise NotImplementedError(f"저장 HTML 드라이버가 지원하지 않는 조회: {by}={value}")
+
+
+class RecordedElement:
+    """BeautifulSoup 태그를 WebElement처럼 감싼 요소 (클릭 등 동작은 무시)"""
+
+    def __init__(self, tag):
+        self._tag = tag
+
+    @property
+    def text(self):
+        # 렌더링 텍스트처럼 텍스트 노드 안 공백은 한 칸으로, 노드 사이는 줄바꿈
+        return "\n".join(" ".join(text.split()) for text in self._tag.stripped_strings)
+
+    def get_attribute(self, name):
+        value = self._tag.get(name)
+        return " ".join(value) if isinstance(value, list) else value
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def click(self):
+        pass
+
+    def find_elements(self, by, value):
+        return [RecordedElement(tag) for tag in _find_all(self._tag, by, value)]
+
+    def find_element(self, by, value):
+        found = self.find_elements(by, value)
+        if not found:
+            raise NoSuchElementException(f"{by}={value}")
+        return found[0]
+
+
+class RecordedDriver(RecordedElement):
+    """get(url)은 무시하고 저장 HTML 한 페이지만 보여주는 드라이버"""
+
+    def __init__(self, html=""):
+        self.current_url = ""
+        self.load(html)
+
+    def load(self, html):
+        self.page_source = html
+        self._tag = BeautifulSoup(html, HTML_PARSER)
+
+    def get(self, url):
+        self.current_url = url
+
+    def execute_script(self, script, *args):
+        return None
+
+    def quit(self):
+        pass
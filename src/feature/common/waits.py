@@ -0,0 +1,150 @@
+"""
+Selenium 조건 대기 유틸
+고정 time.sleep 대신 페이지별 준비 조건(selector)이 충족될 때까지만 기다리고,
+라벨별 대기 시간(횟수/평균/최대/시간 초과)을 기록합니다.
+
+    rows = get_and_wait(driver, url, present("tbody#numbox>tr"), label="opinet:diesel")
+    ...
+    wait_stats.report()     # [WAIT] opinet:diesel: 1회, 평균 0.42초, 최대 0.42초
+"""
+import os
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from src.feature.common.recorded_driver import RecordedDriver
+
+DEFAULT_TIMEOUT = 10
+POLL_FREQUENCY = 0.2
+
+
+class WaitStats:
+    """라벨별 대기 시간 집계 (워커 스레드 공유)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, label, elapsed, ok):
+        with self._lock:
+            stat = self._stats.setdefault(label, {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+            stat["count"] += 1
+            stat["total"] += elapsed
+            stat["max"] = max(stat["max"], elapsed)
+            if not ok:
+                stat["timeouts"] += 1
+
+    def summary(self):
+        """{라벨: {count, total, max, timeouts}} 사본"""
+        with self._lock:
+            return {label: dict(stat) for label, stat in self._stats.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def report(self, logger=None):
+        """라벨별 집계 출력 (logger가 없으면 print)"""
+        emit = logger.info if logger else print
+        for label, stat in sorted(self.summary().items()):
+            line = (
+                f"[WAIT] {label}: {stat['count']}회, 평균 {stat['total'] / stat['count']:.2f}초, "
+                f"최대 {stat['max']:.2f}초"
+            )
+            if stat["timeouts"]:
+                line += f", 시간 초과 {stat['timeouts']}회"
+            emit(line)
+
+
+# 전역 집계 (크롤러 main 종료 시 report)
+wait_stats = WaitStats()
+
+
+def present(css):
+    """css 요소 1개 이상 존재 -> 첫 요소"""
+    return EC.presence_of_element_located((By.CSS_SELECTOR, css))
+
+
+def all_present(css):
+    """css 요소 1개 이상 존재 -> 요소 목록"""
+    return EC.presence_of_all_elements_located((By.CSS_SELECTOR, css))
+
+
+def all_visible(css):
+    """css 요소가 모두 보임 -> 요소 목록"""
+    return EC.visibility_of_all_elements_located((By.CSS_SELECTOR, css))
+
+
+def clickable(css):
+    """css 요소가 보이고 활성화됨 -> 요소"""
+    return EC.element_to_be_clickable((By.CSS_SELECTOR, css))
+
+
+def stale(element):
+    """element가 DOM에서 분리됨 (목록 다시 그리기 완료 신호)"""
+    return EC.staleness_of(element)
+
+
+def text_in(css, text):
+    """css 요소 텍스트에 text 포함"""
+    return EC.text_to_be_present_in_element((By.CSS_SELECTOR, css), text)
+
+
+def document_ready(driver):
+    """document.readyState == complete"""
+    return driver.execute_script("return document.readyState") == "complete"
+
+
+def downloads_settled(directory, expected_count):
+    """directory에 완료된 파일이 expected_count개 이상이고 진행 중(.crdownload/.tmp) 파일이 없음"""
+    def condition(driver):
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            return False
+        if any(name.endswith((".crdownload", ".tmp")) for name in names):
+            return False
+        return len(names) >= expected_count
+    return condition
+
+
+def wait_until(driver, condition, timeout=DEFAULT_TIMEOUT, label="wait", poll=POLL_FREQUENCY):
+    """
+    조건 충족까지 대기
+
+    Returns:
+        조건 반환값 (요소/목록/True), 시간 초과 시 None
+    """
+    if isinstance(driver, RecordedDriver):
+        # 저장 HTML은 바뀌지 않으므로 한 번만 확인
+        timeout = 0
+    started = time.perf_counter()
+    try:
+        value = WebDriverWait(driver, timeout, poll_frequency=poll).until(condition)
+        wait_stats.record(label, time.perf_counter() - started, True)
+        return value
+    except TimeoutException:
+        wait_stats.record(label, time.perf_counter() - started, False)
+        return None
+
+
+def get_and_wait(driver, url, condition, timeout=DEFAULT_TIMEOUT, label=None, logger=None):
+    """
+    페이지 이동 후 준비 조건까지 대기 (로드 오류는 경고만 남기고 계속 진행)
+
+    Returns:
+        wait_until과 같음
+    """
+    try:
+        driver.get(url)
+    except Exception as e:
+        message = f"페이지 로드 중 오류 발생 (계속 진행): {e}"
+        if logger:
+            logger.warning(message)
+        else:
+            print(f"[WAIT] {message}")
+    return wait_until(driver, condition, timeout, label or url)
@@ -0,0 +1,194 @@
+"""
+Selenium 드라이버 워커 풀
+작업 큐의 job을 N개 드라이버(스레드당 1개)가 나눠 처리하고, 도메인별 최소 요청 간격을 지킵니다.
+
+    with DriverWorkerPool(create_chrome_driver, workers=4, rate_limiter=DomainRateLimiter(1.0)) as pool:
+        results, errors = pool.run(jobs, handler)   # handler(driver, job) -> 결과
+"""
+import logging
+import queue
+import threading
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service as ChromeService
+
+
+_driver_path_lock = threading.Lock()
+_driver_path = None
+
+
+def _chromedriver_path():
+    """chromedriver 설치 경로 (여러 워커가 동시에 설치하지 않도록 1회만)"""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+
+            _driver_path = ChromeDriverManager().install()
+    return _driver_path
+
+
+def create_chrome_driver(headless=True, page_load_timeout=30):
+    """크롬 드라이버 생성 (워커 풀 기본 팩토리, headless 기본)"""
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+
+    driver = webdriver.Chrome(service=ChromeService(_chromedriver_path()), options=options)
+    driver.set_page_load_timeout(page_load_timeout)
+    driver.implicitly_wait(0)
+    return driver
+
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class LazyDriver:
+    """처음 사용할 때 드라이버를 만드는 래퍼 (HTTP로 끝난 작업은 브라우저를 띄우지 않음)"""
+
+    def __init__(self, driver_factory):
+        self._factory = driver_factory
+        self._driver = None
+
+    @property
+    def started(self):
+        return self._driver is not None
+
+    def __getattr__(self, name):
+        if self._driver is None:
+            self._driver = self._factory()
+        return getattr(self._driver, name)
+
+    def quit(self):
+        if self._driver is not None:
+            driver, self._driver = self._driver, None
+            driver.quit()
+
+
+class DomainRateLimiter:
+    """도메인별 최소 요청 간격 (모든 워커가 공유, 호출 순서대로 시간 슬롯 배정)"""
+
+    def __init__(self, min_interval=1.0):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = {}
+
+    def wait(self, domain):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(domain, 0.0))
+            self._next_slot[domain] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class DriverWorkerPool:
+    """
+    스레드마다 드라이버 1개를 띄워 작업 큐 처리
+
+    - 드라이버는 handler가 처음 사용할 때 생성(LazyDriver), run()이 끝나면 반납해 다음 run()에서 재사용
+    - 작업 실패 시 드라이버가 죽었을 수 있으므로 새 드라이버로 retries 회 재시도
+    - close() (또는 with 블록 종료) 시 모든 드라이버 종료
+    """
+
+    def __init__(self, driver_factory=create_chrome_driver, workers=4, rate_limiter=None,
+                 domain_of=None, retries=1, logger=None):
+        self.driver_factory = driver_factory
+        self.workers = max(1, workers)
+        self.rate_limiter = rate_limiter
+        self.domain_of = domain_of or (lambda job: "")
+        self.retries = retries
+        self.logger = logger or logging.getLogger(__name__)
+        self._idle = []
+        self._idle_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """반납된 드라이버 모두 종료"""
+        with self._idle_lock:
+            drivers, self._idle = self._idle, []
+        for driver in drivers:
+            _quit(driver)
+
+    def _acquire(self):
+        with self._idle_lock:
+            if self._idle:
+                return self._idle.pop()
+        return LazyDriver(self.driver_factory)
+
+    def _release(self, driver):
+        with self._idle_lock:
+            self._idle.append(driver)
+
+    def run(self, jobs, handler):
+        """
+        Args:
+            jobs: job 목록 (hash 가능해야 함)
+            handler: handler(driver, job) -> 결과
+
+        Returns:
+            (results, errors): {job: 결과}, {job: 마지막 예외}
+        """
+        work = queue.Queue()
+        for job in jobs:
+            work.put((job, 0))
+
+        results = {}
+        errors = {}
+        lock = threading.Lock()
+
+        def worker():
+            driver = None
+            try:
+                while True:
+                    try:
+                        job, attempt = work.get_nowait()
+                    except queue.Empty:
+                        return
+
+                    try:
+                        if driver is None:
+                            driver = self._acquire()
+                        if self.rate_limiter:
+                            self.rate_limiter.wait(self.domain_of(job))
+                        value = handler(driver, job)
+                        with lock:
+                            results[job] = value
+                    except Exception as e:
+                        self.logger.warning(f"작업 실패 ({attempt + 1}회): {job} - {e}")
+                        if driver is not None:
+                            _quit(driver)
+                            driver = None
+                        if attempt < self.retries:
+                            work.put((job, attempt + 1))
+                        else:
+                            with lock:
+                                errors[job] = e
+            finally:
+                if driver is not None:
+                    self._release(driver)
+
+        threads = [
+            threading.Thread(target=worker, name=f"crawler-worker-{i}", daemon=True)
+            for i in range(min(self.workers, max(len(jobs), 1)))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return results, errors
@@ -3,6 +3,7 @@ import time
 import json
 import re
 import os
+import sys
 from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -11,6 +12,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from bs4 import BeautifulSoup
+from src.feature.common.page_cache import ReplayDriver, page_cache
+from src.feature.common.waits import all_visible, get_and_wait, present, stale, wait_stats, wait_until
 
 # =================================================================
 # Configuration
@@ -23,47 +26,56 @@ SITES = [
     {
         "url": "https://news.seoul.go.kr/env/archives/517115", 
         "description": "Seoul Eco-friendly Truck Subsidy",
-        "parser": "parse_seoul_news"
+        "parser": "parse_seoul_news",
+        "ready": ".qna_cont"
     },
     {
         "url": "https://navyblog.kr/중고-화물차-부가세-환급받는-방법2025년-최신-faq-포함/", 
         "description": "Used Truck VAT Refund",
-        "parser": "parse_wordpress_blog"
+        "parser": "parse_wordpress_blog",
+        "ready": ".entry-content"
     },
     {
         "url": "https://dabori.co.kr/화물차-적재함-구조변경-필수-faq/", 
         "description": "Truck Structure Modification",
-        "parser": "parse_wordpress_blog"
+        "parser": "parse_wordpress_blog",
+        "ready": ".entry-content"
     },
     {
         "url": "https://www.kgta.or.kr/board/faq", 
         "description": "Freight Transport Business License",
-        "parser": "parse_kgta_style_table"
+        "parser": "parse_kgta_style_table",
+        "ready": ".faq_list"
     },
     {
         "url": "https://www.seoulta.or.kr/board/faq", 
         "description": "Seoul Trucking Association",
-        "parser": "parse_kgta_style_table"
+        "parser": "parse_kgta_style_table",
+        "ready": ".faq_list"
     },
     # {
     #     "url": "https://main.kotsa.or.kr/portal/bbs/faq_list.do?menuCode=04010100", 
     #     "description": "KOTSA (Traffic Safety)",
-    #     "parser": "parse_kotsa"
+    #     "parser": "parse_kotsa",
+    #     "ready": "div[data-bbssearch=\"page\"]"
     # },
     {
         "url": "https://ev.or.kr/nportal/partcptn/initFaqAction.do", 
         "description": "EV Charging Infrastructure",
-        "parser": "parse_ev_or_kr"
+        "parser": "parse_ev_or_kr",
+        "ready": "#pageingPosition a[id]"
     },
     {
         "url": "https://www.kia.com/kr/vehicles/kia-ev/charging/faq", 
         "description": "Kia EV Charging",
-        "parser": "parse_kia"
+        "parser": "parse_kia",
+        "ready": ".cmp-accordion__item"
     },
     {
         "url": "https://www.hyundai.com/kr/ko/digital-customer-support/helpdesk/faq", 
         "description": "Hyundai Customer Support FAQ",
-        "parser": "parse_hyundai"
+        "parser": "parse_hyundai",
+        "ready": "div.result_area dl"
     }
 ]
 
@@ -162,27 +174,76 @@ def parse_kia(soup):
             faqs.append({"question": question, "answer": answer})
     return faqs
 
-### Complex Parsers (take driver object) ###
+### Page Parsers (take one page's HTML, shared by live crawling and cache replay) ###
+
+def parse_hyundai_page(html):
+    faqs = []
+    soup = BeautifulSoup(html, 'lxml')
+    faq_items = soup.select('div.result_area div.ui_accordion dl')
+    for item in faq_items:
+        question_tag = item.select_one('dt .brief')
+        answer_tag = item.select_one('dd .exp')
+        if question_tag and answer_tag:
+            question = question_tag.get_text(strip=True)
+            answer = answer_tag.get_text("\n", strip=True)
+            if question and answer:
+                faqs.append({"question": question, "answer": answer})
+    return faqs
+
+def parse_ev_or_kr_page(html):
+    faqs = []
+    soup = BeautifulSoup(html, 'lxml')
+    for item in soup.select('div.board_faq'):
+        question_tag = item.select_one('.faq_title > div.title')
+        answer_tag = item.select_one('.faq_con > div:nth-of-type(2)')
+        if not question_tag or not answer_tag:
+            print("  - Question or answer element not found in an FAQ item.")
+            continue
+        question = question_tag.get_text(" ", strip=True)
+        answer = answer_tag.get_text("\n", strip=True)
+        if question and answer:
+            faqs.append({"question": question, "answer": answer})
+    return faqs
+
+def parse_kotsa_page(html):
+    faqs = []
+    soup = BeautifulSoup(html, 'lxml')
+    for item in soup.select('div[data-bbslist="faq"] > ul > li'):
+        question_tag = item.select_one('a') # Corrected selector
+        answer_tag = item.select_one('div[data-bbsbody="conts"]') # Corrected selector
+        if question_tag and answer_tag:
+            question_text = re.sub(r'^\\[.*?\\]\s*', '', question_tag.get_text(strip=True))
+            answer_text = answer_tag.get_text("\n", strip=True)
+            faqs.append({"question": question_text, "answer": answer_text})
+    return faqs
+
+def replay_pages(url, parse_page):
+    """Rebuild a paginated site's FAQs from cached page snapshots (page=1, 2, ...)"""
+    faqs = []
+    page_num = 1
+    while (cached := page_cache.get(url, f"page={page_num}")) is not None:
+        faqs.extend(parse_page(cached.html))
+        page_num += 1
+    print(f"  - Replayed {page_num - 1} cached pages.")
+    unique_faqs = {faq['question']: faq for faq in faqs}.values()
+    return list(unique_faqs)
+
+### Complex Parsers (take driver object and site URL) ###
+
+def parse_hyundai(driver, url):
+    if page_cache.replaying:
+        return replay_pages(url, parse_hyundai_page)
 
-def parse_hyundai(driver):
     faqs = []
     print("  - Handling pagination for Hyundai...")
+    page_num = 1
     while True:
         try:
             wait = WebDriverWait(driver, 10)
             wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'div.result_area dl')))
             
-            soup = BeautifulSoup(driver.page_source, 'lxml')
-            
-            faq_items = soup.select('div.result_area div.ui_accordion dl')
-            for item in faq_items:
-                question_tag = item.select_one('dt .brief')
-                answer_tag = item.select_one('dd .exp')
-                if question_tag and answer_tag:
-                    question = question_tag.get_text(strip=True)
-                    answer = answer_tag.get_text("\n", strip=True)
-                    if question and answer:
-                         faqs.append({"question": question, "answer": answer})
+            # One page_source per page (also stored in the page cache)
+            faqs.extend(parse_hyundai_page(page_cache.snapshot(driver, url, f"page={page_num}", save=True)))
             
             next_button = driver.find_element(By.CSS_SELECTOR, 'nav.pagination button.navi.next')
             if 'disabled' in next_button.get_attribute('class') or not next_button.is_enabled():
@@ -190,8 +251,11 @@ def parse_hyundai(driver):
                 break
             
             print("  - Clicking 'next' page.")
+            first_item = driver.find_element(By.CSS_SELECTOR, 'div.result_area dl')
             driver.execute_script("arguments[0].click();", next_button)
-            time.sleep(3)
+            # Wait until the current list is replaced by the next page
+            wait_until(driver, stale(first_item), label="hyundai:next_page")
+            page_num += 1
             
         except (NoSuchElementException, TimeoutException):
             print("  - No more 'next' buttons or list not found. Pagination finished.")
@@ -204,7 +268,10 @@ def parse_hyundai(driver):
     return list(unique_faqs)
 
 
-def parse_ev_or_kr(driver):
+def parse_ev_or_kr(driver, url):
+    if page_cache.replaying:
+        return replay_pages(url, parse_ev_or_kr_page)
+
     faqs = []
     print("  - Handling pagination for ev.or.kr...")
     
@@ -239,7 +306,6 @@ def parse_ev_or_kr(driver):
                 # Wait for the current page number to change to ensure navigation occurred
                 wait.until(EC.text_to_be_present_in_element((By.CSS_SELECTOR, '#pageingPosition a.current'), str(page_num)))
                 wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.board_faq")))
-                time.sleep(1) # Add a small sleep just in case elements are rendered quickly but not fully stable
             
             # Click all FAQ titles to expand them using JavaScript
             try:
@@ -256,45 +322,21 @@ def parse_ev_or_kr(driver):
                         driver.execute_script("arguments[0].click();", current_title_element)
                     except Exception as click_e:
                         print(f"  - Error executing JavaScript click for FAQ title {i}: {click_e}")
-                time.sleep(1) # Give time for all answers to render after clicks
+                # Wait until all expanded answers are rendered
+                wait_until(driver, all_visible("div.board_faq .faq_con"), timeout=5, label="ev_or_kr:answers")
             except Exception as e:
                 print(f"  - Error finding or clicking FAQ titles: {e}")
 
-            # After clicking, get the updated page source
-            # No need for BeautifulSoup for this part, use Selenium directly
-            faq_elements = driver.find_elements(By.CSS_SELECTOR, 'div.board_faq') # Re-find as WebElements
+            # After clicking, parse the expanded page from one page_source (also stored in the page cache)
+            page_faqs = parse_ev_or_kr_page(page_cache.snapshot(driver, url, f"page={page_num}", save=True))
 
-            if not faq_elements:
+            if not page_faqs:
                 print(f"  - No FAQ elements found on page {page_num}. Breaking.")
                 break
-            
-            # Print a debug message to confirm content visibility
-            # Let's try to get the text of the first FAQ item's title and answer using Selenium
-            try:
-                first_q_text = faq_elements[0].find_element(By.CSS_SELECTOR, '.faq_title > div.title').text
-                first_a_text = faq_elements[0].find_element(By.CSS_SELECTOR, '.faq_con > div:nth-of-type(2)').text
-                print(f"  - DEBUG: First FAQ Q: {first_q_text[:50]}...")
-                print(f"  - DEBUG: First FAQ A: {first_a_text[:50]}...")
-            except Exception as debug_e:
-                print(f"  - DEBUG: Could not get text for first FAQ item: {debug_e}")
 
-
-            for item_element in faq_elements: # Iterate through Selenium WebElements
-                try:
-                    question_element = item_element.find_element(By.CSS_SELECTOR, '.faq_title > div.title')
-                    answer_element = item_element.find_element(By.CSS_SELECTOR, '.faq_con > div:nth-of-type(2)')
-                    
-                    question = question_element.text.strip()
-                    answer = answer_element.text.strip()
-
-                    if question and answer:
-                        faqs.append({"question": question, "answer": answer})
-                except NoSuchElementException:
-                    print(f"  - Question or answer element not found in an FAQ item using new selectors.")
-                    continue
-                except Exception as e:
-                    print(f"  - Error processing an FAQ item with Selenium using new selectors: {e}")
-                    continue
+            print(f"  - DEBUG: First FAQ Q: {page_faqs[0]['question'][:50]}...")
+            print(f"  - DEBUG: First FAQ A: {page_faqs[0]['answer'][:50]}...")
+            faqs.extend(page_faqs)
 
         except TimeoutException:
             print(f"  - Timeout waiting for elements on page {page_num}. Moving to next.")
@@ -307,10 +349,10 @@ def parse_ev_or_kr(driver):
     unique_faqs = {faq['question']: faq for faq in faqs}.values()
     return list(unique_faqs)
 
-    unique_faqs = {faq['question']: faq for faq in faqs}.values()
-    return list(unique_faqs)
+def parse_kotsa(driver, url):
+    if page_cache.replaying:
+        return replay_pages(url, parse_kotsa_page)
 
-def parse_kotsa(driver):
     faqs = []
     print("  - Handling pagination for KOTSA...")
     
@@ -329,26 +371,21 @@ def parse_kotsa(driver):
         try:
             if page_num > 1:
                 # Correct JavaScript function for pagination is setPage(pageNumb)
+                first_item = driver.find_element(By.CSS_SELECTOR, 'div[data-bbslist="faq"] > ul > li')
                 driver.execute_script(f"setPage({page_num});")
-                time.sleep(1) # Reduced from 3 to 1
+                # Wait until the previous page's list is replaced
+                wait_until(driver, stale(first_item), label="kotsa:next_page")
             
             # Wait for the FAQ list to be present and (hopefully) updated
             wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'div[data-bbslist="faq"] ul')))
 
-            soup = BeautifulSoup(driver.page_source, 'lxml')
-            faq_items = soup.select('div[data-bbslist="faq"] > ul > li')
+            page_faqs = parse_kotsa_page(page_cache.snapshot(driver, url, f"page={page_num}", save=True))
 
-            if not faq_items:
+            if not page_faqs:
                 print("  - No FAQ items found on current page. Breaking loop.")
                 break
 
-            for item in faq_items:
-                question_tag = item.select_one('a') # Corrected selector
-                answer_tag = item.select_one('div[data-bbsbody="conts"]') # Corrected selector
-                if question_tag and answer_tag:
-                    question_text = re.sub(r'^\\[.*?\\]\s*', '', question_tag.get_text(strip=True))
-                    answer_text = answer_tag.get_text("\n", strip=True)
-                    faqs.append({"question": question_text, "answer": answer_text})
+            faqs.extend(page_faqs)
         except Exception as e:
             print(f"  - An error occurred during KOTSA scraping on page {page_num}: {e}")
             break
@@ -361,10 +398,14 @@ def parse_kotsa(driver):
 # =================================================================
 
 def main():
+    """Crawl all FAQ sites (--replay: rebuild all_faqs.json from the page cache without network/browser)"""
+    if "--replay" in sys.argv:
+        page_cache.mode = "replay"
+
     all_faqs = []
     service = Service()
     options = webdriver.ChromeOptions()
-    driver = webdriver.Chrome(service=service, options=options)
+    driver = ReplayDriver() if page_cache.replaying else webdriver.Chrome(service=service, options=options)
     
     print("=" * 60)
     print("🚚 FAQ Crawler Started")
@@ -375,8 +416,9 @@ def main():
             print(f"\n[{idx}/{len(SITES)}] 🌐 Processing: {site['description']}")
             site_faqs = []
             try:
-                driver.get(site["url"])
-                time.sleep(3)
+                # Wait for the site's FAQ container instead of a fixed delay
+                get_and_wait(driver, site["url"], present(site["ready"]), timeout=15, label=site["parser"])
+                html = page_cache.snapshot(driver, site["url"], save=True)
                 
 
 
@@ -387,9 +429,9 @@ def main():
 
                 # Pass driver to complex parsers, soup to simple ones
                 if site['parser'] in ['parse_hyundai', 'parse_ev_or_kr', 'parse_kotsa']:
-                    site_faqs = parser_func(driver)
+                    site_faqs = parser_func(driver, site["url"])
                 else:
-                    soup = BeautifulSoup(driver.page_source, 'lxml')
+                    soup = BeautifulSoup(html, 'lxml')
                     site_faqs = parser_func(soup)
 
                 processed_faqs = []
@@ -408,6 +450,7 @@ def main():
 
     finally:
         driver.quit()
+        wait_stats.report()
         if os.path.exists("hyundai_debug.html"):
             os.remove("hyundai_debug.html")
         if os.path.exists("ev_or_kr_debug.html"):
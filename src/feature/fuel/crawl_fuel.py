@@ -2,13 +2,15 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-import time
+from src.feature.common.page_cache import ReplayDriver, page_cache
+from src.feature.common.waits import all_present, get_and_wait, present, stale, wait_stats, wait_until
 
 def get_raw_fuel_data():
     """Opinet 및 무공해차 사이트에서 연료별 가격 리스트 수집"""
     service = Service()
     options = Options()
-    driver = webdriver.Chrome(service=service, options=options)
+    # 페이지 캐시 재생 모드면 브라우저 대신 캐시 드라이버
+    driver = ReplayDriver() if page_cache.replaying else webdriver.Chrome(service=service, options=options)
 
     data = {
         '디젤': [],
@@ -18,22 +20,27 @@ def get_raw_fuel_data():
 
     try:
         # 1. 디젤 가격 수집
-        driver.get('https://www.opinet.co.kr/user/dopospdrg/dopOsPdrgAreaView.do')
-        time.sleep(1)
-        rows = driver.find_elements(By.CSS_SELECTOR, 'tbody#numbox>tr')
+        url = 'https://www.opinet.co.kr/user/dopospdrg/dopOsPdrgAreaView.do'
+        rows = get_and_wait(driver, url, all_present('tbody#numbox>tr'), label='opinet:diesel') or []
+        page_cache.snapshot(driver, url, save=True)
         data['디젤'] = [float(r.find_elements(By.CSS_SELECTOR, 'td')[3].text.replace(',', '')) for r in rows]
 
         # 2. LPG 가격 수집
-        driver.get('https://www.opinet.co.kr/user/dopcsavsel/dopCsAreaselSelect.do')
-        time.sleep(1)
-        rows = driver.find_elements(By.CSS_SELECTOR, 'tbody#numbox>tr')
+        url = 'https://www.opinet.co.kr/user/dopcsavsel/dopCsAreaselSelect.do'
+        rows = get_and_wait(driver, url, all_present('tbody#numbox>tr'), label='opinet:lpg') or []
+        page_cache.snapshot(driver, url, save=True)
         data['LPG'] = [float(r.find_elements(By.CSS_SELECTOR, 'td')[2].text.replace(',', '')) for r in rows]
 
         # 3. 전기차 가격 수집
-        driver.get('https://ev.or.kr/nportal/evcarInfo/initEvcarChargePrice.do#')
-        time.sleep(1)
-        driver.find_element(By.XPATH, '//*[@id="selExcelCnt"]/option[5]').click() # 100개씩 보기
-        time.sleep(1)
+        url = 'https://ev.or.kr/nportal/evcarInfo/initEvcarChargePrice.do#'
+        first_row = get_and_wait(driver, url, present('table.table01>tbody>tr'), label='ev:price')
+        if not page_cache.replaying:
+            driver.find_element(By.XPATH, '//*[@id="selExcelCnt"]/option[5]').click() # 100개씩 보기
+            if first_row is not None:
+                # 기존 목록이 다시 그려질 때까지
+                wait_until(driver, stale(first_row), label='ev:page_size')
+        # 100개씩 보기 화면을 저장 (재생 시 그대로 사용)
+        page_cache.snapshot(driver, url, save=True)
         rows = driver.find_elements(By.CSS_SELECTOR, 'table.table01>tbody>tr')
         for r in rows:
             cols = r.find_elements(By.CSS_SELECTOR, 'td')
@@ -42,5 +49,6 @@ def get_raw_fuel_data():
 
     finally:
         driver.quit()
+        wait_stats.report()
     
     return data
\ No newline at end of file
@@ -1,4 +1,5 @@
 from src.database.db_manager import DBManager
+from src.services.cache import bump_data_version
 from src.feature.fuel.crawl_fuel import get_raw_fuel_data
 from src.feature.fuel.transform_fuel import transform_fuel_data
 
@@ -24,6 +25,7 @@ def load_fuel_info():
         cursor.executemany(query, transformed) # 여러 데이터를 한번에 삽입
         
         db.commit()
+        bump_data_version()  # 앱의 서비스 캐시 무효화
         print(f"[FUEL] {len(transformed)}건 저장 완료 ✅")
 
     except Exception as e:
@@ -2,7 +2,8 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-import os, time
+import os
+from src.feature.common.waits import downloads_settled, get_and_wait, present, wait_stats, wait_until
 
 
 # 경로 설정
@@ -22,8 +23,7 @@ options.add_experimental_option("prefs", {
 # 크롬 실행, 통계사이트 접속
 service = Service()
 driver = webdriver.Chrome(service=service, options=options)
-driver.get(url)
-time.sleep(1)
+get_and_wait(driver, url, present(".file-sch-list > li > a"), label="molit:list")
 
 # 엑셀 모음 박스
 excels = driver.find_elements(By.CSS_SELECTOR, ".file-sch-list > li > a")
@@ -43,12 +43,16 @@ for xl in sorted_xls:
     if ("자동차 등록" in xl.text) and (xl.text not in dwnld_files):
         print(cnt, ":", xl.text)
         dwnld_files.append(xl.text)
+        existing = len(os.listdir(abs_path)) if os.path.isdir(abs_path) else 0
         driver.execute_script("arguments[0].click()", xl)
         cnt += 1
-        time.sleep(1) # 너무 빠르게 받으면 몇개 놓침
+        # 너무 빠르게 받으면 몇개 놓침 -> 이번 파일 다운로드가 끝날 때까지 대기
+        wait_until(driver, downloads_settled(abs_path, existing + 1), timeout=30, label="molit:download")
         
 
-time.sleep(2)
+# 남은 다운로드(.crdownload) 마무리 대기
+wait_until(driver, downloads_settled(abs_path, 0), timeout=30, label="molit:finish")
+wait_stats.report()
 print("종료")
 
 
@@ -1,39 +1,168 @@
+import json
+import os
+import time
+from itertools import islice
+
 from src.database.db_manager import DBManager
+from src.feature.reg_cars.manifest import Manifest
+from src.feature.reg_cars.reg_cars_store import PARQUET_DIR, has_parquet_store, read_reg_cars
+from src.services.cache import bump_data_version
 import pandas as pd
 # from dotenv import load_dotenv
 # load_dotenv()
 
-# db
-db = DBManager()
-if not db.connect():
-    print("!!! DB 연결 실패 !!!")
-
-cursor = db.cursor
+CSV_PATH = 'data/processed/registered_cars/processed_registered_cars.csv'
+CHECKPOINT_PATH = 'data/processed/registered_cars/.load_checkpoint.json'
 
-# csv
-csv_path = 'data/processed/registered_cars/processed_registered_cars.csv'
-df = pd.read_csv(csv_path)
+# 배치 크기 (executemany가 다중 행 INSERT 한 번으로 전송)
+BATCH_SIZE = 1000
 
-
-insert_sql = """
+INSERT_SQL = """
 INSERT INTO cnt_tbl (fuel_type, region, date, cnt) VALUES (%s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE cnt = VALUES(cnt)
 """
 
-try:
-    print("[REG CARS] DB 저장 시작...")
-    for i in range(len(df)):
-        value = (df['fuel_type'][i], df['region'][i], int(df['date'][i]), int(df['cnt'][i]))
-        db.execute(insert_sql, value)
 
-    db.commit()
-    print("데이터 삽입 완료 ✅")
+def _source_signature(source):
+    # 원본이 바뀌면 체크포인트를 무효화하기 위한 식별 정보 (Parquet 디렉터리는 파일 전체 기준)
+    if os.path.isdir(source):
+        stats = [
+            os.stat(os.path.join(root, name))
+            for root, _, names in os.walk(source) for name in names
+        ]
+        size = sum(st.st_size for st in stats)
+        mtime = max((int(st.st_mtime) for st in stats), default=0)
+    else:
+        stat = os.stat(source)
+        size, mtime = stat.st_size, int(stat.st_mtime)
+    return {"source": os.path.abspath(source), "size": size, "mtime": mtime}
+
+
+def _read_checkpoint(source, checkpoint_path, dates=None):
+    """같은 원본/적재 대상 년월에 대해 이미 커밋된 행 수 반환 (없으면 0)"""
+    if not os.path.exists(checkpoint_path):
+        return 0
+
+    try:
+        with open(checkpoint_path, encoding='utf-8') as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return 0
+
+    signature = dict(_source_signature(source), dates=dates)
+    if any(saved.get(key) != value for key, value in signature.items()):
+        return 0
+    return int(saved.get("rows", 0))
+
+
+def _write_checkpoint(source, checkpoint_path, rows, dates=None):
+    data = dict(_source_signature(source), dates=dates, rows=rows)
+    tmp_path = checkpoint_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def _iter_rows(source, dates=None, chunk_size=BATCH_SIZE):
+    """원본(Parquet 데이터셋 또는 CSV)을 (fuel_type, region, date, cnt) 튜플로 순회 (dates가 있으면 해당 년월만)"""
+    if os.path.isdir(source):
+        chunks = [read_reg_cars(source, dates=dates)]
+    else:
+        chunks = pd.read_csv(source, usecols=['date', 'region', 'fuel_type', 'cnt'], chunksize=chunk_size)
+
+    for chunk in chunks:
+        if dates is not None:
+            chunk = chunk[chunk['date'].isin(dates)]
+        chunk = chunk.astype({'region': str, 'fuel_type': str, 'date': int, 'cnt': int})
+        yield from chunk[['fuel_type', 'region', 'date', 'cnt']].itertuples(index=False, name=None)
+
+
+def _iter_batches(source, skip_rows, batch_size, dates=None):
+    """skip_rows 이후 행을 batch_size 단위 리스트로 반환"""
+    rows = islice(_iter_rows(source, dates, batch_size), skip_rows, None)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def load_reg_cars_info(source=None, checkpoint_path=CHECKPOINT_PATH, batch_size=BATCH_SIZE, resume=True,
+                       incremental=True, manifest=None):
+    """
+    등록 대수 데이터 DB 일괄 저장 후 요약 테이블 갱신
+    매니페스트가 있으면 아직 적재되지 않았거나 원본이 바뀐 년월만 upsert
+
+    Args:
+        source: Parquet 데이터셋 디렉터리 또는 CSV 경로 (None이면 Parquet 우선, 없으면 CSV)
+        checkpoint_path: 배치 커밋 위치 기록 파일 (중단 후 재실행 시 이어서 적재)
+        batch_size: 배치당 행 수
+        resume: False면 체크포인트를 무시하고 처음부터 적재
+        incremental: False면 매니페스트와 무관하게 전체 적재
+        manifest: 처리 이력 (None이면 기본 경로에서 읽음)
+    """
+    if source is None:
+        source = PARQUET_DIR if has_parquet_store() else CSV_PATH
+
+    # 적재 대상 년월 (매니페스트가 비어 있으면 전체)
+    manifest = manifest or Manifest()
+    dates = manifest.pending_loads() if incremental and manifest.entries else None
+    if dates == []:
+        print("[REG CARS] 새로 적재할 달 없음")
+        return
+    if dates:
+        print(f"[REG CARS] 적재 대상 {len(dates)}개월: {dates[0]} ~ {dates[-1]}")
+
+    db = DBManager()
+    if not db.connect():
+        print("!!! DB 연결 실패 !!!")
+        return
+
+    done = _read_checkpoint(source, checkpoint_path, dates) if resume else 0
+    if done:
+        print(f"[REG CARS] 체크포인트 발견: {done}행 이후부터 이어서 적재")
+
+    loaded = 0
+    started = time.perf_counter()
+
+    try:
+        print(f"[REG CARS] DB 저장 시작... ({source})")
+        cursor = db.get_cursor()
+        for batch in _iter_batches(source, done, batch_size, dates):
+            cursor.executemany(INSERT_SQL, batch)
+            db.commit()
+
+            # upsert라 배치 단위로 재실행해도 중복되지 않음
+            loaded += len(batch)
+            _write_checkpoint(source, checkpoint_path, done + loaded, dates)
+
+        elapsed = time.perf_counter() - started
+        rate = loaded / elapsed if elapsed > 0 else 0.0
+        print(f"데이터 삽입 완료 ✅ ({loaded}행, {elapsed:.2f}초, {rate:,.0f} rows/s)")
+
+        # 대시보드용 요약 테이블 재계산
+        print("[REG CARS] 요약 테이블 갱신 시작...")
+        if db.refresh_summary_tables():
+            # 요약까지 반영된 달만 적재 완료로 기록 (갱신 실패 시 다음 실행에서 다시 대상이 되어 갱신 재시도)
+            manifest.mark_loaded(dates if dates is not None else list(manifest.entries))
+            manifest.save()
+            if os.path.exists(checkpoint_path):
+                os.remove(checkpoint_path)
+        else:
+            print("[REG CARS] 요약 테이블 갱신 실패로 적재 완료 기록 생략, 다시 실행하면 갱신 재시도 ❌")
+
+        bump_data_version()  # 앱의 서비스 캐시 무효화
+
+    except Exception as e:
+        print(f"!!! 삽입 실패 ({done + loaded}행까지 커밋됨): {e} !!!")
+        db.rollback()
+
+    finally:
+        db.close()
+        print("DB 연결 종료.")
 
-except Exception as e:
-    print(f"!!! 삽입 실패: {e} !!!")
-    db.rollback()
 
-finally:
-    db.close()
-    print("DB 연결 종료.")
+if __name__ == "__main__":
+    import sys
 
-   
\ No newline at end of file
+    load_reg_cars_info(resume='--restart' not in sys.argv, incremental='--full' not in sys.argv)
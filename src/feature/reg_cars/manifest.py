@@ -0,0 +1,73 @@
+"""
+등록 대수 ETL 매니페스트
+월별 원본 파일의 처리 이력(파일명, 년월, 해시, 행 수, 가공/적재 시각)을 기록해
+새로 추가되거나 바뀐 달만 가공/적재하도록 함
+"""
+import json
+import os
+from datetime import datetime
+
+MANIFEST_PATH = 'data/processed/registered_cars/manifest.json'
+
+
+def _now():
+    return datetime.now().isoformat(timespec='seconds')
+
+
+class Manifest:
+    """
+    년월(date) 단위 처리 이력
+
+    entries = {
+        "201601": {
+            "file": "2016년_1월_자동차_등록자료_통계.xlsx",
+            "sha1": "...",            # 가공 시점 원본 해시
+            "rows": 32,               # 가공 결과 행 수
+            "transformed_at": "...",
+            "loaded_sha1": "...",     # DB 적재 시점 원본 해시 (없으면 미적재)
+            "loaded_at": "...",
+        },
+    }
+    """
+
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = path
+        self.entries = self._read()
+
+    def _read(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f).get('months', {})
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'months': dict(sorted(self.entries.items()))}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def record_transform(self, date_key, file_name, sha1, rows):
+        """가공 결과 기록 (원본이 바뀌었으면 적재 대상이 됨)"""
+        entry = self.entries.setdefault(str(date_key), {})
+        changed = entry.get('sha1') != sha1 or entry.get('rows') != rows
+        entry.update({'file': file_name, 'sha1': sha1, 'rows': rows})
+        if changed or 'transformed_at' not in entry:
+            entry['transformed_at'] = _now()
+        return changed
+
+    def pending_loads(self):
+        """가공은 됐지만 아직 DB에 적재되지 않았거나 원본이 바뀐 년월 목록"""
+        return sorted(
+            int(date_key) for date_key, entry in self.entries.items()
+            if entry.get('sha1') and entry.get('loaded_sha1') != entry.get('sha1')
+        )
+
+    def mark_loaded(self, date_keys):
+        loaded_at = _now()
+        for date_key in date_keys:
+            entry = self.entries.get(str(date_key))
+            if entry:
+                entry['loaded_sha1'] = entry.get('sha1')
+                entry['loaded_at'] = loaded_at
@@ -0,0 +1,87 @@
+"""
+등록 대수 Parquet 저장소
+가공된 등록 대수 데이터를 연도별 파티션(year=YYYY) 데이터셋으로 저장/조회
+"""
+import os
+import shutil
+
+import pandas as pd
+
+PARQUET_DIR = 'data/processed/registered_cars/parquet'
+
+COLUMNS = ['date', 'region', 'fuel_type', 'cnt']
+
+
+def to_store_frame(df):
+    """저장용 dtype 변환 (region/fuel_type 범주형, date/cnt int32, 파티션용 year)"""
+    frame = df[COLUMNS].copy()
+    frame['date'] = frame['date'].astype('int32')
+    frame['cnt'] = frame['cnt'].astype('int32')
+    frame['region'] = frame['region'].astype('category')
+    frame['fuel_type'] = frame['fuel_type'].astype('category')
+    frame['year'] = (frame['date'] // 100).astype('int16')
+    return frame
+
+
+def write_reg_cars_parquet(df, root=PARQUET_DIR):
+    """
+    연도별 파티션 Parquet 데이터셋으로 저장 (기존 데이터셋은 교체)
+
+    Args:
+        df: date, region, fuel_type, cnt 컬럼을 가진 DataFrame
+        root: 데이터셋 경로
+    """
+    tmp_root = root + '.tmp'
+    shutil.rmtree(tmp_root, ignore_errors=True)
+
+    to_store_frame(df).to_parquet(tmp_root, engine='pyarrow', partition_cols=['year'], index=False)
+
+    # 다 쓴 뒤 교체 (쓰는 도중 읽는 쪽이 반쯤 쓰인 데이터셋을 보지 않도록)
+    shutil.rmtree(root, ignore_errors=True)
+    os.replace(tmp_root, root)
+    print(f"Data saved: {root}")
+
+
+def read_reg_cars(root=PARQUET_DIR, years=None, date_from=None, date_to=None,
+                  dates=None, regions=None, fuel_types=None, columns=None):
+    """
+    Parquet 데이터셋 조회 (조건은 파티션/행 그룹 단위로 먼저 걸러짐)
+
+    Args:
+        years: 연도 목록 (파티션 단위로 읽기 제외)
+        date_from, date_to: 년월 범위 (포함)
+        dates: 년월 목록
+        regions: 지역 목록
+        fuel_types: 연료 목록
+        columns: 읽을 컬럼 (None이면 date, region, fuel_type, cnt)
+
+    Returns:
+        DataFrame: date 순으로 정렬된 결과
+    """
+    filters = []
+    if years:
+        filters.append(('year', 'in', [int(y) for y in years]))
+    if date_from is not None:
+        filters.append(('date', '>=', int(date_from)))
+    if date_to is not None:
+        filters.append(('date', '<=', int(date_to)))
+    if dates:
+        filters.append(('year', 'in', sorted({int(d) // 100 for d in dates})))
+        filters.append(('date', 'in', [int(d) for d in dates]))
+    if regions:
+        filters.append(('region', 'in', list(regions)))
+    if fuel_types:
+        filters.append(('fuel_type', 'in', list(fuel_types)))
+
+    columns = list(columns or COLUMNS)
+    df = pd.read_parquet(root, engine='pyarrow', columns=columns, filters=filters or None)
+
+    sort_keys = [c for c in ('date', 'region', 'fuel_type') if c in df.columns]
+    if sort_keys:
+        df = df.sort_values(sort_keys, kind='stable')
+    return df.reset_index(drop=True)
+
+
+def has_parquet_store(root=PARQUET_DIR):
+    """Parquet 데이터셋 존재 여부"""
+    return os.path.isdir(root) and any(name.startswith('year=') for name in os.listdir(root))
@@ -1,135 +1,464 @@
-import pandas as pd
+import hashlib
+import json
 import os
+import posixpath
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import pandas as pd
+
+from src.feature.reg_cars.manifest import Manifest
+from src.feature.reg_cars.reg_cars_store import PARQUET_DIR, has_parquet_store, write_reg_cars_parquet
+
+DATA_PATH = 'data/raw/registered_cars' # 프로젝트 루트 기준 상대 경로
+OUTPUT_DIR = 'data/processed/registered_cars'
+OUTPUT_FILE = 'processed_registered_cars.csv'
 
-data_path = 'data/raw/registered_cars' # 프로젝트 루트 기준 상대 경로
+# 월별 파싱 결과 캐시 (파일 해시 + 읽기 방식 기준, 변경/신규 파일만 재파싱)
+CACHE_DIR = 'data/cache/reg_cars'
+CACHE_INDEX = 'index.json'
+# 파싱 로직이 바뀌면 올려서 기존 캐시 무효화 (2: 스트리밍 읽기 기본값, r 속성 생략 처리)
+PARSER_VERSION = 2
 
-# 경로에서 엑셀 파일들 긁어오기
-all_files = os.listdir(data_path)
-xl_names = [f for f in all_files if f.endswith('.xlsx')]
-xl_files = [os.path.join(data_path, f) for f in xl_names]
+# 엑셀 읽기 방식 ('stream': 타겟 시트 XML 스트리밍, 'pandas': pd.read_excel 전체 로드)
+DEFAULT_READER = 'stream'
 
-# for xl in xl_files:
-#     print(xl)
+# 타겟 시트 이름 키워드 / 지역명이 적힌 헤더 행 위치
+TARGET_SHEET_KEYWORD = '연료별'
+REGION_HEADER_IDX = 2
 
+# 원본 시트의 17개 시도 컬럼
+REGIONS = ['서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종', '경기', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주']
+
+# 지역 8도 기준으로 통일
+REGION_MAP = {
+    '서울': '서울', '인천': '인천', '경기': '경기', '강원': '강원', '제주': '제주',
+    '충북': '충청', '충남': '충청', '대전': '충청', '세종': '충청',
+    '전북': '전라', '전남': '전라', '광주': '전라',
+    '경북': '경상', '경남': '경상', '부산': '경상', '대구': '경상', '울산': '경상'
+}
+
+# 4가지 연료(디젤, LPG, 전기, 기타) 기준으로 통일
+FUEL_MAP = {
+    '경유': '디젤',
+    '엘피지': 'LPG',
+    '전기': '전기',
+    # --- 아래는 모두 '기타'로 통합 ---
+    '휘발유': '기타',
+    'CNG': '기타',
+    '등유': '기타',
+    'LNG': '기타',
+    '수소': '기타',
+    '수소전기': '기타',
+    '하이브리드(휘발유+전기)': '기타',
+    '하이브리드(경유+전기)': '기타',
+    '하이브리드(LPG+전기)': '기타',
+    '하이브리드(CNG+전기)': '기타',
+    '하이브리드(LNG+전기)': '기타',
+    '기타연료': '기타',
+    '알코올': '기타',
+    '태양열': '기타'
+}
 
-all_processed_df = []
 
-print("Starting processing")
+def list_monthly_files(data_path=DATA_PATH):
+    """경로에서 월별 엑셀 파일 경로 목록 반환"""
+    xl_names = sorted(f for f in os.listdir(data_path) if f.endswith('.xlsx'))
+    return [os.path.join(data_path, f) for f in xl_names]
 
-# 각 엑셀 파일 순회
-for file_path in xl_files:
-    file_name = os.path.basename(file_path) # 이름 빼기
-    print(f"Processing: {file_name}")
 
-    # date값 저장 (년, 월) => date_key
-    base_name = os.path.splitext(file_name)[0]
+def parse_date_key(file_name):
+    """'2016년_1월_...xlsx' -> '201601'"""
+    base_name = os.path.splitext(os.path.basename(file_name))[0]
     year = base_name.split('년_')[0]
     month = base_name.split('년_')[1].split('월')[0]
-    if len(month) != 2:
-        month = '0' + month
-    
-    date_key = f"{year}{month}"
-    
+    return f"{year}{month.zfill(2)}"
+
+
+def _melt_rows(rows, date_key):
+    # (fuel_type, region, cnt) 행 목록 -> 파싱 결과 DataFrame
+    df = pd.DataFrame(rows, columns=['fuel_type', 'region', 'cnt'])
+    df['date'] = date_key
+    return df[['date', 'region', 'fuel_type', 'cnt']]
+
+
+# xlsx(OOXML) 네임스페이스
+_NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_NS_PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+_CELL_REF = re.compile(r'([A-Z]+)(\d+)')
+
+
+def _col_index(letters):
+    # 'A' -> 0, 'AB' -> 27
+    idx = 0
+    for ch in letters:
+        idx = idx * 26 + (ord(ch) - 64)
+    return idx - 1
+
+
+def _find_sheet_path(zf, keyword):
+    """workbook.xml에서 keyword가 포함된 시트의 XML 경로 반환"""
+    workbook = ET.fromstring(zf.read('xl/workbook.xml'))
+    rels = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+    targets = {rel.get('Id'): rel.get('Target') for rel in rels.iter(f'{_NS_PKG_REL}Relationship')}
+
+    for sheet in workbook.iter(f'{_NS_MAIN}sheet'):
+        if keyword in sheet.get('name', ''):
+            target = targets[sheet.get(f'{_NS_REL}id')]
+            return target.lstrip('/') if target.startswith('/') else posixpath.join('xl', target)
+    return None
+
+
+def _read_shared_strings(zf):
+    if 'xl/sharedStrings.xml' not in zf.namelist():
+        return []
+    root = ET.fromstring(zf.read('xl/sharedStrings.xml'))
+    return [''.join(t.text or '' for t in si.iter(f'{_NS_MAIN}t')) for si in root.iter(f'{_NS_MAIN}si')]
+
+
+def _cell_value(cell, shared_strings):
+    cell_type = cell.get('t')
+    if cell_type == 'inlineStr':
+        return ''.join(t.text or '' for t in cell.iter(f'{_NS_MAIN}t'))
+
+    value = cell.findtext(f'{_NS_MAIN}v')
+    if value is None:
+        return None
+    if cell_type == 's':
+        return shared_strings[int(value)]
+    if cell_type in ('str', 'e'):
+        return value
+    if cell_type == 'b':
+        return value == '1'
+
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+
+def _iter_sheet_rows(zf, sheet_path, shared_strings, min_row, max_col):
+    """
+    시트 XML을 행 단위로 파싱해 (값 튜플) 반환, 처리한 행은 바로 해제
+    행/셀의 r 속성은 OOXML에서 생략 가능 -> 생략되면 직전 행/셀 다음 위치로 계산
+    """
+    row_num = 0
+    with zf.open(sheet_path) as f:
+        for _, elem in ET.iterparse(f):
+            if elem.tag != f'{_NS_MAIN}row':
+                continue
+
+            row_num = int(elem.get('r') or row_num + 1)
+            if row_num >= min_row:
+                values = [None] * max_col
+                col = -1
+                for cell in elem.iter(f'{_NS_MAIN}c'):
+                    match = _CELL_REF.match(cell.get('r', ''))
+                    col = _col_index(match.group(1)) if match else col + 1
+                    if 0 <= col < max_col:
+                        values[col] = _cell_value(cell, shared_strings)
+                yield tuple(values)
+
+            elem.clear()
+
+
+def read_sheet_streaming(file_path):
+    """
+    타겟 시트 XML만 행 단위로 스트리밍해 읽기
+    스타일/다른 시트는 열지 않고, 화물/계 행의 17개 시도 값만 남김
+
+    Returns:
+        DataFrame: date, region(17개 시도), fuel_type(원본 연료명), cnt
+    """
+    file_name = os.path.basename(file_path)
+    date_key = parse_date_key(file_name)
+
+    with zipfile.ZipFile(file_path) as zf:
+        sheet_path = _find_sheet_path(zf, TARGET_SHEET_KEYWORD)
+        if not sheet_path:
+            print(f"!!! 타겟 시트를 찾지 못함: {file_name} !!!")
+            return None
+
+        shared_strings = _read_shared_strings(zf)
+        # 헤더 행 이후만, 열은 시트 전체 폭(16384)이 아닌 필요한 범위까지만 읽음
+        rows = _iter_sheet_rows(zf, sheet_path, shared_strings, min_row=REGION_HEADER_IDX + 1, max_col=64)
+
+        # 헤더 행에서 지역 컬럼 위치 확인
+        header = next(rows)
+        region_cols = [(header.index(region), region) for region in REGIONS]
+
+        result = []
+        fuel_type = car_type = None
+        for row in rows:
+            # 병합 셀 (pd.ffill과 동일하게 빈 셀만 이전 값으로 채움)
+            if row[0] is not None:
+                fuel_type = row[0]
+            if row[1] is not None:
+                car_type = row[1]
+
+            if car_type != '화물' or row[2] != '계' or '계' in str(fuel_type):
+                continue
+
+            result.extend((fuel_type, region, row[idx]) for idx, region in region_cols)
+
+    return _melt_rows(result, date_key)
+
+
+def read_sheet_pandas(file_path):
+    """
+    pd.read_excel로 타겟 시트 전체를 읽은 뒤 필터링 (기존 방식)
+
+    Returns:
+        DataFrame: date, region(17개 시도), fuel_type(원본 연료명), cnt
+    """
+    file_name = os.path.basename(file_path)
+    date_key = parse_date_key(file_name)
 
     xls = pd.ExcelFile(file_path)
+
     # 파일 내 시트명 순회
+    target_sheet_name = None
     for sheet_name in xls.sheet_names:
-        if '연료별' in sheet_name:
+        if TARGET_SHEET_KEYWORD in sheet_name:
             target_sheet_name = sheet_name
             break
-    
-    if not target_sheet_name:
-        print("!!! 타겟 시트를 찾지 못함 !!!")
-        continue
 
+    if not target_sheet_name:
+        print(f"!!! 타겟 시트를 찾지 못함: {file_name} !!!")
+        return None
 
-    region_header_idx = 2
-    df = pd.read_excel(xls, sheet_name=target_sheet_name, header=region_header_idx)
+    df = pd.read_excel(xls, sheet_name=target_sheet_name, header=REGION_HEADER_IDX)
 
     # 1. 필수 컬럼명 변경
     df.rename(columns={df.columns[0]: 'fuel_type', df.columns[1]: 'type', df.columns[2]: 'usage'}, inplace=True)
 
-    # 2. 필요한 지역 컬럼만 명시적으로 선택 (가장 안정적인 방법)
-    # 이렇게 하면 '계'나 다른 불필요한 컬럼이 있어도 무시됨
-    regions = ['서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종', '경기', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주']
-    columns_to_keep = ['fuel_type', 'type', 'usage'] + regions
-    df = df[columns_to_keep]
+    # 2. 필요한 지역 컬럼만 명시적으로 선택
+    df = df[['fuel_type', 'type', 'usage'] + REGIONS]
 
-    # 3. 이후 로직 진행
+    # 3. 병합 셀 채우고 화물/계 행만 선택
     df['fuel_type'] = df['fuel_type'].ffill()
     df['type'] = df['type'].ffill()
 
     df_filtered = df[(df['type'] == '화물') & (df['usage'] == '계')].copy()
-    # print(df_filtered)
 
-    id_vars = ['fuel_type']
-    value_vars = [col for col in df_filtered.columns if col not in ['fuel_type', 'type', 'usage']]
-    df_melted = df_filtered.melt(id_vars=id_vars, value_vars=value_vars, var_name='region', value_name='cnt')
+    df_melted = df_filtered.melt(id_vars=['fuel_type'], value_vars=REGIONS, var_name='region', value_name='cnt')
     df_melted['date'] = date_key
-    # print(df_melted)
 
     # '계'가 작성된 부분 삭제.
     df_melted = df_melted[~df_melted['fuel_type'].astype(str).str.contains('계')]
     df_melted = df_melted[~df_melted['region'].astype(str).str.contains('계')]
-    # print(df_melted)
-    processed_df = df_melted[['date', 'region', 'fuel_type', 'cnt']]
-    all_processed_df.append(processed_df)
 
-# 각 df를 전부 concat, 데이터 타입 통일
-result_df = pd.concat(all_processed_df, ignore_index=True)
-result_df['date'] = pd.to_numeric(result_df['date'])
-result_df['cnt'] = pd.to_numeric(result_df['cnt'])
+    return df_melted[['date', 'region', 'fuel_type', 'cnt']].reset_index(drop=True)
 
-# 지역 8도 기준으로 통일
-region_map = {
-    '서울': '서울', '인천': '인천', '경기': '경기', '강원': '강원', '제주': '제주',
-    '충북': '충청', '충남': '충청', '대전': '충청', '세종': '충청',
-    '전북': '전라', '전남': '전라', '광주': '전라',
-    '경북': '경상', '경남': '경상', '부산': '경상', '대구': '경상', '울산': '경상'
+
+READERS = {
+    'stream': read_sheet_streaming,
+    'pandas': read_sheet_pandas,
 }
-result_df['region'] = result_df['region'].map(region_map)
 
-# 8도로 줄어든 region에 따라 공통된 값을 하나로 합침
-result_df = result_df.groupby(['date', 'region', 'fuel_type'])['cnt'].sum().reset_index()
 
+def parse_monthly_file(file_path, reader=DEFAULT_READER):
+    """월별 엑셀 1개 파싱 (reader: 'stream' 또는 'pandas')"""
+    return READERS[reader](file_path)
 
-# 4가지 연료(디젤, LPG, 전기, 기타) 기준으로 통일
-fuel_map = {
-    '경유': '디젤',
-    '엘피지': 'LPG',
-    '전기': '전기',
-    # --- 아래는 모두 '기타'로 통합 ---
-    '휘발유': '기타',
-    'CNG': '기타',
-    '등유': '기타',
-    'LNG': '기타',
-    '수소': '기타',
-    '수소전기': '기타',
-    '하이브리드(휘발유+전기)': '기타',
-    '하이브리드(경유+전기)': '기타',
-    '하이브리드(LPG+전기)': '기타',
-    '하이브리드(CNG+전기)': '기타',
-    '하이브리드(LNG+전기)': '기타',
-    '기타연료': '기타',
-    '알코올': '기타',
-    '태양열': '기타'
-}
-result_df['fuel_type'] = result_df['fuel_type'].map(fuel_map)
 
-# 4개로 줄어든 fuel_type에 따라 공통된 값을 하나로 합침
-result_df = result_df.groupby(['date', 'region', 'fuel_type'])['cnt'].sum().reset_index()
+def _file_hash(file_path):
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """
+    월별 파싱 결과 캐시
+
+    - 파일 크기/수정 시각이 인덱스와 같으면 해시 계산 생략
+    - 다르면 해시를 다시 계산해 같은 내용이면 기존 결과 재사용
+    - 결과는 읽기 방식(reader)별로 따로 저장 (stream/pandas 결과를 섞어 쓰지 않음)
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, reader=DEFAULT_READER):
+        self.cache_dir = cache_dir
+        self.reader = reader
+        self.index_path = os.path.join(cache_dir, CACHE_INDEX)
+        self.index = self._read_index()
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if index.get('version') != PARSER_VERSION:
+            return {}
+        return index.get('files', {})
+
+    def _result_path(self, digest):
+        return os.path.join(self.cache_dir, f"{digest}.{self.reader}.pkl")
+
+    def file_key(self, file_path):
+        """파일 해시 반환 (크기/수정 시각이 같으면 인덱스 값 사용)"""
+        stat = os.stat(file_path)
+        entry = self.index.get(os.path.basename(file_path))
+        if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns:
+            return entry['sha1']
+
+        digest = _file_hash(file_path)
+        self.index[os.path.basename(file_path)] = {
+            'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'sha1': digest,
+        }
+        return digest
+
+    def get(self, file_path):
+        result_path = self._result_path(self.file_key(file_path))
+        if not os.path.exists(result_path):
+            return None
+        try:
+            return pd.read_pickle(result_path)
+        except Exception:
+            return None
+
+    def put(self, file_path, df):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        df.to_pickle(self._result_path(self.file_key(file_path)))
+
+    def save(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': PARSER_VERSION, 'files': self.index}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+
+
+def parse_monthly_files(xl_files, workers=None, use_cache=True, reader=DEFAULT_READER):
+    """
+    월별 엑셀 파일들을 파싱 (캐시에 없는 파일만 프로세스 풀로 병렬 파싱)
+
+    Args:
+        xl_files: 엑셀 파일 경로 목록
+        workers: 프로세스 수 (None이면 CPU 수)
+        use_cache: False면 모든 파일 재파싱
+        reader: 엑셀 읽기 방식 ('stream' 또는 'pandas')
+
+    Returns:
+        dict[str, DataFrame]: 파일 경로별 파싱 결과 (xl_files 순서)
+    """
+    cache = ParseCache(reader=reader) if use_cache else None
+
+    results = {}
+    pending = []
+    for file_path in xl_files:
+        cached = cache.get(file_path) if cache else None
+        if cached is not None:
+            results[file_path] = cached
+        else:
+            pending.append(file_path)
+
+    print(f"[REG CARS] 캐시 사용 {len(results)}개, 파싱 대상 {len(pending)}개")
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for file_path, df in zip(pending, executor.map(partial(parse_monthly_file, reader=reader), pending)):
+                print(f"Processed: {os.path.basename(file_path)}")
+                if df is None:
+                    continue
+                results[file_path] = df
+                if cache:
+                    cache.put(file_path, df)
+
+    if cache:
+        cache.save()
+
+    return {f: results[f] for f in xl_files if f in results}
+
+
+def normalize_reg_cars(frames):
+    """파일별 파싱 결과를 합쳐 8도/4연료 기준으로 집계"""
+    result_df = pd.concat(frames, ignore_index=True)
+    result_df['date'] = pd.to_numeric(result_df['date'])
+    result_df['cnt'] = pd.to_numeric(result_df['cnt'])
+
+    # 8도로 줄어든 region에 따라 공통된 값을 하나로 합침
+    result_df['region'] = result_df['region'].map(REGION_MAP)
+    result_df = result_df.groupby(['date', 'region', 'fuel_type'])['cnt'].sum().reset_index()
+
+    # 4개로 줄어든 fuel_type에 따라 공통된 값을 하나로 합침
+    result_df['fuel_type'] = result_df['fuel_type'].map(FUEL_MAP)
+    result_df = result_df.groupby(['date', 'region', 'fuel_type'])['cnt'].sum().reset_index()
+
+    return result_df
+
+
+def update_manifest(manifest, parsed, result_df):
+    """
+    월별 가공 결과를 매니페스트에 기록
+
+    Returns:
+        list[int]: 새로 추가되었거나 원본이 바뀐 년월 목록
+    """
+    cache = ParseCache()
+    rows_per_date = result_df.groupby('date').size()
+
+    changed = []
+    for file_path in parsed:
+        date_key = int(parse_date_key(file_path))
+        rows = int(rows_per_date.get(date_key, 0))
+        if manifest.record_transform(date_key, os.path.basename(file_path), cache.file_key(file_path), rows):
+            changed.append(date_key)
+
+    cache.save()
+    return changed
+
+
+def transform_reg_cars_data(data_path=DATA_PATH, output_dir=OUTPUT_DIR, parquet_dir=PARQUET_DIR,
+                            workers=None, use_cache=True, reader=DEFAULT_READER, manifest=None):
+    """
+    월별 등록 통계 엑셀 -> 가공 CSV + 연도별 Parquet 데이터셋 저장
+    매니페스트 기준으로 바뀐 달이 없고 결과 파일이 있으면 저장을 생략
+    """
+    print("Starting processing")
+
+    parsed = parse_monthly_files(
+        list_monthly_files(data_path), workers=workers, use_cache=use_cache, reader=reader,
+    )
+    if not parsed:
+        print("!!! 처리할 파일이 없음 !!!")
+        return None
+
+    result_df = normalize_reg_cars(list(parsed.values()))
+
+    manifest = manifest or Manifest()
+    changed = update_manifest(manifest, parsed, result_df)
+
+    print("\nProcess complete")
+
+    output_file_path = os.path.join(output_dir, OUTPUT_FILE)
+    if not changed and os.path.exists(output_file_path) and has_parquet_store(parquet_dir):
+        print("[REG CARS] 새로 추가/변경된 달 없음, 저장 생략")
+        manifest.save()
+        return result_df
+
+    print(f"[REG CARS] 새로 추가/변경된 달 {len(changed)}개: {changed[:12]}{' ...' if len(changed) > 12 else ''}")
+
+    # CSV 파일로 저장
+    os.makedirs(output_dir, exist_ok=True)
+    result_df.to_csv(output_file_path, index=False, encoding='utf-8-sig')
+    print(f"Data saved: {output_file_path}")
 
-print("\nProcess complete")
-print("\n\n")
+    # 분석/적재용 Parquet 데이터셋 (연도별 파티션)
+    write_reg_cars_parquet(result_df, parquet_dir)
 
-# CSV 파일로 저장
-output_dir = 'data/processed/registered_cars' # 프로젝트 루트 기준 상대 경로
-os.makedirs(output_dir, exist_ok=True)
-output_file_path = os.path.join(output_dir, 'processed_registered_cars.csv')
-result_df.to_csv(output_file_path, index=False, encoding='utf-8-sig')
-print(f"Data saved: {output_file_path}")
+    # 결과 파일을 다 쓴 뒤 기록 (중간 실패 시 다음 실행에서 다시 저장)
+    manifest.save()
 
+    return result_df
 
-    
 
+if __name__ == '__main__':
+    import sys
 
+    transform_reg_cars_data(use_cache='--no-cache' not in sys.argv)
@@ -2,18 +2,21 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-import time
+from src.feature.common.page_cache import ReplayDriver, page_cache
+from src.feature.common.waits import get_and_wait, present, wait_stats
 
 def get_raw_region_data():
     """차지인포 사이트에서 지역명과 충전소 개수 리스트 수집"""
     service = Service()
     options = Options()
-    driver = webdriver.Chrome(service=service, options=options)
+    # 페이지 캐시 재생 모드면 브라우저 대신 캐시 드라이버
+    driver = ReplayDriver() if page_cache.replaying else webdriver.Chrome(service=service, options=options)
     
     try:
         url = 'https://chargeinfo.ksga.org/front/statistics/charger'
-        driver.get(url)
-        time.sleep(1)
+        # 통계 표 첫 행(충전소 개수)이 그려질 때까지 대기
+        get_and_wait(driver, url, present('tbody#tBodyList>tr td'), label='chargeinfo:charger')
+        page_cache.snapshot(driver, url, save=True)
         
         # 1. 지역 이름 수집
         region_row = driver.find_elements(By.CSS_SELECTOR, 'table.datatable>thead>tr>th')
@@ -27,4 +30,5 @@ def get_raw_region_data():
         return regions, counts
 
     finally:
-        driver.quit()
\ No newline at end of file
+        driver.quit()
+        wait_stats.report()
\ No newline at end of file
@@ -1,4 +1,5 @@
 from src.database.db_manager import DBManager
+from src.services.cache import bump_data_version
 from src.feature.region.crawl_region import get_raw_region_data
 from src.feature.region.transform_region import transform_region_data
 
@@ -29,6 +30,7 @@ def load_region_info():
         cursor.executemany(query, transformed) # 한꺼번에 삽입
         
         db.commit()
+        bump_data_version()  # 앱의 서비스 캐시 무효화
         print(f"[REGION] {len(transformed)}개 지역 데이터 저장 완료 ✅")
 
     except Exception as e:
@@ -0,0 +1,154 @@
+"""
+다나와 브라우저 폴백 추출 방식 벤치마크
+저장 HTML(data/fixtures/danawa)을 드라이버에 띄워 crawl_porter 의 extract_* 를 두 방식으로 실행하고
+WebDriver 호출(RPC) 수와 시간을 비교합니다.
+
+    elements    : 기존 방식 (행/셀마다 find_element, .text, get_attribute)
+    page_source : page_source 1회 요청 후 danawa_http.parse_* 로 로컬 파싱
+
+    python -m src.scripts.bench_danawa_extraction              # 기록 페이지 드라이버 (크롬 불필요)
+    python -m src.scripts.bench_danawa_extraction --rows 200   # 제원 항목 수 (실제 페이지는 100개 이상)
+    python -m src.scripts.bench_danawa_extraction --live       # 실제 headless 크롬 (file:// 로 fixture 열기)
+
+기록 페이지 드라이버(recorded_driver)는 BeautifulSoup 위에서 크롤러가 쓰는 selector만 흉내 내므로 시간은 로컬 처리 시간이고,
+예상 시간은 RPC 수 x --rpc-ms(크롬드라이버 왕복 시간)를 더한 값입니다.
+"""
+import argparse
+import copy
+import time
+
+from bs4 import BeautifulSoup
+
+import src.feature.cars_info.porter.crawl_porter as crawler
+from src.feature.cars_info import danawa_http
+from src.feature.common.page_cache import page_cache
+from src.feature.common.recorded_driver import HTML_PARSER, RecordedDriver
+from src.scripts.check_danawa_parsers import FIXTURE_DIR
+
+MODES = ('elements', 'page_source')
+BENCH_DIR = FIXTURE_DIR.parent.parent / 'cache' / 'danawa_bench'
+
+class FixtureDriver:
+    """실제 드라이버에서 get(url) 대신 fixture 파일을 여는 래퍼 (--live)"""
+
+    def __init__(self, driver, path):
+        self._driver = driver
+        self._uri = path.resolve().as_uri()
+
+    def get(self, url):
+        self._driver.get(self._uri)
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+
+class CountingProxy:
+    """드라이버/요소 호출마다 RPC 1회로 세는 프록시 (메서드 호출, 속성 읽기 모두)"""
+
+    def __init__(self, target, counter):
+        self._target = target
+        self._counter = counter
+
+    def _wrap(self, value):
+        if isinstance(value, list):
+            return [self._wrap(v) for v in value]
+        if hasattr(value, 'find_elements'):
+            return CountingProxy(value, self._counter)
+        return value
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        if callable(value):
+            def call(*args, **kwargs):
+                self._counter[0] += 1
+                return self._wrap(value(*args, **kwargs))
+            return call
+        self._counter[0] += 1
+        return value
+
+
+def expand_spec_rows(html, rows):
+    """제원 fixture의 항목 행을 rows개로 늘린 HTML (실제 제원 페이지 규모 재현)"""
+    if rows <= 0:
+        return html
+    soup = BeautifulSoup(html, HTML_PARSER)
+    lefts = soup.select("tr[id^='compareLeft_']")
+    rights = soup.select("tr[id^='compareRight_']")
+    for i in range(len(lefts), rows):
+        left = copy.copy(lefts[i % len(lefts)])
+        right = copy.copy(rights[i % len(rights)])
+        left['id'], right['id'] = f'compareLeft_{i}', f'compareRight_{i}'
+        left.td.string = f'{left.td.get_text(strip=True) or "항목"} {i}'
+        lefts[-1].parent.append(left)
+        rights[-1].parent.append(right)
+    return str(soup)
+
+
+PAGES = [
+    ('spec', 'spec_tab.html', lambda d: crawler.extract_spec_detail(d, '4416', '53592')),
+    ('price', 'price_tab.html', lambda d: crawler.extract_trim_info_from_price_tab(d, '4416', '53592')),
+    ('lineups', 'price_tab.html', lambda d: crawler.get_all_lineups(d, '4416')),
+]
+
+
+def run_benchmark(rows=120, rpc_ms=2.0, live=False, repeat=5):
+    crawler.HTTP_FIRST = False
+    crawler.PAGE_TIMEOUT = 2
+    crawler.logger.setLevel('WARNING')
+    # fixture HTML이 실제 다나와 URL 키로 페이지 캐시에 저장되지 않도록 캐시를 끈다
+    cache_mode, page_cache.mode = page_cache.mode, 'off'
+    # 로컬 fixture라 다나와 요청 간격 대기 없이
+    min_interval, danawa_http.rate_limiter.min_interval = danawa_http.rate_limiter.min_interval, 0
+
+    live_driver = None
+    if live:
+        from src.feature.common.worker_pool import create_chrome_driver
+
+        live_driver = create_chrome_driver()
+
+    print(f'{"page":<8} {"mode":<12} {"rpc":>6} {"local(ms)":>10} {"est(ms)":>9}  same')
+    try:
+        for page, fixture, extract in PAGES:
+            path = FIXTURE_DIR / fixture
+            html = path.read_text(encoding='utf-8')
+            if page == 'spec':
+                html = expand_spec_rows(html, rows)
+                if live:
+                    # 늘린 HTML은 캐시 디렉터리에 써서 file:// 로 연다
+                    path = BENCH_DIR / fixture
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path.write_text(html, encoding='utf-8')
+
+            outputs = {}
+            for mode in MODES:
+                crawler.DOM_EXTRACTION = mode
+                counter = [0]
+                started = time.perf_counter()
+                for _ in range(repeat):
+                    driver = FixtureDriver(live_driver, path) if live else RecordedDriver(html)
+                    outputs[mode] = extract(CountingProxy(driver, counter))
+                local_ms = (time.perf_counter() - started) / repeat * 1000
+                rpc = counter[0] // repeat
+
+                est_ms = local_ms if live else local_ms + rpc * rpc_ms
+                same = outputs[mode] == outputs[MODES[0]]
+                print(f'{page:<8} {mode:<12} {rpc:>6} {local_ms:>10.1f} {est_ms:>9.1f}  {"✅" if same else "❌"}')
+
+            if live and page == 'spec':
+                path.unlink(missing_ok=True)
+    finally:
+        page_cache.mode = cache_mode
+        danawa_http.rate_limiter.min_interval = min_interval
+        if live_driver is not None:
+            live_driver.quit()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='다나와 추출 방식 RPC 벤치마크')
+    parser.add_argument('--rows', type=int, default=120, help='제원 항목 수')
+    parser.add_argument('--rpc-ms', type=float, default=2.0, help='WebDriver 왕복 1회 예상 시간(ms)')
+    parser.add_argument('--live', action='store_true', help='실제 headless 크롬 사용')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    run_benchmark(args.rows, args.rpc_ms, args.live, args.repeat)
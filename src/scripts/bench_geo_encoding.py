@@ -0,0 +1,68 @@
+"""
+지도 geometry 형식 벤치마크
+GeoJSON 자산 그대로('geojson')와 양자화 TopoJSON 자산 복원('topojson')의
+자산 크기, 로드 시간, 지도 figure 전송량(JSON/gzip)과 figure 생성+직렬화 시간 비교
+
+    python -m src.scripts.bench_geo_encoding
+    python -m src.scripts.bench_geo_encoding 50     # 반복 횟수
+"""
+import gzip
+import json
+import time
+
+import plotly.graph_objects as go
+
+from src.components.korea_map import MAP_TEMPLATES
+from src.utils.geo_assets import GEO_ASSET_FILES, GEOJSON_DIR, TOPOLOGY_ASSET, load_geometry, read_manifest
+
+FORMATS = ('geojson', 'topojson')
+
+
+def asset_bytes(fmt, assets):
+    """형식별로 서버가 디스크에서 읽는 자산 크기 합계"""
+    names = [TOPOLOGY_ASSET] if fmt == 'topojson' else assets
+    return sum((GEOJSON_DIR / GEO_ASSET_FILES[name]).stat().st_size for name in names)
+
+
+def measure(fmt, kind, repeat):
+    """(로드 ms, figure 생성+직렬화 ms, figure JSON bytes, gzip bytes)"""
+    manifest = read_manifest()
+    asset, builder = MAP_TEMPLATES[kind]
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        geojson = load_geometry(asset, manifest, fmt)
+    load_ms = (time.perf_counter() - started) / repeat * 1000
+
+    template = json.loads(builder(geojson).to_json())
+
+    # 렌더링마다 반복되는 비용: 템플릿 복사(go.Figure) + 브라우저로 보낼 JSON 직렬화
+    started = time.perf_counter()
+    for _ in range(repeat):
+        payload = go.Figure(template).to_json()
+    render_ms = (time.perf_counter() - started) / repeat * 1000
+
+    raw = payload.encode('utf-8')
+    return load_ms, render_ms, len(raw), len(gzip.compress(raw))
+
+
+def run_benchmark(repeat=20):
+    assets = sorted({asset for asset, _ in MAP_TEMPLATES.values()})
+    for fmt in FORMATS:
+        print(f'[BENCH] {fmt:<8} 자산 {asset_bytes(fmt, assets) / 1024:7.1f}KB')
+
+    print(f'{"kind":<11} {"format":<9} {"load(ms)":>9} {"render(ms)":>11} {"json(KB)":>9} {"gzip(KB)":>9}')
+    for kind in MAP_TEMPLATES:
+        for fmt in FORMATS:
+            load_ms, render_ms, raw, zipped = measure(fmt, kind, repeat)
+            print(
+                f'{kind:<11} {fmt:<9} {load_ms:>9.2f} {render_ms:>11.2f} '
+                f'{raw / 1024:>9.1f} {zipped / 1024:>9.1f}'
+            )
+
+
+if __name__ == '__main__':
+    import sys
+
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    run_benchmark(repeat)
@@ -0,0 +1,67 @@
+"""
+등록 통계 엑셀 읽기 방식 벤치마크
+pd.read_excel 전체 로드('pandas')와 시트 XML 직접 스트리밍('stream', zipfile + ElementTree.iterparse)의 파일당 파싱 시간/최대 메모리 비교
+"""
+import time
+import tracemalloc
+
+from src.feature.reg_cars.transform_reg_cars import READERS, list_monthly_files
+
+
+def measure(reader, file_path):
+    """파일 1개 파싱 시간(초)과 최대 메모리(MB), 결과 반환"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    df = READERS[reader](file_path)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024), df
+
+
+def same_result(a, b):
+    """두 읽기 방식의 결과가 같은지 확인 (행 순서/숫자 타입 차이는 무시)"""
+    if a is None or b is None:
+        return a is None and b is None
+
+    keys = ['date', 'region', 'fuel_type']
+    a = a.astype({'cnt': 'int64'}).sort_values(keys).reset_index(drop=True)
+    b = b.astype({'cnt': 'int64'}).sort_values(keys).reset_index(drop=True)
+    return a.equals(b)
+
+
+def run_benchmark(limit=None):
+    xl_files = list_monthly_files()
+    if limit:
+        xl_files = xl_files[:limit]
+
+    totals = {reader: [0.0, 0.0] for reader in READERS}
+    mismatches = []
+
+    print(f'[BENCH] 대상 파일 {len(xl_files)}개')
+    for file_path in xl_files:
+        results = {}
+        for reader in READERS:
+            elapsed, peak_mb, df = measure(reader, file_path)
+            totals[reader][0] += elapsed
+            totals[reader][1] = max(totals[reader][1], peak_mb)
+            results[reader] = df
+
+        if not same_result(results['pandas'], results['stream']):
+            mismatches.append(file_path)
+
+    print(f'{"reader":<8} {"total(s)":>10} {"avg(s)":>8} {"peak(MB)":>9}')
+    for reader, (elapsed, peak_mb) in totals.items():
+        print(f'{reader:<8} {elapsed:>10.2f} {elapsed / max(len(xl_files), 1):>8.3f} {peak_mb:>9.1f}')
+
+    if mismatches:
+        print(f'[BENCH] 결과 불일치 ❌: {mismatches}')
+    else:
+        print('[BENCH] 두 방식 결과 일치 ✅')
+
+
+if __name__ == '__main__':
+    import sys
+
+    limit = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    run_benchmark(limit)
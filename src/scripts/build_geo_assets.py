@@ -0,0 +1,252 @@
+"""
+지도 geometry 자산 빌드 (배포 전 실행, 앱은 런타임에 네트워크를 쓰지 않음)
+저장소에 포함된 원본(data/geojson/source, sha256 고정)에서 아래 파일을 data/geojson 에 만들고
+manifest.json 에 sha256을 기록합니다.
+
+- korea_provinces_boundaries_simplified.json: 17개 시도 (공통 격자 정렬 후 topology 기반 단순화)
+- korea_paldo_simplified.json: 8개 권역(팔도), 단순화된 시도를 권역별로 합침 (내부 경계가 남으면 빌드 실패)
+- korea_outline_simplified.json: 전국 외곽선
+- korea_geo.topo.json: 위 3개를 공유 arc 기반 TopoJSON 하나로 (양자화 + 델타 인코딩, MAP_GEOMETRY_FORMAT=topojson)
+
+    python -m src.scripts.build_geo_assets                      # 저장소 원본으로 빌드
+    python -m src.scripts.build_geo_assets --source raw.json    # 다른 원본 사용 (예: SOURCE_URL 원본 전체)
+    python -m src.scripts.build_geo_assets --check              # 체크섬 검증만
+
+원본 출처는 KOSTAT 2018 시도 경계(SOURCE_URL)이고, 저장소 원본은 기존 앱이 쓰던 같은 데이터의
+좌표 샘플링본(약 8,200점)입니다. 오프라인 환경에서 전체 원본을 받을 수 없어 이 파일을 원본으로 고정했습니다.
+전체 원본으로 바꿀 때는 파일을 data/geojson/source 에 넣고 SOURCE_FILE/SOURCE_SHA256을 함께 바꿉니다.
+"""
+import argparse
+import hashlib
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from src.utils.geo_assets import (
+    GEO_ASSET_FILES,
+    GEOJSON_DIR,
+    GEOJSON_MANIFEST_FILE,
+    MANIFEST_VERSION,
+    read_geo_asset,
+    read_manifest,
+)
+from src.utils.geometry import (
+    count_vertices,
+    dissolve_geojson,
+    geometry_centroid,
+    internal_edges,
+    simplify_geojson,
+    snap_to_grid,
+    topology_encode,
+)
+
+SOURCE_URL = 'https://raw.githubusercontent.com/southkorea/southkorea-maps/master/kostat/2018/json/skorea-provinces-2018-geo.json'
+SOURCE_FILE = GEOJSON_DIR / 'source' / 'skorea-provinces-2018-stride90.json'
+SOURCE_SHA256 = 'b185a5451d61e71e7753b0a845643b953123085123fc2eba0d5f457c10cdd1b0'
+
+# 디테일 조절 (단위: 도, 550px 높이 지도에서 1px ≈ 0.012도)
+# 이웃 시도 경계를 맞추는 공통 격자 (단순화 허용 오차의 절반, 약 200m)
+GRID_CELL = 0.002
+PROVINCE_TOLERANCE = 0.004
+OUTLINE_TOLERANCE = 0.01
+# 이보다 작은 섬은 제거 (도^2, 약 2km^2)
+PROVINCE_MIN_AREA = 2e-4
+# TopoJSON 양자화 격자 수 (한반도 범위에서 약 0.0006도, 지도 1px의 1/20)
+TOPOLOGY_QUANTIZATION = 10_000
+
+# 시도 코드 -> 권역 (transform_reg_cars.REGION_MAP 과 같은 기준)
+PALDO_BY_PROVINCE_CODE = {
+    '11': '서울', '23': '인천', '31': '경기', '32': '강원', '39': '제주',
+    '25': '충청', '29': '충청', '33': '충청', '34': '충청',
+    '24': '전라', '35': '전라', '36': '전라',
+    '21': '경상', '22': '경상', '26': '경상', '37': '경상', '38': '경상',
+}
+PALDO_REGIONS = ['서울', '경기', '인천', '강원', '충청', '전라', '경상', '제주']
+
+
+def load_source(path=None):
+    """
+    원본 GeoJSON bytes (path가 없으면 저장소 원본, sha256이 고정값과 다르면 ValueError)
+    """
+    if path:
+        with open(path, 'rb') as f:
+            return f.read()
+
+    raw = SOURCE_FILE.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    if digest != SOURCE_SHA256:
+        raise ValueError(f'원본 체크섬 불일치: {SOURCE_FILE.name} ({digest})')
+    return raw
+
+
+def build_provinces(source, tolerance=PROVINCE_TOLERANCE, min_area=PROVINCE_MIN_AREA, cell=GRID_CELL):
+    """
+    17개 시도 경계 단순화 (인접 시도가 공유하는 경계는 한 번만 단순화)
+    - 원본은 시도마다 경계를 따로 샘플링해 이웃 경계가 어긋나므로 먼저 공통 격자(cell)에 맞춤
+    - Choropleth용 feature id(_fid)는 원본 순서 기준으로 부여
+    """
+    features = []
+    for idx, feature in enumerate(source.get('features', [])):
+        if not (feature.get('geometry') or {}).get('coordinates'):
+            continue
+        props = dict(feature.get('properties', {}) or {})
+        props.setdefault('_fid', idx)
+        features.append({**feature, 'properties': props})
+
+    snapped = snap_to_grid({'type': 'FeatureCollection', 'features': features}, cell)
+    return simplify_geojson(snapped, tolerance, min_area)
+
+
+def check_dissolved(dissolved, provinces, key):
+    """
+    합친 도형에 내부 경계가 남았는지 검사 (남아 있으면 ValueError)
+    """
+    for feature in dissolved['features']:
+        name = feature['properties']['name']
+        parts = [p['geometry'] for p in provinces['features'] if key(p) == name]
+        leftover = internal_edges(feature['geometry'], parts)
+        if leftover:
+            lon, lat = leftover[0]
+            raise ValueError(f'{name} 내부 경계 {len(leftover)}개 남음 (예: {lon:.4f}, {lat:.4f})')
+
+
+def build_paldo(provinces):
+    """
+    단순화된 시도를 8개 권역으로 합침 (공유 경계가 같은 좌표로 단순화되어 있어야 내부 경계 제거됨)
+    - properties: name, _fid(PALDO_REGIONS 순서), centroid([lon, lat], 면적 가중 중심점)
+    """
+    def region_of(feature):
+        return PALDO_BY_PROVINCE_CODE.get(str(feature['properties'].get('code', ''))[:2])
+
+    dissolved = dissolve_geojson(provinces, key=region_of)
+    check_dissolved(dissolved, provinces, region_of)
+    by_name = {f['properties']['name']: f for f in dissolved['features']}
+
+    features = []
+    for fid, region in enumerate(PALDO_REGIONS):
+        feature = by_name.get(region)
+        if feature is None:
+            print(f'[GEOJSON] {region} 권역 도형 없음 ❌')
+            continue
+        centroid = geometry_centroid(feature['geometry'])
+        feature['properties'] = {
+            'name': region,
+            '_fid': fid,
+            'centroid': [round(centroid[0], 4), round(centroid[1], 4)] if centroid else None,
+        }
+        features.append(feature)
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+def build_outline(provinces, tolerance=OUTLINE_TOLERANCE):
+    """전국 외곽선 (전체 시도를 하나로 합친 뒤 단순화)"""
+    def whole(feature):
+        return 'South Korea'
+
+    dissolved = dissolve_geojson(provinces, key=whole)
+    check_dissolved(dissolved, provinces, whole)
+    return simplify_geojson(dissolved, tolerance, PROVINCE_MIN_AREA)
+
+
+def write_assets(assets, source_info, settings):
+    """자산 파일과 manifest 저장, manifest 반환"""
+    GEOJSON_DIR.mkdir(parents=True, exist_ok=True)
+
+    entries = {}
+    for name, data in assets.items():
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        (GEOJSON_DIR / GEO_ASSET_FILES[name]).write_bytes(payload)
+
+        if data.get('type') == 'Topology':
+            features = sum(len(obj['geometries']) for obj in data['objects'].values())
+            vertices = sum(len(arc) for arc in data['arcs'])
+        else:
+            features = len(data['features'])
+            vertices = count_vertices(data)
+
+        entries[name] = {
+            'file': GEO_ASSET_FILES[name],
+            'sha256': hashlib.sha256(payload).hexdigest(),
+            'bytes': len(payload),
+            'features': features,
+            'vertices': vertices,
+        }
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'built_at': datetime.now().isoformat(timespec='seconds'),
+        'source': source_info,
+        'settings': settings,
+        'assets': entries,
+    }
+    with open(GEOJSON_MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def build_geo_assets(source_path=None, tolerance=PROVINCE_TOLERANCE, min_area=PROVINCE_MIN_AREA):
+    raw = load_source(source_path)
+    source = json.loads(raw)
+
+    provinces = build_provinces(source, tolerance, min_area)
+    assets = {
+        'provinces': provinces,
+        'paldo': build_paldo(provinces),
+        'outline': build_outline(provinces),
+    }
+    assets['topology'] = topology_encode(
+        {name: assets[name] for name in ('outline', 'provinces', 'paldo')},
+        quantization=TOPOLOGY_QUANTIZATION,
+    )
+
+    manifest = write_assets(
+        assets,
+        source_info={
+            'path': (
+                Path(source_path).name if source_path
+                else SOURCE_FILE.relative_to(GEOJSON_DIR).as_posix()
+            ),
+            'origin': SOURCE_URL,
+            'sha256': hashlib.sha256(raw).hexdigest(),
+            'vertices': count_vertices(source),
+        },
+        settings={
+            'method': 'topology-dp',
+            'grid_cell': GRID_CELL,
+            'tolerance': tolerance,
+            'outline_tolerance': OUTLINE_TOLERANCE,
+            'min_area': min_area,
+            'topology_quantization': TOPOLOGY_QUANTIZATION,
+        },
+    )
+
+    for name, entry in manifest['assets'].items():
+        print(
+            f"[GEOJSON] {name:<9} {entry['features']:>2}개 도형, 좌표 {entry['vertices']:,}, "
+            f"{entry['bytes'] / 1024:.1f}KB ✅"
+        )
+    return manifest
+
+
+def check_geo_assets():
+    """manifest의 모든 자산 체크섬 검증, 실패한 자산 이름 목록 반환"""
+    manifest = read_manifest()
+    failures = [name for name in GEO_ASSET_FILES if read_geo_asset(name, manifest) is None]
+    for name in GEO_ASSET_FILES:
+        print(f"[GEOJSON] {name:<9} {'❌' if name in failures else '✅'}")
+    return failures
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='지도 geometry 자산 빌드')
+    parser.add_argument('--source', help='원본 GeoJSON 경로 (없으면 data/geojson/source 저장소 원본)')
+    parser.add_argument('--tolerance', type=float, default=PROVINCE_TOLERANCE)
+    parser.add_argument('--min-area', type=float, default=PROVINCE_MIN_AREA)
+    parser.add_argument('--check', action='store_true', help='빌드 없이 체크섬만 검증')
+    args = parser.parse_args()
+
+    if args.check:
+        sys.exit(1 if check_geo_assets() else 0)
+
+    build_geo_assets(args.source, args.tolerance, args.min_area)
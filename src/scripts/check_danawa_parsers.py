@@ -0,0 +1,80 @@
+"""
+다나와 HTML 파서 확인
+data/fixtures/danawa 의 저장 HTML을 danawa_http.parse_* 로 파싱해 expected.json 과 비교하고,
+다르면 실패(exit 1)합니다. 다나와 마크업이 바뀌면 실제 페이지를 저장해 fixture/기대값을 갱신합니다.
+
+주의: 현재 fixture(price_tab/spec_tab/search/js_only.html)는 크롤러 selector를 보고 직접 작성한 HTML이므로
+(expected.json "source": "handwritten") 통과해도 실제 다나와 응답에서 파서가 동작한다는 뜻은 아닙니다.
+실제 페이지로 확인한 항목이 없으면 경고를 출력하며, DANAWA_HTTP_FIRST 기본값은 0으로 둡니다.
+--save 로 실제 가격/제원/검색 페이지를 저장하고 expected.json에 "source": "live" 항목을 추가해 확인한 뒤 켭니다.
+
+    python -m src.scripts.check_danawa_parsers
+    python -m src.scripts.check_danawa_parsers --save "https://auto.danawa.com/auto/?Work=model&Model=4416&Tab=price" price_live.html
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+from src.feature.cars_info import danawa_http
+
+FIXTURE_DIR = Path(__file__).parent.parent.parent / 'data' / 'fixtures' / 'danawa'
+EXPECTED_FILE = FIXTURE_DIR / 'expected.json'
+
+
+def check_parsers(repeat=20):
+    """모든 기대값 확인, 실패한 항목 목록 반환"""
+    failures = []
+
+    with open(EXPECTED_FILE, 'r', encoding='utf-8') as f:
+        cases = json.load(f)
+
+    for case in cases:
+        html = (FIXTURE_DIR / case['fixture']).read_text(encoding='utf-8')
+        parser = getattr(danawa_http, case['parser'])
+        args = case.get('args', [])
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            actual = parser(html, *args)
+        parse_ms = (time.perf_counter() - started) / repeat * 1000
+
+        ok = actual == case['expected']
+        name = f"{case['parser']}({', '.join([case['fixture'], *args])})"
+        print(f"[DANAWA] {name:<45} {parse_ms:6.2f}ms {'✅' if ok else '❌'}")
+        if not ok:
+            failures.append(
+                f"{name}: expected {json.dumps(case['expected'], ensure_ascii=False)}, "
+                f"actual {json.dumps(actual, ensure_ascii=False)}"
+            )
+
+    live = [case for case in cases if case.get('source') == 'live']
+    if not live:
+        print('[DANAWA] 실제 페이지로 저장한 fixture 없음 (직접 작성한 HTML만 확인, HTTP 우선 사용은 기본 꺼짐)')
+
+    return failures
+
+
+def save_fixture(url, name):
+    """실제 페이지 HTML을 fixture로 저장"""
+    html = danawa_http.fetch_html(url)
+    if html is None:
+        print(f'[DANAWA] 페이지 요청 실패 ❌: {url}')
+        return False
+    (FIXTURE_DIR / name).write_text(html, encoding='utf-8')
+    print(f'[DANAWA] 저장 완료 ✅: {FIXTURE_DIR / name} ({len(html) / 1024:.1f}KB, 파서 {danawa_http.HTML_PARSER})')
+    print('[DANAWA] expected.json 에 "source": "live" 항목으로 기대값을 추가하세요')
+    return True
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 4 and sys.argv[1] == '--save':
+        sys.exit(0 if save_fixture(sys.argv[2], sys.argv[3]) else 1)
+
+    failures = check_parsers()
+    if failures:
+        print('[DANAWA] 파서 결과 불일치 ❌')
+        for failure in failures:
+            print(f'  - {failure}')
+        sys.exit(1)
+    print('[DANAWA] 모든 fixture 일치 ✅')
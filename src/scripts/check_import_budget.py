@@ -0,0 +1,102 @@
+"""
+콜드 스타트 import 예산 확인
+페이지별로 필요한 모듈을 새 프로세스에서 import 해 시간을 재고, 예산을 넘거나
+그 페이지가 쓰지 않는 무거운 모듈(plotly, PIL 등)을 불러오면 실패(exit 1)합니다.
+
+    python -m src.scripts.check_import_budget
+    IMPORT_BUDGET_SCALE=2 python -m src.scripts.check_import_budget   # 느린 환경에서 예산 2배
+"""
+import json
+import os
+import subprocess
+import sys
+
+# 페이지별 (import 대상, 불러오면 안 되는 모듈, 예산 ms)
+# streamlit 자체 import 시간은 모든 페이지 공통이라 제외하고 측정
+TARGETS = {
+    'main': (
+        ['src.utils.styles', 'src.components.navigation_bar', 'src.utils.page_registry'],
+        ['plotly', 'PIL', 'pandas', 'mysql'],
+        150,
+    ),
+    'statistics': (
+        ['src.components.korea_map', 'src.components.charts', 'src.utils.data'],
+        ['selenium'],
+        1500,
+    ),
+    'compare': (
+        ['src.utils.data', 'src.services.car_info_service'],
+        ['plotly', 'PIL', 'selenium'],
+        600,
+    ),
+    'faq': (
+        ['src.database.db_manager'],
+        ['plotly', 'PIL', 'selenium'],
+        600,
+    ),
+}
+
+# 자식 프로세스에서 실행: streamlit을 먼저 불러온 뒤 대상 모듈 import 시간과 새로 불러온 모듈 측정
+_PROBE = """
+import importlib, json, sys, time
+t0 = time.perf_counter()
+import streamlit
+base_ms = (time.perf_counter() - t0) * 1000
+before = set(sys.modules)
+t0 = time.perf_counter()
+for name in json.loads(sys.argv[1]):
+    importlib.import_module(name)
+elapsed_ms = (time.perf_counter() - t0) * 1000
+loaded = sorted({m.split('.')[0] for m in set(sys.modules) - before})
+print(json.dumps({'streamlit_ms': base_ms, 'elapsed_ms': elapsed_ms, 'loaded': loaded}))
+"""
+
+
+def probe(modules):
+    """새 파이썬 프로세스에서 modules import 결과 반환"""
+    result = subprocess.run(
+        [sys.executable, '-c', _PROBE, json.dumps(modules)],
+        capture_output=True, text=True, cwd=os.getcwd(),
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [os.getcwd(), os.getenv('PYTHONPATH')]))),
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else 'import 실패')
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def check_import_budget(scale=1.0):
+    """모든 페이지 예산 확인, 실패한 항목 목록 반환"""
+    failures = []
+
+    for page, (modules, forbidden, budget_ms) in TARGETS.items():
+        try:
+            result = probe(modules)
+        except RuntimeError as e:
+            failures.append(f'{page}: import 실패 ({e})')
+            print(f'[BUDGET] {page:<10} import 실패 ❌: {e}')
+            continue
+
+        limit = budget_ms * scale
+        heavy = [m for m in forbidden if m in result['loaded']]
+        ok = result['elapsed_ms'] <= limit and not heavy
+
+        print(
+            f"[BUDGET] {page:<10} {result['elapsed_ms']:7.1f}ms / {limit:7.1f}ms "
+            f"(streamlit {result['streamlit_ms']:.0f}ms) {'✅' if ok else '❌'}"
+        )
+        if result['elapsed_ms'] > limit:
+            failures.append(f"{page}: {result['elapsed_ms']:.1f}ms > {limit:.1f}ms")
+        if heavy:
+            failures.append(f'{page}: 불필요한 모듈 import {heavy}')
+
+    return failures
+
+
+if __name__ == '__main__':
+    failures = check_import_budget(float(os.getenv('IMPORT_BUDGET_SCALE', '1')))
+    if failures:
+        print('[BUDGET] 예산 초과 ❌')
+        for failure in failures:
+            print(f'  - {failure}')
+        sys.exit(1)
+    print('[BUDGET] 모든 페이지 예산 이내 ✅')
@@ -1,4 +1,5 @@
 from src.database.db_manager import DBManager
+from src.database.schema import DBSchema
 
 def init_database(reset=False):
     """
@@ -26,15 +27,64 @@ def init_database(reset=False):
     print('[DBSCRIPT] 테이블 생성')
     db.create_tables()
 
-    # 4. 테이블 확인
+    # 4. 기존 DB 마이그레이션 (cnt_tbl 유니크 키/인덱스)
+    print('[DBSCRIPT] cnt_tbl 인덱스 마이그레이션')
+    migrate_cnt_indexes(db)
+
+    # 5. 테이블 확인
     print('[DBSCRIPT] 테이블 확인')
     verify_tables(db)
 
-    # 5. DB 연결 종료
+    # 6. DB 연결 종료
     print('\n' + '=' * 50)
     db.close()
     print('[DBSCRIPT] DB 초기화 완료 ✅')
 
+def migrate_cnt_indexes(db):
+    """
+    기존 cnt_tbl에 누락된 유니크 키/인덱스 추가
+    유니크 키 추가 전 중복 행을 먼저 제거 (새로 생성된 테이블은 변경 없음)
+
+    되돌릴 수 없는 단방향 마이그레이션: MySQL의 ALTER TABLE은 암묵적으로 커밋하므로 rollback()으로
+    지운 행을 복구할 수 없음 -> 지우기 전에 중복 행을 cnt_dup_backup_tbl에 복사하고,
+    백업/삭제를 먼저 커밋한 뒤 ALTER를 실행 (필요하면 백업 테이블에서 직접 복원)
+    """
+    cursor = db.get_cursor()
+    cursor.execute(
+        """
+        SELECT DISTINCT index_name FROM information_schema.statistics
+        WHERE table_schema = DATABASE() AND table_name = 'cnt_tbl'
+        """
+    )
+    existing = {row[0] for row in cursor.fetchall()}
+    missing = [name for name in DBSchema.CNT_TABLE_INDEXES if name not in existing]
+
+    if not missing:
+        print('[DBSCRIPT] cnt_tbl 인덱스 최신 상태')
+        return True
+
+    try:
+        if 'uk_cnt_date_region_fuel' in missing:
+            # CREATE TABLE도 암묵적 커밋 -> 백업 INSERT와 DELETE는 그 뒤 한 트랜잭션으로
+            cursor.execute(DBSchema.CNT_DUPLICATE_BACKUP_TABLE)
+            cursor.execute(DBSchema.CNT_DUPLICATE_BACKUP_QUERY)
+            backed_up = cursor.rowcount
+            cursor.execute(DBSchema.CNT_DEDUPLICATE_QUERY)
+            db.commit()
+            print(f'[DBSCRIPT] cnt_tbl 중복 행 {cursor.rowcount}건 제거 (cnt_dup_backup_tbl에 {backed_up}건 백업)')
+
+        clauses = ', '.join(DBSchema.CNT_TABLE_INDEXES[name] for name in missing)
+        cursor.execute(f'ALTER TABLE cnt_tbl {clauses}')
+        db.commit()
+        print(f'[DBSCRIPT] cnt_tbl 인덱스 추가 완료 ✅: {missing}')
+        return True
+
+    except Exception as e:
+        # ALTER 이후 실패는 롤백되지 않음 (지운 중복 행은 cnt_dup_backup_tbl에 있음)
+        print(f'[DBSCRIPT] cnt_tbl 인덱스 추가 실패 ❌: {e}')
+        db.rollback()
+        return False
+
 def verify_tables(db):
     """생성된 테이블 확인"""
     cursor = db.get_cursor()
@@ -0,0 +1,134 @@
+"""
+서비스 조회 결과 캐시 모듈
+함수별 TTL/최대 개수(LRU 제거) 캐시와 데이터 버전 스탬프 제공
+
+- Streamlit 안팎 어디서든 사용 가능 (프로세스 메모리 캐시)
+- 프로세스 캐시에 없으면 공유 캐시 백엔드(shared_cache)를 거쳐 조회 (여러 서버 프로세스 간 공유)
+- ETL 적재 스크립트가 bump_data_version()을 호출하면 모든 캐시가 다음 조회 때 비워짐
+"""
+import copy
+import hashlib
+import os
+import threading
+import time
+from functools import wraps
+
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+
+from src.services.shared_cache import get_shared_backend
+
+# 적재 스크립트와 앱이 공유하는 데이터 버전 파일
+DATA_VERSION_PATH = os.getenv('DATA_VERSION_PATH', 'data/cache/data_version')
+
+# 버전 파일 확인 간격(초) - 매 조회마다 stat 하지 않도록
+VERSION_CHECK_INTERVAL = 1.0
+
+_registry = []
+_version_lock = threading.Lock()
+_version_state = {'value': None, 'checked': 0.0}
+
+
+def get_data_version():
+    """현재 데이터 버전 반환 (버전 파일이 없으면 '0')"""
+    with _version_lock:
+        now = time.monotonic()
+        if _version_state['value'] is None or now - _version_state['checked'] >= VERSION_CHECK_INTERVAL:
+            try:
+                with open(DATA_VERSION_PATH, encoding='utf-8') as f:
+                    _version_state['value'] = f.read().strip() or '0'
+            except OSError:
+                _version_state['value'] = '0'
+            _version_state['checked'] = now
+        return _version_state['value']
+
+
+def bump_data_version():
+    """데이터 버전 갱신 (ETL 적재 완료 후 호출)"""
+    version = str(time.time_ns())
+    os.makedirs(os.path.dirname(DATA_VERSION_PATH) or '.', exist_ok=True)
+
+    tmp_path = f'{DATA_VERSION_PATH}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(version)
+    os.replace(tmp_path, DATA_VERSION_PATH)
+
+    with _version_lock:
+        _version_state['value'] = version
+        _version_state['checked'] = time.monotonic()
+
+    clear_all()
+    return version
+
+
+def _is_cacheable(result):
+    # 조회 실패 시 서비스 함수가 반환하는 None/빈 리스트는 캐시하지 않음
+    return result is not None and result != []
+
+
+def _shared_key(fn, key, version):
+    # 데이터 버전을 키에 포함해 버전이 바뀌면 공유 캐시 항목도 자연히 무효화
+    raw = f'{version}|{fn.__module__}.{fn.__qualname__}|{key!r}'
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def cached(ttl=300, maxsize=128):
+    """
+    서비스 조회 함수 결과 캐시 데코레이터
+
+    Args:
+        ttl: 캐시 유지 시간(초)
+        maxsize: 최대 항목 수 (초과 시 가장 오래 안 쓴 항목 제거)
+
+    - 인자 조합별로 캐시 (인자는 hashable 이고 repr이 값을 구분해야 함)
+    - 프로세스 캐시에 없으면 공유 캐시 백엔드에서 조회/계산 (같은 키는 한 곳에서만 계산)
+    - None/빈 결과는 캐시하지 않음 (조회 실패 시 서비스 함수가 []/None 반환)
+    - 호출자가 결과를 수정해도 캐시가 오염되지 않도록 복사본 반환
+    """
+    def decorator(fn):
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        lock = threading.Lock()
+        state = {'version': None}
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = hashkey(*args, **kwargs)
+            version = get_data_version()
+
+            with lock:
+                if state['version'] != version:
+                    cache.clear()
+                    state['version'] = version
+                if key in cache:
+                    return copy.deepcopy(cache[key])
+
+            result = get_shared_backend().get_or_compute(
+                _shared_key(fn, key, version), ttl, lambda: fn(*args, **kwargs), _is_cacheable,
+            )
+
+            if _is_cacheable(result):
+                with lock:
+                    if state['version'] == version:
+                        cache[key] = copy.deepcopy(result)
+            return result
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        def cache_info():
+            with lock:
+                return {'size': cache.currsize, 'maxsize': cache.maxsize, 'ttl': cache.ttl}
+
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_info = cache_info
+        _registry.append(wrapper)
+        return wrapper
+
+    return decorator
+
+
+def clear_all():
+    """이 프로세스의 모든 서비스 캐시 비우기"""
+    for fn in _registry:
+        fn.cache_clear()
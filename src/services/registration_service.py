@@ -1,56 +1,239 @@
 from src.database.db_manager import DBManager
-import pandas as pd
+from src.services.cache import cached
 
+ELECTRIC_FUEL_TYPE = '전기'
+
+# 연도별 최신 월 (누적 대수 기준점, 연도별 합계 쿼리의 서브쿼리로도 사용)
+LATEST_MONTH_PER_YEAR_SELECT = """
+    SELECT date DIV 100 AS year_val, MAX(date) AS date
+    FROM cnt_tbl
+    GROUP BY year_val
+"""
+
+LATEST_MONTH_PER_YEAR_QUERY = LATEST_MONTH_PER_YEAR_SELECT + """
+    ORDER BY year_val
+"""
+
+# 연도별 최신 월 기준 전기/내연 누적 대수
+YEARLY_TYPE_TOTALS_QUERY = f"""
+    SELECT latest.year_val,
+           SUM(CASE WHEN c.fuel_type = %s THEN c.cnt ELSE 0 END) AS electric,
+           SUM(CASE WHEN c.fuel_type = %s THEN 0 ELSE c.cnt END) AS combustion
+    FROM cnt_tbl c
+    JOIN ({LATEST_MONTH_PER_YEAR_SELECT}) latest ON c.date = latest.date
+    GROUP BY latest.year_val
+    ORDER BY latest.year_val
+"""
+
+# 최신 월 기준 지역별 전체/전기 등록 대수
+REGION_LATEST_TOTALS_QUERY = """
+    SELECT region,
+           SUM(cnt) AS total,
+           SUM(CASE WHEN fuel_type = %s THEN cnt ELSE 0 END) AS electric
+    FROM cnt_tbl
+    WHERE date = (SELECT MAX(date) FROM cnt_tbl)
+    GROUP BY region
+"""
+
+# 요약 테이블 조회 (load_reg_cars 적재 시 갱신)
+YEARLY_SUMMARY_QUERY = """
+    SELECT year, date, electric, combustion
+    FROM cnt_yearly_summary_tbl
+    ORDER BY year
+"""
+
+REGION_SHARE_SUMMARY_QUERY = """
+    SELECT region, date, electric, total
+    FROM cnt_region_share_tbl
+"""
+
+MONTHLY_TOTAL_SUMMARY_QUERY = """
+    SELECT date, electric, combustion, total
+    FROM cnt_monthly_total_tbl
+    ORDER BY date
+"""
+
+
+@cached(ttl=600, maxsize=1)
 def get_registration_count_list():
     # DB에서 등록 데이터 가져오기
-    db = DBManager()
-    if not db.connect():
-        return []
-    
+    query = "SELECT date, fuel_type, region, cnt FROM cnt_tbl"
+
     try:
-        cursor = db.get_cursor()
-        query = "SELECT date, fuel_type, region, cnt FROM cnt_tbl"
-        cursor.execute(query)
+        with DBManager().session() as s:
+            return s.fetch_all(query)
 
-        columns = [desc[0] for desc in cursor.description]
-        results = cursor.fetchall()
-        return [dict(zip(columns, row)) for row in results]
-    
     except Exception as e:
         print(f"[REGISTRATION_SERVICE] 전체 데이터 조회 실패 ❌: {e}")
         return []
-    finally:
-        db.close()
 
+
+@cached(ttl=600, maxsize=1)
+def get_latest_month_per_year():
+    """
+    연도별 최신 월 조회
+
+    Returns:
+        list[dict]: [{"year": 2016, "date": 201612}, ...]
+    """
+    try:
+        with DBManager().session() as s:
+            rows = s.fetch_all(LATEST_MONTH_PER_YEAR_QUERY)
+        return [{"year": int(r["year_val"]), "date": int(r["date"])} for r in rows]
+
+    except Exception as e:
+        print(f"[REGISTRATION_SERVICE] 연도별 최신 월 조회 실패 ❌: {e}")
+        return []
+
+
+@cached(ttl=600, maxsize=1)
+def get_yearly_type_totals():
+    """
+    연도별 최신 월 기준 전기/내연 누적 등록 대수 (SQL 집계)
+
+    Returns:
+        list[dict]: [{"year": 2016, "electric": 123, "combustion": 45678}, ...]
+    """
+    try:
+        with DBManager().session() as s:
+            rows = s.fetch_all(YEARLY_TYPE_TOTALS_QUERY, (ELECTRIC_FUEL_TYPE, ELECTRIC_FUEL_TYPE))
+        return [
+            {"year": int(r["year_val"]), "electric": int(r["electric"]), "combustion": int(r["combustion"])}
+            for r in rows
+        ]
+
+    except Exception as e:
+        print(f"[REGISTRATION_SERVICE] 연도별 합계 조회 실패 ❌: {e}")
+        return []
+
+
+def _to_region_ratio(rows):
+    # 지역별 전체/전기 대수 -> 비중(%) 계산
+    result = []
+    for r in rows:
+        total = float(r["total"] or 0)
+        elec = float(r["electric"] or 0)
+        ratio = (elec / total * 100.0) if total > 0 else 0.0
+        result.append({
+            "region": r["region"],
+            "total": int(total),
+            "electric": int(elec),
+            "ratio": round(ratio, 1),
+        })
+    return result
+
+
+@cached(ttl=600, maxsize=1)
+def get_region_ev_ratio():
+    """
+    최신 월 기준 지역별 전기 화물차 비중
+    요약 테이블을 우선 사용하고, 비어 있으면 cnt_tbl에서 직접 집계
+
+    Returns:
+        list[dict]: [{"region": "서울", "total": 1000, "electric": 82, "ratio": 8.2}, ...]
+    """
+    summary = get_region_share_summary()
+    if summary:
+        return summary
+
+    try:
+        with DBManager().session() as s:
+            rows = s.fetch_all(REGION_LATEST_TOTALS_QUERY, (ELECTRIC_FUEL_TYPE,))
+        return _to_region_ratio(rows)
+
+    except Exception as e:
+        print(f"[REGISTRATION_SERVICE] 지역별 비중 조회 실패 ❌: {e}")
+        return []
+
+
+@cached(ttl=600, maxsize=1)
+def get_yearly_summary():
+    """
+    연도별 전기/내연 누적 등록 대수 (요약 테이블)
+
+    Returns:
+        list[dict]: [{"year": 2016, "date": 201612, "electric": 123, "combustion": 45678}, ...]
+    """
+    try:
+        with DBManager().session() as s:
+            rows = s.fetch_all(YEARLY_SUMMARY_QUERY)
+        return [
+            {
+                "year": int(r["year"]),
+                "date": int(r["date"]),
+                "electric": int(r["electric"]),
+                "combustion": int(r["combustion"]),
+            }
+            for r in rows
+        ]
+
+    except Exception as e:
+        print(f"[REGISTRATION_SERVICE] 연도별 요약 조회 실패 ❌: {e}")
+        return []
+
+
+@cached(ttl=600, maxsize=1)
+def get_region_share_summary():
+    """
+    최신 월 지역별 전기 비중 (요약 테이블)
+
+    Returns:
+        list[dict]: [{"region": "서울", "total": 1000, "electric": 82, "ratio": 8.2}, ...]
+    """
+    try:
+        with DBManager().session() as s:
+            rows = s.fetch_all(REGION_SHARE_SUMMARY_QUERY)
+        return _to_region_ratio(rows)
+
+    except Exception as e:
+        print(f"[REGISTRATION_SERVICE] 지역별 요약 조회 실패 ❌: {e}")
+        return []
+
+
+@cached(ttl=600, maxsize=1)
+def get_monthly_totals():
+    """
+    월별 전국 등록 대수 (요약 테이블)
+
+    Returns:
+        list[dict]: [{"date": 201601, "electric": 10, "combustion": 900, "total": 910}, ...]
+    """
+    try:
+        with DBManager().session() as s:
+            rows = s.fetch_all(MONTHLY_TOTAL_SUMMARY_QUERY)
+        return [
+            {
+                "date": int(r["date"]),
+                "electric": int(r["electric"]),
+                "combustion": int(r["combustion"]),
+                "total": int(r["total"]),
+            }
+            for r in rows
+        ]
+
+    except Exception as e:
+        print(f"[REGISTRATION_SERVICE] 월별 요약 조회 실패 ❌: {e}")
+        return []
+
+
+@cached(ttl=600, maxsize=1)
 def get_registration_trend():
    # 전년 대비 신규 증가량!!!
-    rows = get_registration_count_list()
-    if not rows:
-        return []
-    
-    try:
-        df = pd.DataFrame(rows)
-        # 1. 각 연도별 최신 달(보통 12월) 데이터만 추출 (누적 대수 기준점)
-        df['year_val'] = df['date'] // 100
-        latest_month_per_year = df.groupby('year_val')['date'].transform('max')
-        df_latest = df[df['date'] == latest_month_per_year].copy()
-        
-        # 2. 연도별, 타입별(전기/내연) 합계
-        df_latest['type'] = df_latest['fuel_type'].apply(lambda x: 'electric' if x == '전기' else 'combustion')
-        annual_totals = df_latest.groupby(['year_val', 'type'])['cnt'].sum().unstack(fill_value=0)
-        
-        # 3. 전년 대비 증가량 계산
-        # diff()를 사용하여 (올해 누적 - 작년 누적) = 올해 신규 등록량 산출
-        annual_diff = annual_totals.diff().dropna()
-        
+    # 요약 테이블이 비어 있으면 (적재 전) cnt_tbl에서 직접 집계
+    annual_totals = get_yearly_summary() or get_yearly_type_totals()
+    if not annual_totals:
+        return []
+
+    try:
+        # (올해 누적 - 작년 누적) = 올해 신규 등록량 산출 (첫 해는 비교 대상이 없어 제외)
         trend_data = []
-        for year, row in annual_diff.iterrows():
+        for prev, cur in zip(annual_totals, annual_totals[1:]):
             trend_data.append({
-                "year": str(int(year)),
-                "electric": int(row.get('electric', 0)),
-                "combustion": int(row.get('combustion', 0))
+                "year": str(cur["year"]),
+                "electric": cur["electric"] - prev["electric"],
+                "combustion": cur["combustion"] - prev["combustion"]
             })
-            
+
         return trend_data
     except Exception as e:
         print(f"[REGISTRATION_SERVICE] 증가량 가공 실패 ❌: {e}")
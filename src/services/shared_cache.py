@@ -0,0 +1,261 @@
+"""
+프로세스 간 공유 캐시 백엔드
+여러 Streamlit 서버 프로세스가 같은 조회 결과를 공유하고, 만료된 항목은 한 곳에서만 다시 계산
+
+- memory: 프로세스 내부 전용 (기본값, 키별로 한 스레드만 계산)
+- sqlite: SQLite 파일 공유, 임대(lease) 행으로 한 프로세스만 계산
+  값은 JSON으로 저장 (pickle 미사용), 파일/디렉터리가 현재 사용자 소유가 아니거나
+  다른 사용자가 쓸 수 있으면 사용하지 않고 memory로 대체
+
+환경 변수
+    SERVICE_CACHE_BACKEND: memory | sqlite
+    SERVICE_CACHE_PATH: sqlite 파일 경로
+        (기본: $XDG_RUNTIME_DIR/skn24/service_cache.sqlite3, 없으면 ~/.cache/skn24/service_cache.sqlite3)
+"""
+import datetime
+import decimal
+import json
+import os
+import sqlite3
+import stat
+import threading
+import time
+import uuid
+
+
+def _default_cache_path():
+    # 사용자 전용 디렉터리 (XDG_RUNTIME_DIR은 tmpfs + 0700)
+    base = os.getenv('XDG_RUNTIME_DIR') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'skn24', 'service_cache.sqlite3')
+
+
+SHARED_CACHE_BACKEND = os.getenv('SERVICE_CACHE_BACKEND', 'memory')
+SHARED_CACHE_PATH = os.getenv('SERVICE_CACHE_PATH') or _default_cache_path()
+
+# 다른 프로세스가 계산 중일 때 기다리는 최대 시간(초) / 확인 간격(초)
+LEASE_TIMEOUT = 30.0
+POLL_INTERVAL = 0.05
+
+
+def _json_default(value):
+    # DB 조회 결과에 나오는 JSON 외 타입만 태그를 붙여 저장
+    if isinstance(value, decimal.Decimal):
+        return {'__type__': 'decimal', 'value': str(value)}
+    if isinstance(value, datetime.datetime):
+        return {'__type__': 'datetime', 'value': value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {'__type__': 'date', 'value': value.isoformat()}
+    raise TypeError(f'공유 캐시에 저장할 수 없는 타입: {type(value).__name__}')
+
+
+def _json_object_hook(obj):
+    kind = obj.get('__type__')
+    if kind == 'decimal':
+        return decimal.Decimal(obj['value'])
+    if kind == 'datetime':
+        return datetime.datetime.fromisoformat(obj['value'])
+    if kind == 'date':
+        return datetime.date.fromisoformat(obj['value'])
+    return obj
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, default=_json_default)
+
+
+def _loads(text):
+    return json.loads(text, object_hook=_json_object_hook)
+
+
+def _check_private(path):
+    """
+    캐시 디렉터리/파일이 현재 사용자 소유이고 다른 사용자가 쓸 수 없는지 확인
+
+    Raises:
+        PermissionError: 다른 사용자 소유, 그룹/기타 쓰기 권한, 심볼릭 링크
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    if not hasattr(os, 'getuid'):
+        # Windows: 소유자 확인 생략 (사용자 프로필 디렉터리 권한에 맡김)
+        return
+
+    uid = os.getuid()
+    for target in (directory, path, f'{path}-wal', f'{path}-shm'):
+        try:
+            st = os.lstat(target)
+        except FileNotFoundError:
+            continue
+        if stat.S_ISLNK(st.st_mode):
+            raise PermissionError(f'심볼릭 링크는 사용하지 않음: {target}')
+        if st.st_uid != uid:
+            raise PermissionError(f'다른 사용자 소유: {target}')
+        if st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise PermissionError(f'다른 사용자 쓰기 권한 있음: {target}')
+
+    if not os.path.exists(path):
+        # 처음 만들 때부터 0600
+        os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600))
+
+
+class MemoryBackend:
+    """
+    프로세스 내부 전용 백엔드 (공유 저장소 없음)
+    같은 키를 여러 스레드가 동시에 요청하면 한 스레드만 계산하고 나머지는 결과를 기다림
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight = {}
+
+    def get_or_compute(self, key, ttl, compute, should_cache):
+        with self._lock:
+            event = self._inflight.get(key)
+            owner = event is None
+            if owner:
+                event = self._inflight[key] = {'done': threading.Event(), 'value': None, 'ok': False}
+
+        if not owner:
+            event['done'].wait(LEASE_TIMEOUT)
+            if event['ok']:
+                return event['value']
+            return compute()
+
+        try:
+            event['value'] = compute()
+            event['ok'] = True
+            return event['value']
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            event['done'].set()
+
+    def clear(self):
+        pass
+
+
+class SQLiteBackend:
+    """
+    SQLite 파일 공유 백엔드
+
+    - entries: 키별 JSON 값과 만료 시각
+    - leases: 재계산 중인 키 (한 프로세스만 임대 획득, 나머지는 값이 채워질 때까지 대기)
+    """
+
+    SCHEMA = [
+        'CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)',
+        'CREATE TABLE IF NOT EXISTS leases (key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires REAL NOT NULL)',
+    ]
+
+    def __init__(self, path=SHARED_CACHE_PATH, lease_timeout=LEASE_TIMEOUT, poll_interval=POLL_INTERVAL):
+        self.path = path
+        self.lease_timeout = lease_timeout
+        self.poll_interval = poll_interval
+        self.owner = f'{os.getpid()}-{uuid.uuid4().hex[:8]}'
+        self._local = threading.local()
+
+        _check_private(path)
+        conn = self._connection()
+        for ddl in self.SCHEMA:
+            conn.execute(ddl)
+
+    def _connection(self):
+        # sqlite3 커넥션은 스레드 간 공유하지 않음
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=OFF')
+            self._local.conn = conn
+        return conn
+
+    def _get(self, conn, key, now):
+        row = conn.execute('SELECT value FROM entries WHERE key = ? AND expires > ?', (key, now)).fetchone()
+        if not row:
+            return False, None
+        try:
+            return True, _loads(row[0])
+        except (TypeError, ValueError):
+            # 형식이 다른 값(이전 pickle 등)은 없는 것으로 보고 다시 계산
+            return False, None
+
+    def _acquire_lease(self, conn, key, now):
+        """임대 획득 (없거나 만료된 임대만 가져옴)"""
+        cursor = conn.execute(
+            """
+            INSERT INTO leases (key, owner, expires) VALUES (?, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, expires = excluded.expires
+            WHERE leases.expires <= ?
+            """,
+            (key, self.owner, now + self.lease_timeout, now),
+        )
+        return cursor.rowcount == 1
+
+    def _release_lease(self, conn, key):
+        conn.execute('DELETE FROM leases WHERE key = ? AND owner = ?', (key, self.owner))
+
+    def _put(self, conn, key, value, ttl, now):
+        try:
+            text = _dumps(value)
+        except (TypeError, ValueError) as e:
+            print(f'[CACHE] 공유 캐시 저장 생략 ❌: {e}')
+            return
+        conn.execute(
+            'INSERT OR REPLACE INTO entries (key, value, expires) VALUES (?, ?, ?)',
+            (key, text, now + ttl),
+        )
+        conn.execute('DELETE FROM entries WHERE expires <= ?', (now,))
+
+    def get_or_compute(self, key, ttl, compute, should_cache):
+        conn = self._connection()
+        deadline = time.time() + self.lease_timeout
+
+        while True:
+            now = time.time()
+            hit, value = self._get(conn, key, now)
+            if hit:
+                return value
+
+            if self._acquire_lease(conn, key, now):
+                try:
+                    # 임대를 얻는 사이 다른 프로세스가 채웠을 수 있음
+                    hit, value = self._get(conn, key, time.time())
+                    if hit:
+                        return value
+
+                    value = compute()
+                    if should_cache(value):
+                        self._put(conn, key, value, ttl, time.time())
+                    return value
+                finally:
+                    self._release_lease(conn, key)
+
+            # 다른 프로세스가 계산 중 -> 결과를 기다리되, 너무 오래 걸리면 직접 계산
+            if now >= deadline:
+                return compute()
+            time.sleep(self.poll_interval)
+
+    def clear(self):
+        conn = self._connection()
+        conn.execute('DELETE FROM entries')
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_shared_backend():
+    """설정된 공유 캐시 백엔드 반환 (sqlite 초기화 실패 시 memory로 대체)"""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                if SHARED_CACHE_BACKEND == 'sqlite':
+                    try:
+                        _backend = SQLiteBackend()
+                    except (OSError, sqlite3.Error) as e:
+                        print(f'[CACHE] 공유 캐시 초기화 실패, 메모리 캐시 사용 ❌: {e}')
+                        _backend = MemoryBackend()
+                else:
+                    _backend = MemoryBackend()
+    return _backend
@@ -12,12 +12,11 @@ from io import BytesIO
 from pathlib import Path
 from urllib.parse import quote
 
-import pandas as pd
-import requests
-from PIL import Image
-
 from config import LOCATION_COORDS
 
+# pandas / requests / PIL은 실제로 쓰는 함수 안에서 import 합니다.
+# (차량 비교 페이지처럼 image_html만 쓰는 페이지가 콜드 스타트 비용을 내지 않도록)
+
 def _optional_service_fn(module_path, fn_name):
     """
     서비스 레이어 함수가 있으면 가져오고, 없으면 None을 반환합니다.
@@ -29,14 +28,34 @@ def _optional_service_fn(module_path, fn_name):
         return None
 
 
+def _call_service(module_path, fn_name, default):
+    """
+    서비스 레이어 함수를 호출 시점에 가져와 실행하고, 없거나 실패하면 default를 반환합니다.
+    """
+    fn = _optional_service_fn(module_path, fn_name)
+    if not fn:
+        return default
+    try:
+        return fn() or default
+    except Exception:
+        return default
+
+
 # 서비스 레이어 조회 함수들(있으면 사용, 없으면 더미 데이터로 폴백)
-get_region_list = _optional_service_fn("src.services.region_service", "get_region_list")
-get_registration_count_list = _optional_service_fn(
-    "src.services.registration_service", "get_registration_count_list"
-)
-get_registration_trend = _optional_service_fn(
-    "src.services.registration_service", "get_registration_trend"
-)
+# 결과 캐시는 서비스 레이어(@cached)가 데이터 버전 기준으로 관리하고 실패([]) 결과는 캐시하지 않으므로 여기서는 캐시하지 않음
+def _region_rows():
+    # 예: [{"region": "서울", "charger_cnt": 4250}, ...]
+    return _call_service("src.services.region_service", "get_region_list", [])
+
+
+def _region_ev_ratio_rows():
+    # 예: [{"region": "서울", "total": 1000, "electric": 82, "ratio": 8.2}, ...]
+    return _call_service("src.services.registration_service", "get_region_ev_ratio", [])
+
+
+def _registration_trend_rows():
+    # 예: [{"year": "2017", "electric": 123, "combustion": 4567}, ...]
+    return _call_service("src.services.registration_service", "get_registration_trend", [])
 
 # ==============================================================================
 # 이미지 유틸
@@ -104,6 +123,8 @@ def fetch_image_bytes(image_ref, *, timeout=8):
 
     try:
         if _is_url(str(image_ref)):
+            import requests
+
             resp = requests.get(image_ref, timeout=timeout)
             resp.raise_for_status()
             return resp.content
@@ -122,6 +143,8 @@ def load_image_pil(image_ref, *, timeout=8):
     URL/로컬 경로에서 이미지를 로드하여 PIL Image로 반환합니다.
     실패 시 기본 SVG를 PIL로 변환할 수 없으므로, 빈 이미지(검정 배경)를 반환합니다.
     """
+    from PIL import Image
+
     if not image_ref:
         # Pillow는 SVG를 직접 열지 못하므로, 안전한 단색 폴백
         return Image.new("RGB", (800, 450), color=(10, 10, 10))
@@ -147,13 +170,10 @@ def get_paldo_charging_data():
     regions = ["서울", "경기", "인천", "강원", "충청", "전라", "경상", "제주"]
 
     # 서비스 레이어가 준비되면 DB에서 조회하고, 아니면 더미로 폴백
-    if get_region_list:
-        try:
-            db_rows = get_region_list()  # 예: [{"region": "서울", "charger_cnt": 4250}, ...]
-            charger_by_region = {r["region"]: r["charger_cnt"] for r in db_rows}
-            counts = [int(charger_by_region.get(r, 0)) for r in regions]
-        except Exception:
-            counts = [4250, 5820, 1120, 1540, 2180, 2420, 3650, 890]
+    db_rows = _region_rows()
+    if db_rows:
+        charger_by_region = {r["region"]: r["charger_cnt"] for r in db_rows}
+        counts = [int(charger_by_region.get(r, 0)) for r in regions]
     else:
         counts = [4250, 5820, 1120, 1540, 2180, 2420, 3650, 890]
 
@@ -164,6 +184,8 @@ def get_paldo_charging_data():
         "lat": [LOCATION_COORDS[r][1] for r in regions],
         "lon": [LOCATION_COORDS[r][0] for r in regions],
     }
+    import pandas as pd
+
     return pd.DataFrame(data)
 
 
@@ -174,32 +196,11 @@ def get_paldo_ratio_data():
     """
     regions = ["서울", "경기", "인천", "강원", "충청", "전라", "경상", "제주"]
 
-    # 서비스 레이어가 준비되면 최신 월 기준으로 비중을 계산하고, 아니면 더미로 폴백
-    if get_registration_count_list:
-        try:
-            # 예: [{"date": 202501, "fuel_type": "전기", "region": "서울", "cnt": 123}, ...]
-            rows = get_registration_count_list()
-            df = pd.DataFrame(rows)
-            if not df.empty and {"date", "fuel_type", "region", "cnt"}.issubset(df.columns):
-                latest = int(df["date"].max())
-                latest_df = df[df["date"] == latest].copy()
-
-                # 지역별 전체/전기 등록대수 집계
-                total_by_region = latest_df.groupby("region")["cnt"].sum()
-                electric_by_region = latest_df[latest_df["fuel_type"] == "전기"].groupby("region")["cnt"].sum()
-
-                # 비중(%) 계산
-                ratios = []
-                for r in regions:
-                    total = float(total_by_region.get(r, 0))
-                    elec = float(electric_by_region.get(r, 0))
-                    ratio = (elec / total * 100.0) if total > 0 else 0.0
-                    ratios.append(round(ratio, 1))
-                counts = ratios
-            else:
-                counts = [8.2, 6.5, 7.8, 3.1, 4.8, 4.1, 5.2, 12.5]
-        except Exception:
-            counts = [8.2, 6.5, 7.8, 3.1, 4.8, 4.1, 5.2, 12.5]
+    # 서비스 레이어가 준비되면 최신 월 기준 비중(DB 집계)을 사용하고, 아니면 더미로 폴백
+    rows = _region_ev_ratio_rows()
+    if rows:
+        ratio_by_region = {r["region"]: r["ratio"] for r in rows}
+        counts = [float(ratio_by_region.get(r, 0.0)) for r in regions]
     else:
         counts = [8.2, 6.5, 7.8, 3.1, 4.8, 4.1, 5.2, 12.5]
 
@@ -210,14 +211,15 @@ def get_paldo_ratio_data():
         "lat": [LOCATION_COORDS[r][1] for r in regions],
         "lon": [LOCATION_COORDS[r][0] for r in regions],
     }
+    import pandas as pd
+
     return pd.DataFrame(data)
 
 # ==============================================================================
 # 통계/현황(차트) 데이터
 # ==============================================================================
 
-_trend_data = get_registration_trend() if get_registration_trend else []
-REGISTRATION_TREND_DATA = _trend_data if _trend_data else [
+_DUMMY_REGISTRATION_TREND_DATA = [
     {"year": "2019", "electric": 1200, "combustion": 45000},
     {"year": "2020", "electric": 2800, "combustion": 43500},
     {"year": "2021", "electric": 5400, "combustion": 41200},
@@ -226,6 +228,14 @@ REGISTRATION_TREND_DATA = _trend_data if _trend_data else [
     {"year": "2024", "electric": 32000, "combustion": 31500},
 ]
 
+
+def get_registration_trend_data():
+    """
+    연도별 신규 등록 증가량(전기/내연) 리스트
+    DB 조회는 처음 렌더링할 때 하고, 결과는 서비스 레이어 캐시를 재사용합니다.
+    """
+    return _registration_trend_rows() or _DUMMY_REGISTRATION_TREND_DATA
+
 MAINTENANCE_COST_DATA = [
     {"category": "연료/충전", "electric": 180, "combustion": 720},
     {"category": "정비", "electric": 45, "combustion": 180},
@@ -0,0 +1,107 @@
+"""
+지도 geometry 자산 (data/geojson)
+src/scripts/build_geo_assets.py 가 만든 파일을 manifest.json 의 sha256으로 검증해 읽습니다.
+앱 실행 중에는 네트워크를 사용하지 않습니다.
+
+환경 변수
+    MAP_GEOMETRY_FORMAT: geojson(기본, GeoJSON 자산 그대로) | topojson(양자화 TopoJSON 자산을 복원,
+                         좌표 자릿수가 줄어 브라우저 전송량 감소)
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+GEOJSON_DIR = Path(__file__).parent.parent.parent / "data" / "geojson"
+GEOJSON_MANIFEST_FILE = GEOJSON_DIR / "manifest.json"
+
+# 자산 이름 -> 파일명
+GEO_ASSET_FILES = {
+    "outline": "korea_outline_simplified.json",
+    "provinces": "korea_provinces_boundaries_simplified.json",
+    "paldo": "korea_paldo_simplified.json",
+    "topology": "korea_geo.topo.json",  # outline/provinces/paldo 를 arc 공유 TopoJSON 하나로
+}
+TOPOLOGY_ASSET = "topology"
+
+MANIFEST_VERSION = 1
+
+
+def empty_geojson():
+    return {"type": "FeatureCollection", "features": []}
+
+
+def read_manifest(path=GEOJSON_MANIFEST_FILE):
+    """manifest 로드 (없거나 깨졌으면 빈 dict)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[GEOJSON] manifest 로드 실패 ❌: {e}")
+        return {}
+
+
+def read_geo_asset(name, manifest=None):
+    """
+    자산 1개 로드 (파일 1회 읽기 + sha256 검증)
+
+    Returns:
+        dict | None: GeoJSON, 파일이 없거나 체크섬이 다르면 None
+    """
+    manifest = read_manifest() if manifest is None else manifest
+    entry = manifest.get("assets", {}).get(name)
+    if not entry:
+        print(f"[GEOJSON] manifest에 {name} 자산 없음 ❌ (python -m src.scripts.build_geo_assets)")
+        return None
+
+    try:
+        raw = (GEOJSON_DIR / entry["file"]).read_bytes()
+    except OSError as e:
+        print(f"[GEOJSON] {name} 자산 읽기 실패 ❌: {e}")
+        return None
+
+    if hashlib.sha256(raw).hexdigest() != entry.get("sha256"):
+        print(f"[GEOJSON] {name} 자산 체크섬 불일치 ❌ (python -m src.scripts.build_geo_assets)")
+        return None
+
+    return json.loads(raw)
+
+
+def asset_checksum(name, manifest=None):
+    """manifest에 기록된 자산 sha256 (없으면 빈 문자열)"""
+    manifest = read_manifest() if manifest is None else manifest
+    return manifest.get("assets", {}).get(name, {}).get("sha256", "")
+
+
+def geometry_format():
+    """MAP_GEOMETRY_FORMAT (호출 시점에 읽음 - .env 적재 전 import 되어도 반영)"""
+    return os.getenv("MAP_GEOMETRY_FORMAT", "geojson")
+
+
+def load_geometry(name, manifest=None, fmt=None):
+    """
+    지도용 GeoJSON 로드 (fmt가 topojson이면 TopoJSON 자산에서 복원, 실패 시 GeoJSON 자산)
+
+    Args:
+        fmt: geojson | topojson (None이면 MAP_GEOMETRY_FORMAT)
+
+    Returns:
+        dict | None
+    """
+    fmt = fmt or geometry_format()
+    manifest = read_manifest() if manifest is None else manifest
+    if fmt == "topojson":
+        topology = read_geo_asset(TOPOLOGY_ASSET, manifest)
+        if topology and name in topology.get("objects", {}):
+            from src.utils.geometry import topology_decode
+
+            return topology_decode(topology, name)
+        print(f"[GEOJSON] TopoJSON 자산에 {name} 없음, GeoJSON 자산 사용 ❌")
+    return read_geo_asset(name, manifest)
+
+
+def geometry_checksum(name, manifest=None, fmt=None):
+    """load_geometry가 실제로 읽는 자산의 형식 + 체크섬 (지도 템플릿 캐시 키용)"""
+    fmt = fmt or geometry_format()
+    asset = TOPOLOGY_ASSET if fmt == "topojson" else name
+    return f"{fmt}:{asset_checksum(asset, manifest)}"
@@ -0,0 +1,807 @@
+"""
+지도 geometry 유틸
+GeoJSON(Polygon/MultiPolygon) 격자 정렬, 경계 단순화, 그룹별 합치기(dissolve), TopoJSON 인코딩
+
+- 원본에서 따로 샘플링된 이웃 경계는 공통 격자에 래스터화해 같은 꼭짓점을 공유하게 맞춤
+- 인접한 시도가 공유하는 경계는 arc(접점 사이 선분열) 단위로 한 번만 단순화해
+  단순화 후에도 경계가 어긋나거나 틈이 생기지 않음
+- 단순화는 NumPy로 벡터화한 Douglas–Peucker
+"""
+import math
+
+import numpy as np
+
+# 같은 점으로 볼 좌표 격자 크기(도) - 원본 shapefile의 부동소수 오차 흡수
+SNAP = 1e-7
+
+
+def douglas_peucker(points, tolerance):
+    """
+    Douglas–Peucker 선 단순화
+
+    Args:
+        points: (N, 2) ndarray
+        tolerance: 허용 오차 (points와 같은 단위)
+
+    Returns:
+        ndarray: 시작/끝 점을 포함해 남긴 점들 (원래 순서)
+    """
+    n = len(points)
+    if n < 3:
+        return points
+
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end <= start + 1:
+            continue
+
+        a = points[start]
+        seg = points[start + 1:end] - a
+        dx, dy = points[end] - a
+        length = math.hypot(dx, dy)
+
+        if length == 0.0:
+            # 닫힌 arc(시작점 == 끝점)는 시작점과의 거리 기준
+            dist = np.hypot(seg[:, 0], seg[:, 1])
+        else:
+            dist = np.abs(dx * seg[:, 1] - dy * seg[:, 0]) / length
+
+        idx = int(np.argmax(dist))
+        if dist[idx] > tolerance:
+            split = start + 1 + idx
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+
+    return points[keep]
+
+
+def _polygons(geometry):
+    geom_type = geometry.get('type')
+    coords = geometry.get('coordinates') or []
+    if geom_type == 'Polygon':
+        return [coords]
+    if geom_type == 'MultiPolygon':
+        return coords
+    return []
+
+
+def _open_ring(ring):
+    # 닫힌 링의 마지막 중복 점 제거
+    if len(ring) > 1 and ring[0][:2] == ring[-1][:2]:
+        return ring[:-1]
+    return ring
+
+
+def _key(pt):
+    return (round(pt[0] / SNAP), round(pt[1] / SNAP))
+
+
+def _ring_area(ring):
+    # 신발끈 공식 (도^2, 부호 없음)
+    xs = ring[:, 0]
+    ys = ring[:, 1]
+    return abs(float(np.dot(xs, np.roll(ys, -1)) - np.dot(ys, np.roll(xs, -1)))) / 2.0
+
+
+class _Topology:
+    """링들을 접점(junction)에서 잘라 중복 없는 arc 목록으로 변환"""
+
+    def __init__(self, rings):
+        self.rings = rings           # [[key, ...], ...] (열린 링)
+        self.coords = {}             # key -> (lon, lat)
+        self.arcs = []               # [[key, ...], ...]
+        self._arc_index = {}         # 정규화된 arc -> arc id
+
+    @classmethod
+    def build(cls, raw_rings):
+        keyed = []
+        topo = cls(keyed)
+        for ring in raw_rings:
+            keys = []
+            for pt in _open_ring(ring):
+                k = _key(pt)
+                topo.coords.setdefault(k, (pt[0], pt[1]))
+                if not keys or keys[-1] != k:
+                    keys.append(k)
+            if len(keys) > 1 and keys[0] == keys[-1]:
+                keys.pop()
+            keyed.append(keys)
+
+        # 이웃 점이 2개를 넘는 점 = 여러 링의 경계가 갈라지는 접점
+        neighbors = {}
+        for keys in keyed:
+            n = len(keys)
+            for i, k in enumerate(keys):
+                entry = neighbors.setdefault(k, set())
+                entry.add(keys[i - 1])
+                entry.add(keys[(i + 1) % n])
+        topo.junctions = {k for k, nbrs in neighbors.items() if len(nbrs) > 2}
+        return topo
+
+    def _register(self, arc):
+        """arc 등록 (같은 점열/역순은 같은 arc) -> (arc id, 역방향 여부)"""
+        if arc[0] == arc[-1]:
+            # 접점 없는 닫힌 링: 시작점/방향을 정규화
+            body = arc[:-1]
+            start = body.index(min(body))
+            forward = body[start:] + body[:start]
+            backward = [forward[0]] + forward[1:][::-1]
+            canon = min(tuple(forward), tuple(backward)) + (forward[0],)
+            reversed_ = tuple(forward) + (forward[0],) != canon
+        else:
+            canon = min(tuple(arc), tuple(arc[::-1]))
+            reversed_ = tuple(arc) != canon
+
+        arc_id = self._arc_index.get(canon)
+        if arc_id is None:
+            arc_id = len(self.arcs)
+            self._arc_index[canon] = arc_id
+            self.arcs.append(list(canon))
+        return arc_id, reversed_
+
+    def split(self):
+        """링별 (arc id, 역방향 여부) 목록"""
+        ring_arcs = []
+        for keys in self.rings:
+            if len(keys) < 3:
+                ring_arcs.append([])
+                continue
+
+            cuts = [i for i, k in enumerate(keys) if k in self.junctions]
+            if not cuts:
+                ring_arcs.append([self._register(keys + [keys[0]])])
+                continue
+
+            # 첫 접점에서 시작하도록 회전 후 접점마다 자르기
+            rotated = keys[cuts[0]:] + keys[:cuts[0]]
+            rotated.append(rotated[0])
+            pieces = []
+            current = [rotated[0]]
+            for k in rotated[1:]:
+                current.append(k)
+                if k in self.junctions:
+                    pieces.append(self._register(current))
+                    current = [k]
+            ring_arcs.append(pieces)
+        return ring_arcs
+
+
+def _shift(mask, dy, dx):
+    """배열을 (dy, dx) 만큼 평행 이동 (빈 자리는 0)"""
+    out = np.zeros_like(mask)
+    h, w = mask.shape
+    target = (slice(max(dy, 0), h + min(dy, 0)), slice(max(dx, 0), w + min(dx, 0)))
+    source = (slice(max(-dy, 0), h + min(-dy, 0)), slice(max(-dx, 0), w + min(-dx, 0)))
+    out[target] = mask[source]
+    return out
+
+
+def _dilate(mask, radius):
+    # 정사각형 커널 팽창 (가로/세로 분리)
+    for axis_shift in ((0, 1), (1, 0)):
+        grown = mask.copy()
+        for step in range(1, radius + 1):
+            dy, dx = axis_shift[0] * step, axis_shift[1] * step
+            grown |= _shift(mask, dy, dx) | _shift(mask, -dy, -dx)
+        mask = grown
+    return mask
+
+
+def _flood(free, seed):
+    """seed 에서 free 셀을 따라 4방향으로 닿는 영역 (행/열 단위 연속 구간을 한 번에 전파)"""
+    reached = seed & free
+    while True:
+        before = np.count_nonzero(reached)
+        for grid_free, grid_reached in ((free, reached), (free.T, reached.T)):
+            flat_free = grid_free.ravel()
+            starts = flat_free.copy()
+            starts[1:] &= ~flat_free[:-1]
+            starts[::grid_free.shape[1]] = flat_free[::grid_free.shape[1]]  # 행마다 새 구간
+            run = np.cumsum(starts)
+            hit = np.zeros(run[-1] + 1, dtype=bool)
+            hit[run[grid_reached.ravel()]] = True
+            grid_reached[...] = (flat_free & hit[run]).reshape(grid_free.shape)
+        if np.count_nonzero(reached) == before:
+            return reached
+
+
+def _fill_rows(labels, label, rings, x0, y0, cell):
+    """even-odd 규칙으로 링 내부 셀(셀 중심 기준)을 label로 채움"""
+    edges = np.concatenate([
+        np.column_stack([ring[:-1], ring[1:]]) for ring in rings if len(ring) >= 4
+    ])
+    x1, y1, x2, y2 = edges.T
+    row_lo = max(int(math.floor((edges[:, [1, 3]].min() - y0) / cell - 0.5)), 0)
+    row_hi = min(int(math.ceil((edges[:, [1, 3]].max() - y0) / cell - 0.5)), labels.shape[0] - 1)
+    for row in range(row_lo, row_hi + 1):
+        y = y0 + (row + 0.5) * cell
+        crosses = (y1 > y) != (y2 > y)
+        if not crosses.any():
+            continue
+        xs = np.sort(
+            x1[crosses] + (y - y1[crosses]) * (x2[crosses] - x1[crosses]) / (y2[crosses] - y1[crosses])
+        )
+        cols = np.ceil((xs - x0) / cell - 0.5).astype(int)
+        for start, stop in zip(cols[0::2], cols[1::2]):
+            labels[row, start:stop] = label
+
+
+def _trace_label(labels, label, junction, x0, y0, cell):
+    """label 셀 영역의 경계를 닫힌 링 목록으로 (내부가 왼쪽, 꺾이는 점과 접점만 꼭짓점으로 남김)"""
+    inside = labels == label
+    # 셀 (r, c)의 아래/오른쪽/위/왼쪽 변 중 이웃이 다른 변 -> 방향 있는 변 (동/북/서/남)
+    sides = (
+        (inside & ~_shift(inside, 1, 0), (0, 0), 0),
+        (inside & ~_shift(inside, 0, -1), (0, 1), 1),
+        (inside & ~_shift(inside, -1, 0), (1, 1), 2),
+        (inside & ~_shift(inside, 0, 1), (1, 0), 3),
+    )
+    steps = ((0, 1), (1, 0), (0, -1), (-1, 0))  # 방향별 (dr, dc) 꼭짓점 이동
+    outgoing = {}
+    for mask, (dr, dc), direction in sides:
+        rows, cols = np.nonzero(mask)
+        for r, c in zip((rows + dr).tolist(), (cols + dc).tolist()):
+            outgoing.setdefault((r, c), []).append(direction)
+
+    rings = []
+    while outgoing:
+        start = next(iter(outgoing))
+        vertex, direction = start, None
+        ring = []
+        while True:
+            options = outgoing.get(vertex)
+            if not options:
+                break
+            # 한 꼭짓점에서 나가는 변이 둘이면(대각선으로 닿은 셀) 왼쪽 회전 우선
+            if direction is None or len(options) == 1:
+                chosen = options[0]
+            else:
+                chosen = next(
+                    (d for d in ((direction + 1) % 4, direction, (direction + 3) % 4) if d in options),
+                    options[0],
+                )
+            options.remove(chosen)
+            if not options:
+                del outgoing[vertex]
+            if chosen != direction or junction[vertex]:
+                ring.append(vertex)
+            direction = chosen
+            dr, dc = steps[chosen]
+            vertex = (vertex[0] + dr, vertex[1] + dc)
+        if len(ring) >= 3:
+            ring.append(ring[0])
+            rings.append(np.array([(x0 + c * cell, y0 + r * cell) for r, c in ring], dtype=float))
+    return rings
+
+
+def snap_to_grid(geojson, cell, gap_cells=3):
+    """
+    도형들을 공통 격자(cell 도)에 래스터화한 뒤 셀 경계를 링으로 다시 추적
+    - 따로 샘플링된 이웃 경계도 같은 격자 꼭짓점을 공유하게 되어 dissolve 후 내부 경계가 남지 않음
+    - 이웃 사이 좁은 틈(gap_cells 셀 이하)은 가장 가까운 도형에 배정, 겹친 곳은 뒤 도형 기준
+
+    Returns:
+        dict: FeatureCollection (properties 유지, 셀 경계 좌표)
+    """
+    features = [f for f in geojson.get('features', []) if _polygons(f.get('geometry') or {})]
+    feature_rings = [
+        [np.asarray(ring, dtype=float)[:, :2] for polygon in _polygons(f['geometry']) for ring in polygon]
+        for f in features
+    ]
+    points = np.concatenate([ring for rings in feature_rings for ring in rings])
+    pad = (gap_cells + 2) * cell
+    x0, y0 = points.min(axis=0) - pad
+    width, height = ((points.max(axis=0) + pad - (x0, y0)) / cell).astype(int) + 1
+
+    labels = np.zeros((height, width), dtype=np.int16)
+    for label, rings in enumerate(feature_rings, start=1):
+        _fill_rows(labels, label, rings, x0, y0, cell)
+
+    # 닫힘(팽창 후 침식)으로 메워지는 빈 셀 = 이웃 도형 사이 틈 -> 가까운 도형으로 채움
+    land = labels > 0
+    gaps = ~_dilate(~_dilate(land, gap_cells), gap_cells) & ~land
+    # 틈을 메운 뒤 바다와 이어지지 않는 빈 셀 (이웃 경계가 크게 어긋나 생긴 틈)
+    border = np.zeros_like(land)
+    border[[0, -1], :] = border[:, [0, -1]] = True
+    sea = ~(land | gaps)
+    gaps |= sea & ~_flood(sea, border)
+    neighbours = ((1, 0), (-1, 0), (0, 1), (0, -1))
+    while gaps.any():
+        grown = False
+        for dy, dx in neighbours:
+            source = _shift(labels, dy, dx)
+            take = gaps & (source > 0)
+            if take.any():
+                labels[take] = source[take]
+                gaps &= ~take
+                grown = True
+        if not grown:
+            break
+
+    # 둘러싼 4셀 값이 3종류 이상인 꼭짓점 = 경계가 갈라지는 접점 (직선 구간이어도 유지)
+    padded = np.pad(labels, 1)
+    corners = np.stack([padded[:-1, :-1], padded[:-1, 1:], padded[1:, :-1], padded[1:, 1:]])
+    distinct = 1 + sum(
+        np.all(corners[i][None] != corners[:i], axis=0) for i in range(1, 4)
+    )
+    junction = distinct > 2
+
+    out_features = []
+    for label, feature in enumerate(features, start=1):
+        outers, holes = [], []
+        for ring in _trace_label(labels, label, junction, x0, y0, cell):
+            area = _signed_area(ring[:-1])
+            (outers if area > 0 else holes).append((abs(area), ring))
+        if not outers:
+            continue
+
+        outers.sort(key=lambda item: item[0])
+        polygons = [[coords] for _, coords in outers]
+        for _, hole in holes:
+            point = _interior_point(hole[:-1])
+            for idx, (_, outer) in enumerate(outers):
+                if point is not None and _contains(outer[:-1], point):
+                    polygons[idx].append(hole)
+                    break
+
+        coordinates = [
+            [[[round(x, 6), round(y, 6)] for x, y in ring.tolist()] for ring in polygon]
+            for polygon in polygons
+        ]
+        out_features.append({
+            'type': 'Feature',
+            'properties': dict(feature.get('properties') or {}),
+            'geometry': (
+                {'type': 'Polygon', 'coordinates': coordinates[0]}
+                if len(coordinates) == 1
+                else {'type': 'MultiPolygon', 'coordinates': coordinates}
+            ),
+        })
+
+    return {'type': geojson.get('type', 'FeatureCollection'), 'features': out_features}
+
+
+def simplify_geojson(geojson, tolerance, min_area=0.0):
+    """
+    경계를 공유하는 도형들을 함께 단순화 (공유 경계는 한 번만 단순화)
+
+    Args:
+        geojson: FeatureCollection (Polygon/MultiPolygon)
+        tolerance: 허용 오차(도, 위도 기준 - 경도는 위도에 따른 축척 보정)
+        min_area: 이 면적(도^2)보다 작은 링은 제거 (작은 섬 등)
+
+    Returns:
+        dict: 단순화된 FeatureCollection (properties 유지)
+    """
+    features = geojson.get('features', [])
+
+    raw_rings = []
+    for feature in features:
+        for polygon in _polygons(feature.get('geometry') or {}):
+            raw_rings.extend(polygon)
+
+    topo = _Topology.build(raw_rings)
+    ring_arcs = topo.split()
+
+    # 경도 1도가 위도 1도보다 짧으므로 평균 위도 기준으로 축척 보정 후 단순화
+    lats = [lat for _, lat in topo.coords.values()]
+    x_scale = math.cos(math.radians(sum(lats) / len(lats))) if lats else 1.0
+
+    simplified_arcs = []
+    for arc in topo.arcs:
+        pts = np.array([topo.coords[k] for k in arc], dtype=float)
+        scaled = pts * (x_scale, 1.0)
+        kept = douglas_peucker(scaled, tolerance)
+        simplified_arcs.append(kept / (x_scale, 1.0))
+
+    # 링 재조립
+    ring_iter = iter(ring_arcs)
+    out_features = []
+    for feature in features:
+        out_polygons = []
+        for polygon in _polygons(feature.get('geometry') or {}):
+            out_rings = []
+            for ring_idx in range(len(polygon)):
+                parts = next(ring_iter)
+                coords = []
+                for arc_id, reversed_ in parts:
+                    arc = simplified_arcs[arc_id]
+                    arc = arc[::-1] if reversed_ else arc
+                    coords.extend(arc[1:] if coords else arc)
+
+                ring = np.array(coords) if coords else np.empty((0, 2))
+                # 닫힌 링 최소 4점 (삼각형 + 닫는 점), 외곽 링이 사라지면 폴리곤 제거
+                if len(ring) < 4 or (min_area and _ring_area(ring) < min_area):
+                    if ring_idx == 0:
+                        out_rings = []
+                        # 남은 내부 링 건너뛰기
+                        for _ in range(len(polygon) - 1):
+                            next(ring_iter)
+                        break
+                    continue
+                out_rings.append([[round(x, 6), round(y, 6)] for x, y in ring.tolist()])
+
+            if out_rings:
+                out_polygons.append(out_rings)
+
+        if not out_polygons:
+            continue
+
+        geometry = (
+            {'type': 'Polygon', 'coordinates': out_polygons[0]}
+            if len(out_polygons) == 1
+            else {'type': 'MultiPolygon', 'coordinates': out_polygons}
+        )
+        out_features.append({
+            'type': 'Feature',
+            'properties': dict(feature.get('properties') or {}),
+            'geometry': geometry,
+        })
+
+    return {'type': geojson.get('type', 'FeatureCollection'), 'features': out_features}
+
+
+def count_vertices(geojson):
+    """GeoJSON 전체 좌표 수"""
+    return sum(
+        len(ring)
+        for feature in geojson.get('features', [])
+        for polygon in _polygons(feature.get('geometry') or {})
+        for ring in polygon
+    )
+
+
+def _signed_area(ring):
+    xs = ring[:, 0]
+    ys = ring[:, 1]
+    return float(np.dot(xs, np.roll(ys, -1)) - np.dot(ys, np.roll(xs, -1))) / 2.0
+
+
+def _contains(ring, point):
+    """점이 링 내부인지 (ray casting, 벡터화)"""
+    x, y = point
+    xs, ys = ring[:, 0], ring[:, 1]
+    xn, yn = np.roll(xs, -1), np.roll(ys, -1)
+    crosses = (ys > y) != (yn > y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_cross = xs + (y - ys) * (xn - xs) / (yn - ys)
+    return bool(np.count_nonzero(crosses & (x < x_cross)) % 2)
+
+
+def _interior_point(ring):
+    """
+    링 내부에 확실히 들어가는 점 (변 중점을 안쪽으로 살짝 민 점)
+    - 첫 꼭짓점은 바깥 링과 닿아 있을 수 있어 포함 판정에 쓰지 않음
+    """
+    sign = 1.0 if _signed_area(ring) > 0 else -1.0
+    starts, ends = ring, np.roll(ring, -1, axis=0)
+    deltas = ends - starts
+    lengths = np.hypot(deltas[:, 0], deltas[:, 1])
+    # 긴 변부터 시도 (짧은 변은 이웃 변과 가까워 밀어낸 점이 밖으로 나가기 쉬움)
+    for idx in np.argsort(-lengths)[:8]:
+        length = lengths[idx]
+        if length == 0:
+            continue
+        mid = (starts[idx] + ends[idx]) / 2.0
+        normal = sign * np.array([-deltas[idx, 1], deltas[idx, 0]]) / length
+        for eps in (length * 1e-2, length * 1e-4):
+            point = mid + normal * eps
+            if _contains(ring, point):
+                return point
+    return None
+
+
+def _chain_rings(edges):
+    """방향 있는 arc(키 목록)들을 끝점끼리 이어 닫힌 링으로 조립"""
+    by_start = {}
+    for idx, edge in enumerate(edges):
+        by_start.setdefault(edge[0], []).append(idx)
+
+    used = set()
+    rings = []
+    for idx, edge in enumerate(edges):
+        if idx in used:
+            continue
+        used.add(idx)
+        ring = list(edge)
+        while ring[-1] != ring[0]:
+            candidates = [i for i in by_start.get(ring[-1], []) if i not in used]
+            if not candidates:
+                break
+            used.add(candidates[0])
+            ring.extend(edges[candidates[0]][1:])
+        if ring[-1] == ring[0] and len(ring) >= 4:
+            rings.append(ring)
+    return rings
+
+
+def dissolve_geojson(geojson, key):
+    """
+    그룹별로 도형 합치기 (그룹 내부에서 두 번 쓰인 공유 경계 arc 제거 후 남은 arc로 링 재조립)
+
+    Args:
+        geojson: FeatureCollection (인접 도형이 경계 좌표를 공유해야 내부 경계가 제거됨)
+        key: feature -> 그룹 이름 (None이면 제외)
+
+    Returns:
+        dict: 그룹별 feature (properties: name), 그룹 첫 등장 순서
+    """
+    features = geojson.get('features', [])
+
+    raw_rings = []
+    ring_groups = []
+    ring_is_outer = []
+    for feature in features:
+        group = key(feature)
+        for polygon in _polygons(feature.get('geometry') or {}):
+            for ring_idx, ring in enumerate(polygon):
+                raw_rings.append(ring)
+                ring_groups.append(group)
+                ring_is_outer.append(ring_idx == 0)
+
+    topo = _Topology.build(raw_rings)
+    ring_arcs = topo.split()
+
+    def to_array(keys):
+        return np.array([topo.coords[k] for k in keys], dtype=float)
+
+    # 입력 외곽 링의 회전 방향 (내부 경계 제거 후에도 외곽 링은 같은 방향 유지)
+    outer_sign = 1.0
+    signs = [
+        _signed_area(to_array(topo.rings[i] + topo.rings[i][:1]))
+        for i, outer in enumerate(ring_is_outer)
+        if outer and len(topo.rings[i]) >= 3
+    ]
+    if signs and sum(1 for s in signs if s < 0) > len(signs) / 2:
+        outer_sign = -1.0
+
+    groups = []
+    for group in ring_groups:
+        if group is not None and group not in groups:
+            groups.append(group)
+
+    out_features = []
+    for group in groups:
+        members = [i for i, g in enumerate(ring_groups) if g == group]
+
+        usage = {}
+        for i in members:
+            for arc_id, _ in ring_arcs[i]:
+                usage[arc_id] = usage.get(arc_id, 0) + 1
+
+        edges = []
+        for i in members:
+            for arc_id, reversed_ in ring_arcs[i]:
+                if usage[arc_id] > 1:
+                    continue  # 그룹 내부 경계
+                arc = topo.arcs[arc_id]
+                edges.append(arc[::-1] if reversed_ else arc)
+
+        outers, holes = [], []
+        for ring in _chain_rings(edges):
+            coords = to_array(ring)
+            area = _signed_area(coords)
+            (outers if area * outer_sign > 0 else holes).append((abs(area), coords))
+
+        # 구멍은 자신을 포함하는 가장 작은 외곽 링에 배정
+        outers.sort(key=lambda item: item[0])
+        polygons = [[coords] for _, coords in outers]
+        for _, hole in holes:
+            point = _interior_point(hole)
+            for idx, (_, outer) in enumerate(outers):
+                if point is not None and _contains(outer, point):
+                    polygons[idx].append(hole)
+                    break
+            else:
+                x, y = hole[0]
+                print(f'[GEOJSON] {group} 구멍({x:.4f}, {y:.4f})을 포함하는 외곽 링 없음 ❌')
+
+        if not polygons:
+            continue
+
+        coordinates = [
+            [[[round(x, 6), round(y, 6)] for x, y in ring.tolist()] for ring in polygon]
+            for polygon in polygons
+        ]
+        out_features.append({
+            'type': 'Feature',
+            'properties': {'name': group},
+            'geometry': (
+                {'type': 'Polygon', 'coordinates': coordinates[0]}
+                if len(coordinates) == 1
+                else {'type': 'MultiPolygon', 'coordinates': coordinates}
+            ),
+        })
+
+    return {'type': geojson.get('type', 'FeatureCollection'), 'features': out_features}
+
+
+def internal_edges(geometry, parts, eps=1e-4):
+    """
+    dissolve 결과에 남은 내부 경계 검사
+    - 경계 변의 중점을 도형 바깥쪽으로 eps(도)만큼 민 점이 합치기 전 도형(parts) 안에 들면 내부 경계
+
+    Returns:
+        list: 내부 경계로 남은 변의 중점 [(lon, lat), ...]
+    """
+    part_polygons = [
+        [np.asarray(_open_ring(ring), dtype=float) for ring in polygon]
+        for part in parts
+        for polygon in _polygons(part)
+        if polygon
+    ]
+
+    def covered(point):
+        # 외곽 링 안이면서 구멍 밖인 합치기 전 도형이 있는지
+        return any(
+            _contains(rings[0], point) and not any(_contains(hole, point) for hole in rings[1:])
+            for rings in part_polygons
+        )
+
+    found = []
+    for polygon in _polygons(geometry):
+        if not polygon:
+            continue
+        # 채워진 쪽이 변의 왼쪽인지 (외곽 링 회전 방향 기준)
+        fill_sign = 1.0 if _signed_area(np.asarray(_open_ring(polygon[0]), dtype=float)) > 0 else -1.0
+        for ring in polygon:
+            pts = np.asarray(ring, dtype=float)
+            deltas = pts[1:] - pts[:-1]
+            lengths = np.hypot(deltas[:, 0], deltas[:, 1])
+            for start, delta, length in zip(pts[:-1], deltas, lengths):
+                if length == 0:
+                    continue
+                mid = start + delta / 2.0
+                outward = fill_sign * np.array([delta[1], -delta[0]]) / length
+                if covered(mid + outward * eps):
+                    found.append((float(mid[0]), float(mid[1])))
+    return found
+
+
+def geometry_centroid(geometry):
+    """
+    면적 가중 중심점 (여러 폴리곤은 면적 비율로 가중, 구멍은 면적에서 제외)
+
+    Returns:
+        (lon, lat) | None
+    """
+    total_area = 0.0
+    cx = cy = 0.0
+    for polygon in _polygons(geometry):
+        for ring_idx, ring in enumerate(polygon):
+            pts = np.asarray(_open_ring(ring), dtype=float)
+            if len(pts) < 3:
+                continue
+            xs, ys = pts[:, 0], pts[:, 1]
+            xn, yn = np.roll(xs, -1), np.roll(ys, -1)
+            cross = xs * yn - xn * ys
+            area = cross.sum() / 2.0
+            if area == 0.0:
+                continue
+            ring_cx = ((xs + xn) * cross).sum() / (6.0 * area)
+            ring_cy = ((ys + yn) * cross).sum() / (6.0 * area)
+            # 외곽 링은 더하고 구멍은 빼기 (회전 방향과 무관하게 절댓값 기준)
+            weight = abs(area) if ring_idx == 0 else -abs(area)
+            total_area += weight
+            cx += ring_cx * weight
+            cy += ring_cy * weight
+
+    if total_area <= 0.0:
+        return None
+    return float(cx / total_area), float(cy / total_area)
+
+
+def topology_encode(collections, quantization=100_000):
+    """
+    GeoJSON 여러 개를 TopoJSON 하나로 인코딩 (공유 경계 arc는 한 번만 저장)
+    - 좌표는 quantization 격자 정수로 양자화 후 arc마다 첫 점 이후 델타 인코딩
+
+    Args:
+        collections: {객체 이름: FeatureCollection}
+        quantization: 축별 격자 수 (100,000 이면 한반도 범위에서 약 10m 해상도)
+
+    Returns:
+        dict: TopoJSON Topology
+    """
+    raw_rings = []
+    for geojson in collections.values():
+        for feature in geojson.get('features', []):
+            for polygon in _polygons(feature.get('geometry') or {}):
+                raw_rings.extend(polygon)
+
+    topo = _Topology.build(raw_rings)
+    ring_arcs = topo.split()
+
+    coords = np.array(list(topo.coords.values()), dtype=float) if topo.coords else np.zeros((1, 2))
+    x0, y0 = coords.min(axis=0)
+    x1, y1 = coords.max(axis=0)
+    kx = (x1 - x0) / (quantization - 1) or 1.0
+    ky = (y1 - y0) / (quantization - 1) or 1.0
+
+    arcs = []
+    for arc in topo.arcs:
+        pts = np.array([topo.coords[k] for k in arc], dtype=float)
+        q = np.rint((pts - (x0, y0)) / (kx, ky)).astype(np.int64)
+        # 양자화 후 같은 점이 된 연속 좌표 제거 (시작/끝 점은 유지)
+        keep = np.ones(len(q), dtype=bool)
+        keep[1:] = np.any(q[1:] != q[:-1], axis=1)
+        keep[-1] = True
+        q = q[keep]
+        deltas = np.vstack([q[:1], np.diff(q, axis=0)])
+        arcs.append(deltas.tolist())
+
+    def arc_refs(arc_list):
+        return [~arc_id if reversed_ else arc_id for arc_id, reversed_ in arc_list]
+
+    ring_iter = iter(ring_arcs)
+    objects = {}
+    for name, geojson in collections.items():
+        geometries = []
+        for feature in geojson.get('features', []):
+            geometry = feature.get('geometry') or {}
+            polygons = [
+                [arc_refs(next(ring_iter)) for _ in polygon]
+                for polygon in _polygons(geometry)
+            ]
+            polygons = [[ring for ring in polygon if ring] for polygon in polygons]
+            polygons = [polygon for polygon in polygons if polygon]
+            geometries.append({
+                'type': 'MultiPolygon' if geometry.get('type') == 'MultiPolygon' else 'Polygon',
+                'arcs': polygons if geometry.get('type') == 'MultiPolygon' else (polygons[0] if polygons else []),
+                'properties': dict(feature.get('properties') or {}),
+            })
+        objects[name] = {'type': 'GeometryCollection', 'geometries': geometries}
+
+    return {
+        'type': 'Topology',
+        'transform': {'scale': [float(kx), float(ky)], 'translate': [float(x0), float(y0)]},
+        'objects': objects,
+        'arcs': arcs,
+    }
+
+
+def topology_decode(topology, name):
+    """
+    TopoJSON 객체 하나를 GeoJSON FeatureCollection으로 복원
+    - 좌표는 양자화 격자 크기에 맞춰 반올림 (불필요한 소수 자릿수 제거)
+    """
+    kx, ky = topology['transform']['scale']
+    x0, y0 = topology['transform']['translate']
+    decimals = max(0, int(math.ceil(-math.log10(min(kx, ky)))))
+
+    decoded = []
+    for arc in topology['arcs']:
+        pts = np.cumsum(np.asarray(arc, dtype=np.int64).reshape(-1, 2), axis=0) * (kx, ky) + (x0, y0)
+        decoded.append(np.round(pts, decimals).tolist())
+
+    def ring(refs):
+        coords = []
+        for ref in refs:
+            arc = decoded[~ref][::-1] if ref < 0 else decoded[ref]
+            coords.extend(arc[1:] if coords else arc)
+        return coords
+
+    def polygon(ring_refs):
+        # 양자화로 닫힌 링 최소 4점이 안 되는 링 제외, 외곽 링이 없으면 폴리곤 제외
+        rings = [ring(refs) for refs in ring_refs]
+        if not rings or len(rings[0]) < 4:
+            return []
+        return [r for r in rings if len(r) >= 4]
+
+    features = []
+    for geometry in topology['objects'][name]['geometries']:
+        if geometry['type'] == 'MultiPolygon':
+            coordinates = [p for p in (polygon(refs) for refs in geometry['arcs']) if p]
+        else:
+            coordinates = polygon(geometry['arcs'])
+        features.append({
+            'type': 'Feature',
+            'properties': geometry.get('properties', {}),
+            'geometry': {'type': geometry['type'], 'coordinates': coordinates},
+        })
+    return {'type': 'FeatureCollection', 'features': features}
@@ -0,0 +1,83 @@
+"""
+페이지 레지스트리
+pages/*.py 소스를 한 번만 컴파일해 코드 객체를 캐시하고, 리런마다 캐시된 코드를 실행합니다.
+
+- 운영 모드: 최초 1회만 컴파일
+- 개발 모드(APP_DEV_MODE=1): 파일 수정 시각이 바뀌면 다시 컴파일
+"""
+import os
+import threading
+import time
+from pathlib import Path
+
+import streamlit as st
+
+from src.utils import profiler
+
+DEV_MODE = os.getenv('APP_DEV_MODE', '0').lower() in ('1', 'true', 'yes')
+
+
+class PageRegistry:
+    def __init__(self, pages_dir, dev_mode=DEV_MODE):
+        self.pages_dir = Path(pages_dir)
+        self.dev_mode = dev_mode
+        self._pages = {}
+        self._compiled = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, filename, placeholder=None):
+        """
+        페이지 등록
+
+        Args:
+            name: 네비게이션에 표시되는 페이지 이름 (st.session_state.current_page 값)
+            filename: pages 폴더 기준 파일명
+            placeholder: 파일이 없을 때 보여줄 안내 문구
+        """
+        self._pages[name] = (self.pages_dir / filename, placeholder)
+
+    def _get_code(self, path):
+        """캐시된 코드 객체 반환 (개발 모드에서는 파일이 바뀌면 다시 컴파일)"""
+        with self._lock:
+            entry = self._compiled.get(path)
+            if entry and not self.dev_mode:
+                return entry[1]
+
+            mtime = path.stat().st_mtime_ns
+            if entry and entry[0] == mtime:
+                return entry[1]
+
+            source = path.read_text(encoding='utf-8')
+            code = compile(source, str(path), 'exec')
+            self._compiled[path] = (mtime, code)
+            return code
+
+    def render(self, name):
+        """등록된 페이지 실행 (페이지마다 새 네임스페이스, __file__은 실제 페이지 경로)"""
+        if name not in self._pages:
+            st.info(f'{name} 페이지를 찾을 수 없습니다.')
+            return
+
+        path, placeholder = self._pages[name]
+        if not path.exists():
+            st.info(placeholder or f'{name} 페이지를 준비 중입니다.')
+            return
+
+        namespace = {
+            '__name__': f'pages.{path.stem}',
+            '__file__': str(path),
+        }
+        started = time.perf_counter()
+        exec(self._get_code(path), namespace)
+        profiler.record_render(name, time.perf_counter() - started)
+
+
+_registries = {}
+
+
+def get_page_registry(pages_dir):
+    """pages 폴더별 레지스트리 (main.py가 리런마다 다시 실행되어도 같은 객체를 재사용)"""
+    key = str(Path(pages_dir).resolve())
+    if key not in _registries:
+        _registries[key] = PageRegistry(pages_dir)
+    return _registries[key]
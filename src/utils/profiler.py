@@ -0,0 +1,132 @@
+"""
+콜드 스타트 프로파일러
+APP_PROFILE=1 이면 모듈 import 시간과 페이지별 첫 렌더링 시간을 기록해 콘솔/화면에 출력합니다.
+
+- import 시간: sys.meta_path에 타이머를 등록해 모듈별 자체 시간(self)과 누적 시간(total) 측정
+- 렌더링 시간: PageRegistry.render()가 페이지별 첫 실행 시간을 기록
+"""
+import os
+import sys
+import threading
+import time
+
+ENABLED = os.getenv('APP_PROFILE', '0').lower() in ('1', 'true', 'yes')
+
+_lock = threading.Lock()
+_import_times = {}   # 모듈명 -> (self ms, total ms)
+_render_times = {}   # 페이지명 -> ms (첫 렌더링)
+_local = threading.local()
+
+
+def _stack():
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+    return _local.stack
+
+
+class _TimedLoader:
+    """원래 로더를 감싸 exec_module 시간을 측정 (모듈에는 원래 로더를 다시 지정)"""
+
+    def __init__(self, loader, name):
+        self._loader = loader
+        self._name = name
+
+    def create_module(self, spec):
+        create = getattr(self._loader, 'create_module', None)
+        return create(spec) if create else None
+
+    def exec_module(self, module):
+        module.__loader__ = self._loader
+        if getattr(module, '__spec__', None) is not None:
+            module.__spec__.loader = self._loader
+
+        stack = _stack()
+        stack.append([time.perf_counter(), 0.0])
+        try:
+            self._loader.exec_module(module)
+        finally:
+            started, children = stack.pop()
+            total = time.perf_counter() - started
+            if stack:
+                stack[-1][1] += total
+            with _lock:
+                _import_times[self._name] = ((total - children) * 1000, total * 1000)
+
+    def __getattr__(self, item):
+        return getattr(self._loader, item)
+
+
+class _ImportTimer:
+    """다른 finder가 찾은 spec의 로더를 _TimedLoader로 감싸는 meta path finder"""
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(_local, 'finding', False):
+            return None
+
+        _local.finding = True
+        try:
+            spec = None
+            for finder in sys.meta_path:
+                find = getattr(finder, 'find_spec', None)
+                if finder is self or find is None:
+                    continue
+                spec = find(fullname, path, target)
+                if spec is not None:
+                    break
+        finally:
+            _local.finding = False
+
+        if spec is None or spec.loader is None or not hasattr(spec.loader, 'exec_module'):
+            return spec
+
+        spec.loader = _TimedLoader(spec.loader, fullname)
+        return spec
+
+
+_timer = _ImportTimer()
+
+
+def install():
+    """import 타이머 등록 (APP_PROFILE이 꺼져 있으면 아무것도 하지 않음)"""
+    if ENABLED and _timer not in sys.meta_path:
+        sys.meta_path.insert(0, _timer)
+
+
+def record_render(page, elapsed):
+    """페이지 첫 렌더링 시간 기록 (초 단위 입력)"""
+    if not ENABLED:
+        return
+    with _lock:
+        first = page not in _render_times
+        if first:
+            _render_times[page] = elapsed * 1000
+    if first:
+        print(f'[PROFILE] {page} 첫 렌더링 {elapsed * 1000:.1f}ms')
+
+
+def import_report(top=20):
+    """누적 시간 기준 상위 모듈 목록 [(모듈, self ms, total ms), ...]"""
+    with _lock:
+        rows = [(name, self_ms, total_ms) for name, (self_ms, total_ms) in _import_times.items()]
+    rows.sort(key=lambda row: row[2], reverse=True)
+    return rows[:top]
+
+
+def render_report():
+    """프로파일 결과를 화면 하단 expander로 출력"""
+    if not ENABLED:
+        return
+
+    import streamlit as st
+
+    with st.expander('⏱️ 콜드 스타트 프로파일', expanded=False):
+        with _lock:
+            renders = dict(_render_times)
+        st.markdown('**페이지 첫 렌더링 (ms)**')
+        st.table([{'page': page, 'ms': round(ms, 1)} for page, ms in renders.items()])
+
+        st.markdown('**import 시간 상위 모듈 (ms)**')
+        st.table([
+            {'module': name, 'self': round(self_ms, 1), 'total': round(total_ms, 1)}
+            for name, self_ms, total_ms in import_report()
+        ])